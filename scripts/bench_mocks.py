@@ -0,0 +1,60 @@
+"""Measures how long the mocking checker takes on a test module with many mocks in one fixture.
+
+The generated module has a fixture with `--mocks` mocks made with `create_autospec()`, most of them with return
+values, side effects or assertions in the fixture or in nested blocks of it, and every fifth one without any usage.
+Building the module with astroid is timed apart from the checker, as it infers every attribute assignment:
+
+    python scripts/bench_mocks.py --mocks 5000
+"""
+
+import argparse
+import time
+
+import astroid  # type: ignore
+from pylint.testutils import UnittestLinter
+from pylint.utils import ASTWalker
+
+from databricks.labs.pylint.mocking import MockingChecker
+
+
+def test_module(mocks: int) -> str:
+    lines = ["from unittest.mock import create_autospec", "", "", "def fixture():"]
+    for i in range(mocks):
+        lines.append(f"    service_{i} = create_autospec(Service)")
+    for i in range(mocks):
+        if i % 5 == 0:
+            continue
+        if i % 5 == 1:
+            lines.append(f"    service_{i}.fetch.return_value = {i}")
+        elif i % 5 == 2:
+            lines.append(f"    service_{i}.fetch.side_effect = KeyError({i})")
+        else:
+            lines.append("    with context():")
+            lines.append(f"        service_{i}.fetch.assert_called_once_with({i})")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mocks", type=int, default=5000, help="number of mocks in the fixture")
+    args = parser.parse_args()
+    started = time.monotonic()
+    module = astroid.parse(test_module(args.mocks))
+    parsed = time.monotonic() - started
+    linter = UnittestLinter()
+    checker = MockingChecker(linter)
+    checker.open()
+    walker = ASTWalker(linter)
+    walker.add_checker(checker)
+    started = time.monotonic()
+    walker.walk(module)
+    checked = time.monotonic() - started
+    unused = len([m for m in linter.release_messages() if m.msg_id == "mock-no-usage"])
+    print(
+        f"{args.mocks} mocks: parsed in {parsed:.2f}s, checked in {checked:.2f}s, "
+        f"{unused} without usage (expected {(args.mocks + 4) // 5})"
+    )
+
+
+if __name__ == "__main__":
+    main()
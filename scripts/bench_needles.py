@@ -0,0 +1,80 @@
+"""Measures how the search for substrings of imports, calls and literals scales with the number of needles.
+
+The needles of `incompatible-with-uc` are padded with random identifier-like needles, as more of them come from the
+`uc-incompatible-needles` option or from custom rules. Every text is searched with one substring test per needle,
+as the checkers did before, with the automaton of `databricks.labs.pylint.rules`, and with `Automaton.find()`,
+that picks the faster of the two:
+
+    python scripts/bench_needles.py --needles 40,200,1000,5000
+"""
+
+import argparse
+import functools
+import random
+import string
+import timeit
+from typing import Callable, Dict, List
+
+from databricks.labs.pylint.rulebook import UC_INCOMPATIBLE_BRUTE_FORCE, Automaton
+
+TEXTS = {
+    "call": "spark.read.format('delta').load",
+    "import": "pyspark.sql.functions",
+    "sql": "SELECT id, name FROM hive_metastore.sales.orders WHERE created_at > '2024-01-01' ORDER BY id" * 10,
+}
+
+
+def needles(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    found = sorted(UC_INCOMPATIBLE_BRUTE_FORCE)
+    while len(found) < count:
+        found.append("".join(rng.choices(string.ascii_letters + "._", k=rng.randint(4, 24))))
+    return found[:count]
+
+
+def substrings(patterns: List[str], text: str) -> List[int]:
+    return [i for i, needle in enumerate(patterns) if needle in text]
+
+
+def microseconds(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1_000_000
+
+
+def run(counts: List[int], number: int, seed: int) -> List[Dict]:
+    rows = []
+    for count in counts:
+        patterns = needles(count, seed)
+        automaton = Automaton(patterns)
+        for name, text in TEXTS.items():
+            expected = substrings(patterns, text)
+            assert automaton.scan(text) == automaton.find(text) == expected, f"{name}: different needles found"
+            rows.append(
+                {
+                    "needles": count,
+                    "text": f"{name} ({len(text)} chars)",
+                    "substring_us": microseconds(functools.partial(substrings, patterns, text), number),
+                    "automaton_us": microseconds(functools.partial(automaton.scan, text), number),
+                    "find_us": microseconds(functools.partial(automaton.find, text), number),
+                }
+            )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--needles", default="40,200,1000,5000", help="comma-separated numbers of needles")
+    parser.add_argument("--number", type=int, default=1000, help="searches per measurement")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the random needles")
+    args = parser.parse_args()
+    rows = run([int(count) for count in args.needles.split(",")], args.number, args.seed)
+    columns = ["needles", "text", "substring_us", "automaton_us", "find_us"]
+    table = [columns]
+    for row in rows:
+        table.append([f"{row[c]:.1f}" if isinstance(row[c], float) else str(row[c]) for c in columns])
+    widths = [max(len(line[i]) for line in table) for i in range(len(columns))]
+    for line in table:
+        print("  ".join(cell.ljust(width) for cell, width in zip(line, widths)))
+
+
+if __name__ == "__main__":
+    main()
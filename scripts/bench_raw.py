@@ -0,0 +1,134 @@
+"""Measures how much the raw-file checkers read and allocate per file, on large notebooks.
+
+Notebooks are made of the cells of `tests/samples/m/many_cells.py`, with some commented out code in every cell,
+and linted with only the messages of raw-file checkers enabled. Bytes read come from `/proc/self/io`, so they are
+only reported on Linux, and allocations are the peak traced by `tracemalloc` while linting. Results are appended
+to a JSON lines file, so that runs on different commits can be compared with `--compare`:
+
+    python scripts/bench_raw.py --label baseline
+    python scripts/bench_raw.py --compare
+"""
+
+import argparse
+import datetime
+import json
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+
+ROOT = Path(__file__).parent.parent
+
+MESSAGES = ["notebooks-too-many-cells", "notebooks-percent-run", "dead-code"]
+
+
+def bytes_read() -> Optional[int]:
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            counters = dict(line.split(": ") for line in f.read().splitlines())
+        return int(counters["rchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def notebooks(directory: Path, count: int, repeat: int) -> List[Path]:
+    header, *cells = (ROOT / "tests" / "samples" / "m" / "many_cells.py").read_text().split("# COMMAND ----------\n")
+    # the sample disables dead-code for the whole file
+    header = header.replace(",dead-code", "")
+    cells = [cell + "# x = compute(1)\n" for cell in cells]
+    paths = []
+    for i in range(count):
+        path = directory / f"notebook_{i}.py"
+        path.write_text(header + "# COMMAND ----------\n".join(cells * repeat))
+        paths.append(path)
+    return paths
+
+
+def linter() -> PyLinter:
+    lint = PyLinter(reporter=CollectingReporter())
+    lint.load_default_plugins()
+    lint.load_plugin_modules(["databricks.labs.pylint.all"])
+    lint.set_option("persistent", False)
+    lint.disable("all")
+    for msg in MESSAGES:
+        lint.enable(msg)
+    return lint
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args: argparse.Namespace) -> Dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = notebooks(Path(tmp), args.notebooks + 1, args.repeat)
+        lint = linter()
+        # imports of the checkers and of their dependencies are not part of the measurement
+        lint.check([str(paths[0])])
+        size = sum(path.stat().st_size for path in paths[1:])
+        before = bytes_read()
+        tracemalloc.start()
+        started = time.monotonic()
+        lint.check([str(path) for path in paths[1:]])
+        elapsed = time.monotonic() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        after = bytes_read()
+    metrics = {
+        "file_kb": round(size / args.notebooks / 1024),
+        "read_kb_per_file": round((after - before) / args.notebooks / 1024) if before and after else None,
+        "peak_kb": round(peak / 1024),
+        "ms_per_file": round(elapsed / args.notebooks * 1000),
+        "messages": len(lint.reporter.messages),
+    }
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "label": args.label,
+        "commit": git_commit(),
+        "metrics": metrics,
+    }
+
+
+def compare(results: Path):
+    if not results.exists():
+        raise SystemExit(f"no benchmark results at {results}")
+    with results.open() as f:
+        runs = [json.loads(line) for line in f]
+    columns = ["timestamp", "commit", "label", *runs[-1]["metrics"]]
+    rows = [columns]
+    for result in runs:
+        rows.append([result["timestamp"], result["commit"], result["label"] or ""])
+        rows[-1].extend(str(result["metrics"].get(metric, "")) for metric in columns[3:])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--notebooks", type=int, default=10, help="number of notebooks to lint")
+    parser.add_argument("--repeat", type=int, default=20, help="copies of the sample cells in every notebook")
+    parser.add_argument("--label", help="name of the run to show in comparisons")
+    parser.add_argument("--results", type=Path, default=ROOT / ".benchmarks" / "raw.jsonl")
+    parser.add_argument("--compare", action="store_true", help="print stored runs side by side and exit")
+    args = parser.parse_args()
+    if args.compare:
+        compare(args.results)
+        return
+    result = run(args)
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    with args.results.open("a") as f:
+        f.write(json.dumps(result) + "\n")
+    print(json.dumps(result["metrics"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
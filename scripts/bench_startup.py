@@ -0,0 +1,124 @@
+"""Measures how long it takes to start linting with this plugin, as pre-commit hooks do on every commit.
+
+Every scenario runs in a fresh interpreter a few times, and the median wall time is reported together with
+the cumulative import time of the plugin, as reported by `python -X importtime`. Results are appended to a
+JSON lines file, so that runs on different commits can be compared with `--compare`:
+
+    python scripts/bench_startup.py --label baseline
+    python scripts/bench_startup.py --compare
+"""
+
+import argparse
+import datetime
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+
+SCENARIOS = {
+    "import_cli": ["-c", "import databricks.labs.pylint.cli"],
+    "import_plugin": ["-c", "import databricks.labs.pylint.all"],
+    "pylint_one_message": [
+        "-m",
+        "pylint",
+        "--load-plugins=databricks.labs.pylint.all",
+        "--disable=all",
+        "--enable=dbutils-fs-ls",
+        "--persistent=n",
+        "{file}",
+    ],
+    "pylint_all_messages": [
+        "-m",
+        "pylint",
+        "--load-plugins=databricks.labs.pylint.all",
+        "--persistent=n",
+        "{file}",
+    ],
+}
+
+
+def wall_time(args: List[str]) -> float:
+    started = time.monotonic()
+    subprocess.run([sys.executable, *args], check=False, capture_output=True)
+    return time.monotonic() - started
+
+
+def import_time(module: str) -> Optional[int]:
+    """Returns cumulative import time of a module in microseconds, or `None` if it failed to import."""
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    proc = subprocess.run(command, capture_output=True, text=True, check=False)
+    for line in reversed(proc.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    return None
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args: argparse.Namespace) -> Dict:
+    metrics: Dict[str, Optional[float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        file = Path(tmp) / "sample.py"
+        file.write_text("dbutils.fs.ls('/')\n")
+        for name, scenario in SCENARIOS.items():
+            scenario_args = [arg.replace("{file}", str(file)) for arg in scenario]
+            median = statistics.median(wall_time(scenario_args) for _ in range(args.repeat))
+            metrics[f"{name}_ms"] = round(median * 1000)
+    metrics["import_plugin_us"] = import_time("databricks.labs.pylint.all")
+    metrics["import_cli_us"] = import_time("databricks.labs.pylint.cli")
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "label": args.label,
+        "commit": git_commit(),
+        "metrics": metrics,
+    }
+
+
+def compare(results: Path):
+    if not results.exists():
+        raise SystemExit(f"no benchmark results at {results}")
+    with results.open() as f:
+        runs = [json.loads(line) for line in f]
+    columns = ["timestamp", "commit", "label", *runs[-1]["metrics"]]
+    rows = [columns]
+    for result in runs:
+        rows.append([result["timestamp"], result["commit"], result["label"] or ""])
+        rows[-1].extend(str(result["metrics"].get(metric, "")) for metric in columns[3:])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs of every scenario")
+    parser.add_argument("--label", help="name of the run to show in comparisons")
+    parser.add_argument("--results", type=Path, default=ROOT / ".benchmarks" / "startup.jsonl")
+    parser.add_argument("--compare", action="store_true", help="print stored runs side by side and exit")
+    args = parser.parse_args()
+    if args.compare:
+        compare(args.results)
+        return
+    result = run(args)
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    with args.results.open("a") as f:
+        f.write(json.dumps(result) + "\n")
+    print(json.dumps(result["metrics"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
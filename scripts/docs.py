@@ -1,6 +1,8 @@
+import json
 import re
 from pathlib import Path
 
+from pylint.checkers import BaseRawFileChecker
 from pylint.lint import PyLinter
 
 from databricks.labs.pylint.airflow import AirflowChecker
@@ -10,6 +12,7 @@ from databricks.labs.pylint.legacy import LegacyChecker
 from databricks.labs.pylint.mocking import MockingChecker
 from databricks.labs.pylint.notebooks import NotebookChecker
 from databricks.labs.pylint.readability import ReadabilityChecker
+from databricks.labs.pylint.rules import RulesChecker
 from databricks.labs.pylint.spark import SparkChecker
 
 
@@ -27,6 +30,7 @@ def do_something():
         ReadabilityChecker(linter),
         MockingChecker(linter),
         EradicateChecker(linter),
+        RulesChecker(linter),
     ]:
         out.append(f"## `{checker.name}` checker")
         out.append(
@@ -58,5 +62,62 @@ def do_something():
         f.write(new_readme)
 
 
+def _literal(value, indent: int = 0) -> str:
+    """Formats a literal so that `black` leaves it as it is: every collection is split into one item per line and
+    ends with a trailing comma, which `black` keeps, except for tuples of a single scalar, where the comma is not
+    a trailing one and `black` joins the lines. Long strings are not split, as `black` does not split them either.
+    """
+    pad = " " * (indent + 4)
+    if isinstance(value, dict):
+        items = [f"{pad}{_literal(k)}: {_literal(v, indent + 4)},\n" for k, v in value.items()]
+        return "{\n" + "".join(items) + " " * indent + "}"
+    if isinstance(value, (tuple, list)) and not value:
+        return repr(value)
+    if isinstance(value, tuple) and len(value) == 1 and not isinstance(value[0], (dict, tuple, list)):
+        return f"({_literal(value[0])},)"
+    if isinstance(value, (tuple, list)):
+        items = [f"{pad}{_literal(v, indent + 4)},\n" for v in value]
+        opening, closing = ("(", ")") if isinstance(value, tuple) else ("[", "]")
+        return opening + "\n" + "".join(items) + " " * indent + closing
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def write_catalog():
+    """Writes metadata of the checkers, so that `databricks.labs.pylint.all` registers them without imports."""
+    checkers = []
+    # same order as the checkers were registered in before, which is the order of their messages
+    for klass in [
+        NotebookChecker,
+        DbutilsChecker,
+        LegacyChecker,
+        AirflowChecker,
+        SparkChecker,
+        MockingChecker,
+        EradicateChecker,
+        ReadabilityChecker,
+        RulesChecker,
+    ]:
+        checkers.append(
+            {
+                "module": klass.__module__,
+                "class": klass.__name__,
+                "raw": issubclass(klass, BaseRawFileChecker),
+                "name": klass.name,
+                "msgs": klass.msgs,
+                "options": klass.options,
+            }
+        )
+    catalog_file = Path(__file__).parent.parent.joinpath("src/databricks/labs/pylint/catalog.py")
+    with catalog_file.open("w") as f:
+        f.write("# Generated by scripts/docs.py from the checker classes, do not edit by hand.\n")
+        f.write("# ruff: noqa: E501\n")
+        # messages and options are copies of the ones in the checker modules, and `test_all.py` keeps them in sync
+        f.write("# pylint: disable=duplicate-code\n")
+        f.write(f"CHECKERS = {_literal(tuple(checkers))}\n")
+
+
 if __name__ == "__main__":
     do_something()
+    write_catalog()
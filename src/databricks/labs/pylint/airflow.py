@@ -1,9 +1,52 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import INFERENCE
 
+from databricks.labs.pylint.calls import resolver
+
+# symbol of the message and its arguments
+Problem = Tuple[str, Tuple[str, ...]]
+
+# cluster settings are inferred from the DAG, and `jobcheck` reports jobs with the same confidence
+CONFIDENCE = INFERENCE
+
+
+def is_supported_runtime(spark_version: str) -> bool:
+    try:
+        split = spark_version.split("-")
+        if len(split) < 2:
+            return False
+        digits = split[0].split(".")
+        if len(digits) < 2:
+            return False
+        return (int(digits[0]), int(digits[1])) >= (11, 3)
+    except ValueError:
+        return False
+
+
+def check_new_cluster(key: str, new_cluster: Dict[str, Any]) -> Iterator[Problem]:
+    if "data_security_mode" not in new_cluster:
+        yield "missing-data-security-mode", (key,)
+    if "spark_version" in new_cluster and not is_supported_runtime(new_cluster["spark_version"]):
+        yield "unsupported-runtime", (key, new_cluster["spark_version"])
+
+
+def check_job_settings(settings: Dict[str, Any]) -> Iterator[Problem]:
+    """Checks clusters of a job, given in the same shape as the Jobs API and the Airflow operators accept."""
+    for arg, value in settings.items():
+        if arg == "tasks":
+            for task in value:
+                if "new_cluster" in task:
+                    yield from check_new_cluster(task["task_key"], task["new_cluster"])
+        elif arg == "job_clusters":
+            for job_cluster in value:
+                if "new_cluster" in job_cluster:
+                    yield from check_new_cluster(job_cluster["job_cluster_key"], job_cluster["new_cluster"])
+        elif arg == "new_cluster":
+            yield from check_new_cluster("ephemeral", value)
+
 
 class AirflowChecker(BaseChecker):
     name = "databricks-airflow"
@@ -24,50 +67,15 @@ class AirflowChecker(BaseChecker):
         ),
     }
 
+    # every file with messages of this checker has one of these, see `databricks.labs.pylint.triage`
+    trigger_words = ("DatabricksCreateJobsOperator", "DatabricksSubmitRunOperator")
+
     def visit_call(self, node: astroid.Call):
-        operator = node.func.as_string()
+        operator = resolver.name(node)
         if operator not in ("DatabricksCreateJobsOperator", "DatabricksSubmitRunOperator"):
             return
-        for arg, value in self._infer_kwargs(node.keywords).items():
-            if arg == "tasks":
-                self._check_tasks(value, node)
-            elif arg == "job_clusters":
-                self._check_job_clusters(value, node)
-            elif arg == "new_cluster":
-                self._check_new_cluster("ephemeral", value, node)
-
-    def _check_new_cluster(self, key: str, new_cluster: Dict[str, Any], node: astroid.NodeNG):
-        if "data_security_mode" not in new_cluster:
-            self.add_message("missing-data-security-mode", node=node, args=(key,), confidence=INFERENCE)
-        if "spark_version" in new_cluster and not self._is_supported(new_cluster["spark_version"]):
-            self.add_message(
-                "unsupported-runtime", node=node, args=(key, new_cluster["spark_version"]), confidence=INFERENCE
-            )
-
-    @staticmethod
-    def _is_supported(spark_version: str):
-        try:
-            split = spark_version.split("-")
-            if len(split) < 2:
-                return False
-            digits = split[0].split(".")
-            if len(digits) < 2:
-                return False
-            return (int(digits[0]), int(digits[1])) >= (11, 3)
-        except ValueError:
-            return False
-
-    def _check_tasks(self, tasks: List[Dict[str, Any]], node: astroid.NodeNG):
-        for task in tasks:
-            if "new_cluster" not in task:
-                return
-            self._check_new_cluster(task["task_key"], task["new_cluster"], node)
-
-    def _check_job_clusters(self, job_clusters: List[Dict[str, Any]], node: astroid.NodeNG):
-        for job_cluster in job_clusters:
-            if "new_cluster" not in job_cluster:
-                return
-            self._check_new_cluster(job_cluster["job_cluster_key"], job_cluster["new_cluster"], node)
+        for symbol, args in check_job_settings(self._infer_kwargs(node.keywords)):
+            self.add_message(symbol, node=node, args=args, confidence=CONFIDENCE)
 
     def _infer_kwargs(self, keywords: List[astroid.Keyword]):
         kwargs = {}
@@ -1,19 +1,85 @@
-from databricks.labs.pylint.airflow import AirflowChecker
-from databricks.labs.pylint.dbutils import DbutilsChecker
-from databricks.labs.pylint.eradicate import EradicateChecker
-from databricks.labs.pylint.legacy import LegacyChecker
-from databricks.labs.pylint.mocking import MockingChecker
-from databricks.labs.pylint.notebooks import NotebookChecker
-from databricks.labs.pylint.readability import ReadabilityChecker
-from databricks.labs.pylint.spark import SparkChecker
+import importlib
+from typing import Any, Dict, Optional, Type, Union
+
+from astroid import nodes
+from pylint.checkers import BaseChecker, BaseRawFileChecker
+
+from databricks.labs.pylint.cache import ResultCache
+from databricks.labs.pylint.catalog import CHECKERS
+from databricks.labs.pylint.messages import MessageFilter
+from databricks.labs.pylint.triage import Triage
+
+
+def _lazy_checker(spec: Dict[str, Any]) -> Type[BaseChecker]:
+    """Creates a stand-in for a checker, that has the same name, messages and options, but imports the module
+    with the actual checker only when pylint opens it. Pylint opens only the checkers that have at least one
+    enabled message, so the modules of disabled checkers and their dependencies are never imported.
+
+    The opened stand-in delegates to an instance of the actual checker: pylint collects visit and leave methods
+    from `dir()` of the stand-in right after opening it, and the guards wrap methods of the actual checker.
+    """
+
+    def __init__(self, linter, *guards: Union[Triage, ResultCache, MessageFilter]):
+        base.__init__(self, linter)
+        self._guards = guards
+        self._checker: Optional[BaseChecker] = None
+
+    def open(self):  # pylint: disable=redefined-builtin
+        module = importlib.import_module(spec["module"])
+        klass = getattr(module, spec["class"])
+        # the options are registered by the stand-in already, and registering them again resets their values
+        self._checker = type(klass.__name__, (klass,), {"options": ()})(self.linter)
+        self._checker.open()
+        # the last guard wraps the methods of all others, so cache hits skip triage as well, and the cache records
+        # filtered messages
+        for guard in self._guards:
+            guard.guard(self._checker)
+
+    def close(self):
+        if self._checker is not None:
+            self._checker.close()
+
+    def process_module(self, node: nodes.Module):
+        self._checker.process_module(node)
+
+    def __dir__(self):
+        members = set(base.__dir__(self))
+        if self._checker is not None:
+            members.update(m for m in dir(self._checker) if m.startswith(("visit_", "leave_")))
+        return sorted(members)
+
+    def __getattr__(self, name: str):
+        # called only for attributes, that the stand-in does not have itself
+        checker = self.__dict__.get("_checker")
+        if checker is None:
+            raise AttributeError(name)
+        return getattr(checker, name)
+
+    base = BaseRawFileChecker if spec["raw"] else BaseChecker
+    attrs = {
+        "name": spec["name"],
+        "msgs": spec["msgs"],
+        "options": spec["options"],
+        "__init__": __init__,
+        "open": open,
+        "close": close,
+        "__dir__": __dir__,
+        "__getattr__": __getattr__,
+    }
+    if spec["raw"]:
+        attrs["process_module"] = process_module
+    return type(spec["class"], (base,), attrs)
+
+
+LAZY_CHECKERS = [_lazy_checker(spec) for spec in CHECKERS]
 
 
 def register(linter):
-    linter.register_checker(NotebookChecker(linter))
-    linter.register_checker(DbutilsChecker(linter))
-    linter.register_checker(LegacyChecker(linter))
-    linter.register_checker(AirflowChecker(linter))
-    linter.register_checker(SparkChecker(linter))
-    linter.register_checker(MockingChecker(linter))
-    linter.register_checker(EradicateChecker(linter))
-    linter.register_checker(ReadabilityChecker(linter))
+    triage = Triage(linter)
+    cache = ResultCache(linter)
+    messages = MessageFilter(linter)
+    linter.register_checker(triage)
+    linter.register_checker(cache)
+    linter.register_checker(messages)
+    for checker in LAZY_CHECKERS:
+        linter.register_checker(checker(linter, triage, cache, messages))
@@ -0,0 +1,308 @@
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import astroid
+import pylint
+from astroid import nodes
+from pylint.checkers import BaseChecker
+from pylint.interfaces import CONFIDENCE_LEVELS, UNDEFINED
+
+from databricks.labs.pylint.__about__ import __version__
+from databricks.labs.pylint.catalog import CHECKERS
+from databricks.labs.pylint.source import source_view
+
+# inference may follow imports into other files, which the content hash of the linted file knows nothing about
+# and custom rules come from a file that is not part of the options
+UNCACHED = frozenset({"databricks-airflow", "databricks-rules"})
+
+# stale entries are only looked for once in a while, as every pylint process sharing the cache would do it
+PRUNE_INTERVAL = 3600
+
+CONFIDENCES = {confidence.name: confidence for confidence in CONFIDENCE_LEVELS}
+
+# parameters of `BaseChecker.add_message()` in the order, that they can be passed in
+ADD_MESSAGE_PARAMETERS = ("msgid", "line", "node", "args", "confidence", "col_offset", "end_lineno", "end_col_offset")
+
+NodeRef = Tuple[str, Optional[int], Optional[int], Optional[int], Optional[int]]
+
+
+def message_arguments(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments of a call to `add_message()` of a checker by name, however they were passed."""
+    message = dict(zip(ADD_MESSAGE_PARAMETERS, args))
+    message.update(kwargs)
+    return message
+
+
+def _node_ref(node: nodes.NodeNG) -> NodeRef:
+    return type(node).__name__, node.lineno, node.col_offset, node.end_lineno, node.end_col_offset
+
+
+def _jsonable(args: Any) -> Any:
+    if isinstance(args, tuple):
+        return [_jsonable(arg) for arg in args]
+    if args is None or isinstance(args, (str, int, float)):
+        return args
+    # messages interpolate arguments with %s, so their string form is as good as the original
+    return str(args)
+
+
+class CacheDirectory:
+    """Entries of JSON-serializable values in a directory, that may be shared by any number of processes.
+
+    Entries are written to temporary files and renamed, so that readers see either a whole entry or none.
+    Every hit touches the entry, and `prune()` removes entries older than `max_age` seconds, then the least
+    recently used ones, until the directory takes no more than `max_size` bytes.
+    """
+
+    def __init__(self, path: Path, max_size: int, max_age: float):
+        self._path = path
+        self._max_size = max_size
+        self._max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, key: str) -> Path:
+        return self._path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entry(key)
+        try:
+            with entry.open() as f:
+                value = json.load(f)
+            os.utime(entry)
+        except (OSError, ValueError):
+            # missing, just pruned by another process or corrupted, which are all the same miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # no fsync: an entry lost in a crash costs a single miss
+        with tempfile.NamedTemporaryFile("w", dir=entry.parent, prefix=".", suffix=".tmp", delete=False) as f:
+            json.dump(value, f)
+        os.replace(f.name, entry)
+
+    def prune(self, force: bool = False):
+        marker = self._path / ".pruned"
+        now = time.time()
+        try:
+            if not force and now - marker.stat().st_mtime < PRUNE_INTERVAL:
+                return
+        except FileNotFoundError:
+            pass
+        self._path.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        entries = []
+        for path in self._path.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            # temporary files are left behind only by killed processes
+            max_age = PRUNE_INTERVAL if path.name.startswith(".") else self._max_age
+            if now - stat.st_mtime > max_age:
+                self._remove(path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ResultCache(BaseChecker):
+    """Replays messages of this plugin's checkers for files, that were linted with the same content before.
+
+    Entries are keyed by the hash of the file content, the versions of this plugin, pylint, astroid and
+    Python, the options of the checkers and the enabled messages. On a hit, the visit methods of cached
+    checkers return right away, and the recorded messages are added again with their original nodes, so
+    that inline `# pylint: disable` comments apply to them just as before.
+
+    The cache is disabled unless `result-cache-dir` is set. It has no messages, so pylint never opens it,
+    and the checkers registered by `databricks.labs.pylint.all` hand themselves over to `guard()` instead.
+    """
+
+    name = "result-cache"
+    msgs: Dict[str, Any] = {}
+    options = (
+        (
+            "result-cache-dir",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<dir>",
+                "help": "Directory to keep the messages of Databricks checkers per file content in, "
+                "shared by all pylint processes. Empty value disables the cache",
+            },
+        ),
+        (
+            "result-cache-max-size",
+            {
+                "default": 256,
+                "type": "int",
+                "metavar": "<megabytes>",
+                "help": "Least recently used entries are removed, when the cache takes more space",
+            },
+        ),
+        (
+            "result-cache-max-age",
+            {
+                "default": 14,
+                "type": "int",
+                "metavar": "<days>",
+                "help": "Entries that were not used for longer are removed",
+            },
+        ),
+    )
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self._directory: Optional[CacheDirectory] = None
+        self._configured = False
+        self._salt = b""
+        self._module: Optional[nodes.Module] = None
+        self._key: Optional[str] = None
+        self._replaying = False
+        self._recorded: List[List[Any]] = []
+
+    def stats(self) -> Dict[str, int]:
+        if not self._directory:
+            return {}
+        return {"hits": self._directory.hits, "misses": self._directory.misses}
+
+    def _configure(self) -> bool:
+        if self._configured:
+            return self._directory is not None
+        self._configured = True
+        config = self.linter.config
+        if not config.result_cache_dir:
+            return False
+        self._directory = CacheDirectory(
+            Path(config.result_cache_dir),
+            max_size=config.result_cache_max_size * 1024 * 1024,
+            max_age=config.result_cache_max_age * 86400,
+        )
+        # recorded messages are already cut to the width
+        options = {"message-width": config.message_width}
+        enabled = []
+        for spec in CHECKERS:
+            for option, _ in spec["options"]:
+                options[option] = getattr(config, option.replace("-", "_"))
+            enabled.extend(msgid for msgid in spec["msgs"] if self.linter.is_message_enabled(msgid))
+        salt = [__version__, pylint.__version__, astroid.__version__, sys.version, options, sorted(enabled)]
+        self._salt = json.dumps(salt, sort_keys=True, default=str).encode("utf-8")
+        return True
+
+    def guard(self, checker: BaseChecker):
+        """Makes an opened checker skip files with cached messages, and record messages for the other files."""
+        if checker.name in UNCACHED or not self._configure():
+            return
+        for member in dir(checker):
+            if member.startswith(("visit_", "leave_")) or member == "process_module":
+                setattr(checker, member, self._guarded(getattr(checker, member)))
+        checker.add_message = self._recording(checker.add_message)
+        checker.close = self._closing(checker.close)
+
+    def _guarded(self, method: Callable[[nodes.NodeNG], None]) -> Callable[[nodes.NodeNG], None]:
+        # wraps() keeps the messages, that pylint reads to skip methods of disabled messages
+        @functools.wraps(method)
+        def guarded(node: nodes.NodeNG):
+            module = node.root()
+            if module is not self._module:
+                self._switch(module)
+            if self._replaying:
+                return None
+            try:
+                return method(node)
+            except Exception:
+                # messages of a half-checked file are not worth keeping
+                self._key = None
+                raise
+
+        return guarded
+
+    def _recording(self, add_message: Callable[..., None]) -> Callable[..., None]:
+        @functools.wraps(add_message)
+        def recording(*args, **kwargs):
+            if self._key:
+                message = message_arguments(args, kwargs)
+                node = message.get("node")
+                ref = _node_ref(node) if node else None
+                self._recorded.append(
+                    [
+                        message["msgid"],
+                        ref,
+                        message.get("line"),
+                        message.get("col_offset"),
+                        message.get("end_lineno"),
+                        message.get("end_col_offset"),
+                        _jsonable(message.get("args")),
+                        (message.get("confidence") or UNDEFINED).name,
+                    ]
+                )
+            add_message(*args, **kwargs)
+
+        return recording
+
+    def _closing(self, close: Callable[[], None]) -> Callable[[], None]:
+        @functools.wraps(close)
+        def closing():
+            self._finish()
+            if self._directory:
+                self._directory.prune()
+            close()
+
+        return closing
+
+    def _switch(self, module: nodes.Module):
+        self._finish()
+        self._module = module
+        self._replaying = False
+        if not module.file:
+            return
+        self._key = hashlib.blake2b(self._salt + source_view(module).data, digest_size=20).hexdigest()
+        entries = self._directory.get(self._key) if self._directory else None
+        if entries is None:
+            return
+        self._replaying = True
+        self._replay(module, entries)
+
+    def _finish(self):
+        if self._key and not self._replaying and self._directory:
+            self._directory.put(self._key, self._recorded)
+        self._module = None
+        self._key = None
+        self._recorded = []
+
+    def _replay(self, module: nodes.Module, entries: List[List[Any]]):
+        index: Dict[NodeRef, nodes.NodeNG] = {}
+        for msgid, ref, line, col_offset, end_lineno, end_col_offset, args, confidence in entries:
+            node = None
+            if ref:
+                if not index:
+                    for candidate in module.nodes_of_class(nodes.NodeNG):
+                        index.setdefault(_node_ref(candidate), candidate)
+                node = index.get(tuple(ref), module)
+            if isinstance(args, list):
+                args = tuple(args)
+            confidence = CONFIDENCES.get(confidence, UNDEFINED)
+            self.linter.add_message(msgid, line, node, args, confidence, col_offset, end_lineno, end_col_offset)
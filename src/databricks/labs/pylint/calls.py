@@ -0,0 +1,78 @@
+import weakref
+from typing import Dict, Optional
+
+from astroid import nodes
+from astroid.nodes.as_string import AsStringVisitor
+
+from databricks.labs.pylint.findings import shorten, shorten_repr
+
+
+class _CachingVisitor(AsStringVisitor):
+    """Renders nodes the same way as `as_string()`, but every call only once, so that chained calls like
+    `spark.table(...).filter(...).select(...)` reuse the source code of the calls they are made on."""
+
+    def __init__(self):
+        super().__init__()
+        # nodes are alive for as long as their module, so their ids are not reused before the module changes
+        self.calls: Dict[int, str] = {}
+        self.strings: Dict[int, str] = {}
+
+    def visit_call(self, node: nodes.Call) -> str:
+        rendered = self.calls.get(id(node))
+        if rendered is None:
+            rendered = super().visit_call(node)
+            self.calls[id(node)] = rendered
+        return rendered
+
+
+class CallResolver:
+    """Source code of calls and of their parts for the module being checked, shared by all checkers of this
+    plugin instead of each of them rendering the same nodes with `as_string()` again."""
+
+    def __init__(self):
+        self._module: Optional["weakref.ReferenceType[nodes.Module]"] = None
+        self._visitor = _CachingVisitor()
+
+    def as_string(self, node: nodes.NodeNG) -> str:
+        """Same as `node.as_string()`."""
+        module = node.root()
+        if self._module is None or self._module() is not module:
+            self._module = weakref.ref(module)
+            self._visitor = _CachingVisitor()
+        strings = self._visitor.strings
+        rendered = strings.get(id(node))
+        if rendered is None:
+            rendered = self._visitor(node)
+            strings[id(node)] = rendered
+        return rendered
+
+    def name(self, node: nodes.Call) -> str:
+        """Source code of the called function, e.g. `dbutils.fs.ls` or `spark.table('x').filter`."""
+        return self.as_string(node.func)
+
+    def arg(self, node: nodes.Call, index: int) -> str:
+        """Source code of a positional argument."""
+        return self.as_string(node.args[index])
+
+    def shortened(self, node: nodes.NodeNG, width: Optional[int]) -> str:
+        """Source code of a node, cut to `width` characters. String literals are cut before they are formatted."""
+        if width and isinstance(node, nodes.Const) and isinstance(node.value, str):
+            return shorten_repr(node.value, width)
+        return shorten(self.as_string(node), width)
+
+
+resolver = CallResolver()
+
+
+class SourceArg:
+    """Source code of a node as a message argument. Pylint formats messages only when they are enabled, so the
+    node is rendered only then, and cut to `width` characters, if it is set."""
+
+    __slots__ = ("node", "width")
+
+    def __init__(self, node: nodes.NodeNG, width: Optional[int] = None):
+        self.node = node
+        self.width = width
+
+    def __str__(self) -> str:
+        return resolver.shortened(self.node, self.width)
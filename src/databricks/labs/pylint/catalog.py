@@ -0,0 +1,246 @@
+# Generated by scripts/docs.py from the checker classes, do not edit by hand.
+# ruff: noqa: E501
+# pylint: disable=duplicate-code
+CHECKERS = (
+    {
+        "module": "databricks.labs.pylint.notebooks",
+        "class": "NotebookChecker",
+        "raw": True,
+        "name": "databricks-notebooks",
+        "msgs": {
+            "C8913": (
+                "Notebooks should not have more than 75 cells",
+                "notebooks-too-many-cells",
+                "Otherwise, it's hard to maintain and understand the notebook for other people and the future you",
+            ),
+            "R8914": (
+                "Using %run is not allowed",
+                "notebooks-percent-run",
+                "Use functions instead of %run to avoid side effects and make the code more testable. If you need to share code between notebooks, consider creating a library. If still need to call another code as a separate job, use Databricks SDK for Python: https://databricks-sdk-py.readthedocs.io/en/latest/index.html",
+            ),
+        },
+        "options": (
+            (
+                "max-cells",
+                {
+                    "default": 75,
+                    "type": "int",
+                    "metavar": "<int>",
+                    "help": "Maximum number of cells in the notebook",
+                },
+            ),
+        ),
+    },
+    {
+        "module": "databricks.labs.pylint.dbutils",
+        "class": "DbutilsChecker",
+        "raw": False,
+        "name": "databricks-dbutils",
+        "msgs": {
+            "R8903": (
+                "Use Databricks SDK instead: w.dbfs.copy(%s, %s)",
+                "dbutils-fs-cp",
+                "Migrate all usage of dbutils to Databricks SDK. See the more detailed documentation at https://databricks-sdk-py.readthedocs.io/en/latest/workspace/files/dbfs.html",
+            ),
+            "R8904": (
+                "Use Databricks SDK instead: with w.dbfs.download(%s) as f: f.read()",
+                "dbutils-fs-head",
+                "Migrate all usage of dbutils to Databricks SDK. See the more detailed documentation at https://databricks-sdk-py.readthedocs.io/en/latest/workspace/files/dbfs.html",
+            ),
+            "R8905": (
+                "Use Databricks SDK instead: w.dbfs.list(%s)",
+                "dbutils-fs-ls",
+                "Migrate all usage of dbutils to Databricks SDK. See the more detailed documentation at https://databricks-sdk-py.readthedocs.io/en/latest/workspace/files/dbfs.html",
+            ),
+            "R8906": (
+                "Mounts are not supported with Unity Catalog, switch to using Unity Catalog Volumes instead",
+                "dbutils-fs-mount",
+                "Migrate all usage to Unity Catalog",
+            ),
+            "R8907": (
+                "Credentials utility is not supported with Unity Catalog",
+                "dbutils-credentials",
+                "Migrate all usage to Unity Catalog",
+            ),
+            "R8908": (
+                "Use Databricks SDK instead: w.jobs.submit(\n                tasks=[jobs.SubmitTask(existing_cluster_id=...,\n                                       notebook_task=jobs.NotebookTask(notebook_path=%s),\n                                       task_key=...)\n                ]).result(timeout=timedelta(minutes=%s))",
+                "dbutils-notebook-run",
+                "Migrate all usage of dbutils to Databricks SDK. See the more detailed documentation at https://databricks-sdk-py.readthedocs.io/en/latest/workspace/jobs/jobs.html",
+            ),
+            "R8909": (
+                "Use Databricks SDK instead: from databricks.sdk import WorkspaceClient(); w = WorkspaceClient()",
+                "pat-token-leaked",
+                "Do not hardcode secrets in code, use Databricks SDK instead, which natively authenticates in Databricks Notebooks. See more at https://databricks-sdk-py.readthedocs.io/en/latest/authentication.html",
+            ),
+            "R8910": (
+                "Do not use internal APIs, rewrite using Databricks SDK: %s",
+                "internal-api",
+                "Do not use internal APIs. Use Databricks SDK for Python: https://databricks-sdk-py.readthedocs.io/en/latest/index.html",
+            ),
+        },
+        "options": (),
+    },
+    {
+        "module": "databricks.labs.pylint.legacy",
+        "class": "LegacyChecker",
+        "raw": False,
+        "name": "databricks-legacy",
+        "msgs": {
+            "R8911": (
+                "Don't use databricks_cli, use databricks.sdk instead: pip install databricks-sdk",
+                "legacy-cli",
+                "Migrate all usage of Legacy CLI to Databricks SDK. See the more detailed documentation at https://databricks-sdk-py.readthedocs.io/en/latest/index.html",
+            ),
+            "W8912": (
+                "Incompatible with Unity Catalog: %s",
+                "incompatible-with-uc",
+                "Migrate all usage to Databricks Unity Catalog. Use https://github.com/databrickslabs/ucx for more details",
+            ),
+        },
+        "options": (
+            (
+                "uc-incompatible-needles",
+                {
+                    "default": (),
+                    "type": "csv",
+                    "metavar": "<needles>",
+                    "help": "More substrings of imports, calls and literals that are incompatible with Unity Catalog",
+                },
+            ),
+        ),
+    },
+    {
+        "module": "databricks.labs.pylint.airflow",
+        "class": "AirflowChecker",
+        "raw": False,
+        "name": "databricks-airflow",
+        "msgs": {
+            "W8901": (
+                "%s cluster missing `data_security_mode` required for Unity Catalog compatibility",
+                "missing-data-security-mode",
+                "Before you enable Unity Catalog, you must set the `data_security_mode` to 'NONE', so that your existing jobs would keep the same behavior. Failure to do so may cause your jobs to fail with unexpected errors.",
+            ),
+            "W8902": (
+                "%s cluster has unsupported runtime: %s",
+                "unsupported-runtime",
+                "The runtime version is not supported by Unity Catalog. Please upgrade to a runtime greater than or equal to 11.3.",
+            ),
+        },
+        "options": (),
+    },
+    {
+        "module": "databricks.labs.pylint.spark",
+        "class": "SparkChecker",
+        "raw": False,
+        "name": "spark",
+        "msgs": {
+            "C8915": (
+                "Using spark outside the function is leading to untestable code",
+                "spark-outside-function",
+                "Do not use global spark object, pass it as an argument to the function instead, so that the function becomes testable in a CI/CD pipelines.",
+            ),
+            "W8916": (
+                "Function %s is missing a 'spark' argument",
+                "no-spark-argument-in-function",
+                "Function refers to a global spark variable, which may not always be available. Pass the spark object as an argument to the function instead, so that the function becomes testable in a CI/CD pipelines.",
+            ),
+            "C8917": (
+                "Rewrite to display in a notebook: display(%s)",
+                "use-display-instead-of-show",
+                "Use display() instead of show() to visualize the data in a notebook.",
+            ),
+        },
+        "options": (),
+    },
+    {
+        "module": "databricks.labs.pylint.mocking",
+        "class": "MockingChecker",
+        "raw": False,
+        "name": "mocking",
+        "msgs": {
+            "R8918": (
+                "Obscure implicit test dependency with mock.patch(%s). Rewrite to inject dependencies through constructor.",
+                "explicit-dependency-required",
+                "Using `patch` to mock dependencies in unit tests can introduce implicit \ndependencies within a class, making it unclear to other developers. Constructor arguments, on the other hand, \nexplicitly declare dependencies, enhancing code readability and maintainability. However, reliance on `patch` \nfor testing may lead to issues during refactoring, as updates to underlying implementations would necessitate \nchanges across multiple unrelated unit tests. Moreover, the use of hard-coded strings in `patch` can obscure \nwhich unit tests require modification, as they lack strongly typed references. This coupling of the class \nunder test to concrete classes signifies a code smell, and such code is not easily portable to statically typed \nlanguages where monkey patching isn't feasible without significant effort. In essence, extensive patching of \nexternal clients suggests a need for refactoring, with experienced engineers recognizing the potential for \ndependency inversion in such scenarios.\n\nTo address this issue, refactor the code to inject dependencies through the constructor. This approach\nexplicitly declares dependencies, enhancing code readability and maintainability. Moreover, it allows for\ndependency inversion, enabling the use of interfaces to decouple the class under test from concrete classes.\nThis decoupling facilitates unit testing, as it allows for the substitution of mock objects for concrete\nimplementations, ensuring that the class under test behaves as expected. By following this approach, you can\ncreate more robust and maintainable unit tests, improving the overall quality of your codebase.\n\nUse `require-explicit-dependency` option to specify the package names that contain code for your project.",
+            ),
+            "R8919": (
+                "Obscure implicit test dependency with MagicMock(). Rewrite with create_autospec(ConcreteType).",
+                "obscure-mock",
+                "Using `MagicMock` to mock dependencies in unit tests can introduce implicit dependencies \nwithin a class, making it unclear to other developers. create_autospec(ConcreteType) is a better alternative, as it\nautomatically creates a mock object with the same attributes and methods as the concrete class. This\napproach ensures that the mock object behaves like the concrete class, allowing for more robust and\nmaintainable unit tests. Moreover, reliance on `MagicMock` for testing leads to issues during refactoring,\nas updates to underlying implementations would necessitate changes across multiple unrelated unit tests.",
+            ),
+            "R8921": (
+                "Mock not assigned to a variable: %s",
+                "mock-no-assign",
+                "Every mocked object should be assigned to a variable to allow for assertions.",
+            ),
+            "R8922": (
+                "Missing usage of mock for %s",
+                "mock-no-usage",
+                "Usually this check means a hidden bug, where object is mocked, but we don't check if it was used correctly. Every mock should have at least one assertion, return value, or side effect specified.",
+            ),
+        },
+        "options": (
+            (
+                "require-explicit-dependency",
+                {
+                    "default": ("databricks",),
+                    "type": "csv",
+                    "metavar": "<modules>",
+                    "help": "Package names that contain code for your project.",
+                },
+            ),
+        ),
+    },
+    {
+        "module": "databricks.labs.pylint.eradicate",
+        "class": "EradicateChecker",
+        "raw": True,
+        "name": "eradicate",
+        "msgs": {
+            "C8920": (
+                "Remove commented out code: %s",
+                "dead-code",
+                "Version control helps with keeping track of code changes. There is no need to keep commented out code in the codebase. Remove it to keep the codebase clean.",
+            ),
+        },
+        "options": (),
+    },
+    {
+        "module": "databricks.labs.pylint.readability",
+        "class": "ReadabilityChecker",
+        "raw": False,
+        "name": "readability",
+        "msgs": {
+            "R8923": (
+                "List comprehension spans multiple lines, rewrite as for loop",
+                "rewrite-as-for-loop",
+                "List comprehensions in Python are typically used to create new lists by iterating over an existing\n            iterable in a concise, one-line syntax. However, when a list comprehension becomes too complex or spans \n            multiple lines, it may lose its readability and clarity, which are key advantages of Python's syntax.",
+            ),
+        },
+        "options": (),
+    },
+    {
+        "module": "databricks.labs.pylint.rules",
+        "class": "RulesChecker",
+        "raw": False,
+        "name": "databricks-rules",
+        "msgs": {
+            "R8924": (
+                "%s",
+                "custom-rule",
+                "Custom rule from the `[[tool.databricks-labs-pylint.rules]]` tables of the `rules-file`.",
+            ),
+        },
+        "options": (
+            (
+                "rules-file",
+                {
+                    "default": "pyproject.toml",
+                    "type": "string",
+                    "metavar": "<file>",
+                    "help": "TOML file with custom rules for calls, imports and literals",
+                },
+            ),
+        ),
+    },
+)
@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TextIO
+
+from databricks.sdk.service.workspace import ObjectInfo
+
+from databricks.labs.pylint.__about__ import __version__
+from databricks.labs.pylint.findings import Report
+from databricks.labs.pylint.manifest import write_atomically
+from databricks.labs.pylint.traversal import is_container
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """Periodically persisted progress of a workspace scan, that allows resuming it after the process dies.
+
+    Reports of linted objects are appended to a journal next to the checkpoint as they come, one JSON record
+    per line. The checkpoint itself is a snapshot of the frontier of the scan: directories that were discovered
+    but not listed yet and objects that were listed but not linted yet, so neither the memory of the scan nor
+    a save grows with the number of linted objects. The journal is flushed before every snapshot, so every
+    report of an object missing from a snapshot is in the journal. A directory moves from the frontier to its
+    children in a single step, so nothing is lost. Directories listed after the last snapshot are listed again,
+    and their children may be in the journal already, so callers skip every object that `is_linted()` to lint
+    nothing twice.
+    """
+
+    def __init__(self, path: Path, root: str, interval: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self._path = path
+        self._journal_path = path.with_suffix(".reports.jsonl")
+        self._root = root
+        self._interval = interval
+        self._clock = clock
+        self._last_save = clock()
+        self._directories: Set[str] = {root}
+        self._objects: Dict[str, Dict[str, Any]] = {}
+        # paths in the journal of the resumed scan, which stay the same for the rest of it
+        self._linted: Set[str] = set()
+        self._journal: Optional[TextIO] = None
+        self._resumed = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @classmethod
+    def resume(cls, path: Path, root: str, interval: float = 60.0) -> "Checkpoint":
+        checkpoint = cls(path, root, interval)
+        if not path.exists():
+            logger.info(f"no checkpoint at {path}, starting from scratch")
+            return checkpoint
+        with path.open() as f:
+            raw = json.load(f)
+        if raw["root"] != root:
+            raise ValueError(f"checkpoint {path} is for {raw['root']}, not {root}")
+        if raw["version"] != __version__:
+            raise ValueError(f"checkpoint {path} was written by version {raw['version']}")
+        checkpoint._directories = set(raw["directories"])
+        checkpoint._objects = raw["objects"]
+        checkpoint._resumed = True
+        checkpoint._linted = {report.path for report in checkpoint.reports()}
+        for linted in checkpoint._linted:
+            checkpoint._objects.pop(linted, None)
+        logger.info(
+            f"resuming from {path}: {len(checkpoint._linted)} linted, {len(checkpoint._objects)} pending objects, "
+            f"{len(checkpoint._directories)} pending directories"
+        )
+        return checkpoint
+
+    def reports(self) -> Iterator[Report]:
+        """Reports of objects that were linted before the scan was resumed, read from the journal."""
+        # the journal is read before the resumed scan appends to it
+        if not self._resumed or self._journal is not None or not self._journal_path.exists():
+            return
+        with self._journal_path.open("rb") as f:
+            complete = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # the process died while writing this report, so the object is linted again
+                    break
+                complete += len(line)
+                yield Report.from_dict(json.loads(line))
+        if complete < self._journal_path.stat().st_size:
+            os.truncate(self._journal_path, complete)
+
+    def pending_objects(self) -> Iterator[ObjectInfo]:
+        for raw in list(self._objects.values()):
+            yield ObjectInfo.from_dict(raw)
+
+    def pending_directories(self) -> List[str]:
+        return sorted(self._directories)
+
+    def is_linted(self, path: str) -> bool:
+        return path in self._linted
+
+    def listed(self, directory: str, children: List[ObjectInfo]):
+        self._directories.discard(directory)
+        for child in children:
+            if is_container(child):
+                self._directories.add(child.path)
+            elif child.path not in self._linted:
+                self._objects[child.path] = child.as_dict()
+        self._maybe_save()
+
+    def linted(self, report: Report):
+        self._open_journal().write(json.dumps(report.as_dict()) + "\n")
+        self._objects.pop(report.path, None)
+        self._maybe_save()
+
+    def _open_journal(self) -> TextIO:
+        if self._journal is None:
+            self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+            # a scan that is not resumed starts with an empty journal
+            self._journal = self._journal_path.open("a" if self._resumed else "w", encoding="utf-8")
+        return self._journal
+
+    def _maybe_save(self):
+        if self._clock() - self._last_save < self._interval:
+            return
+        self.save()
+
+    def save(self):
+        journal = self._open_journal()
+        journal.flush()
+        os.fsync(journal.fileno())
+        write_atomically(
+            self._path,
+            {
+                "version": __version__,
+                "root": self._root,
+                "directories": sorted(self._directories),
+                "objects": self._objects,
+            },
+        )
+        self._last_save = self._clock()
+
+    def close(self):
+        if self._journal is None:
+            return
+        self._journal.close()
+        self._journal = None
+
+    def complete(self):
+        """Removes the checkpoint and its journal after the scan finished, so that the next scan starts from
+        scratch."""
+        self.close()
+        self._path.unlink(missing_ok=True)
+        self._journal_path.unlink(missing_ok=True)
@@ -1,64 +1,229 @@
+import itertools
 import json
 import logging
-import os
-import pathlib
-import re
-import subprocess
+import signal
 import sys
-import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.workspace import ExportFormat, Language, ObjectInfo, ObjectType
 
-logging.basicConfig(stream=sys.stderr, level=logging.INFO, format="%(asctime)s [%(name)s][%(levelname)s] %(message)s")
+from databricks.labs.pylint.checkpoint import Checkpoint
+from databricks.labs.pylint.engine import Engine
+from databricks.labs.pylint.export import archive_sources
+from databricks.labs.pylint.findings import Report
+from databricks.labs.pylint.jobs import JobScanner
+from databricks.labs.pylint.manifest import Manifest
+from databricks.labs.pylint.output import OUTPUTS
+from databricks.labs.pylint.pipeline import Pipeline
+from databricks.labs.pylint.sharding import ResultsWriter, Shard, merge_results
+from databricks.labs.pylint.store import FindingsStore
+from databricks.labs.pylint.throttle import AdaptiveLimiter
+from databricks.labs.pylint.traversal import Walker, is_container
+
 logger = logging.getLogger(__name__)
 
-payload = json.loads(sys.argv[1])
-flags = payload["flags"]
-
-if flags.get("log_level", "info").lower() == "debug":
-    logging.getLogger("databricks.sdk").setLevel(logging.DEBUG)
-
-w = WorkspaceClient()
-
-path = flags.get("path")
-if not path:
-    path = f"/Users/{w.current_user.me().user_name}"
-
-
-def check_python_notebook(info: ObjectInfo):
-    if info.object_type != ObjectType.NOTEBOOK:
-        return
-    if info.language != Language.PYTHON:
-        return
-    logger.info(f"👀 checking: {info.path}")
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with w.workspace.download(info.path, format=ExportFormat.SOURCE) as f:
-            basename = os.path.basename(info.path)
-            # replace non-alphanumeric characters with underscores
-            basename = re.sub(r"\W+", "_", basename)
-            tmp_path = pathlib.Path(tmpdir, basename)
-            with tmp_path.open("wb") as nb:
-                nb.write(f.read())
-            command = [
-                "pylint",
-                "--load-plugins=databricks.labs.pylint.all",
-                "--disable=all",
-                "--enable=missing-data-security-mode,unsupported-runtime,dbutils-fs-cp,dbutils-fs-head,dbutils-fs-ls,dbutils-fs-mount,dbutils-credentials,dbutils-notebook-run,pat-token-leaked,internal-api,legacy-cli,incompatible-with-uc,notebooks-too-many-cells,notebooks-percent-run,spark-outside-function,use-display-instead-of-show,no-spark-argument-in-function",
-                tmp_path.as_posix(),
-            ]
-            with subprocess.Popen(
-                command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
-            ) as process:
-                for line in iter(process.stdout.readline, ""):
-                    print(line, end="")
-
-
-status = w.workspace.get_status(path)
-if status.object_type == ObjectType.DIRECTORY:
-    for item in w.workspace.list(path):
-        check_python_notebook(item)
-elif status.object_type == ObjectType.NOTEBOOK:
-    check_python_notebook(status)
-else:
-    print(f"❌ {path} is not a notebook or directory")
+
+def merge(flags: Dict[str, str], output):
+    for merged in merge_results(Path(p) for p in flags["results"].split(",")):
+        output.write(merged)
+    output.close()
+
+
+def regressions(flags: Dict[str, str], output) -> int:
+    with FindingsStore(Path(flags["store"])) as store:
+        scan_id = int(flags["scan"]) if flags.get("scan") else store.latest_scan()
+        since = int(flags["since"]) if flags.get("since") else store.latest_scan(before=scan_id)
+        if scan_id is None or since is None:
+            logger.error(f"❌ need two finished scans to compare in {flags['store']}")
+            return 1
+        if flags.get("fixed", "false").lower() == "true":
+            differences = store.fixed_findings(scan_id, since)
+        else:
+            differences = store.new_findings(scan_id, since)
+        for difference in differences:
+            output.write(difference)
+    output.close()
+    return 0
+
+
+def jobcheck(w: WorkspaceClient, limiter: AdaptiveLimiter, flags: Dict[str, str], output):
+    scanner = JobScanner(
+        w,
+        workers=int(flags.get("workers", 8)),
+        queue_size=int(flags.get("queue_size", 32)),
+        limiter=limiter,
+    )
+    for job in scanner.run():
+        output.write(job)
+    output.close()
+    logger.info(f"📈 workspace API: {limiter.stats()}")
+
+
+class NotebookCheck:
+    """Lints Python notebooks and files of a workspace path, as the `nbcheck` command."""
+
+    def __init__(self, w: WorkspaceClient, limiter: AdaptiveLimiter, flags: Dict[str, str], output):
+        self._w = w
+        self._limiter = limiter
+        self._flags = flags
+        path = flags.get("path")
+        if not path:
+            path = f"/Users/{w.current_user.me().user_name}"
+        self._path = path
+        self._shard = Shard.parse(flags["shard"]) if flags.get("shard") else None
+        self._engine = Engine(max_modules=int(flags.get("max_modules", 256)))
+        # the output and the results file for merging the shards
+        self._writers = [output]
+        if flags.get("results"):
+            self._writers.append(ResultsWriter(Path(flags["results"]), path, self._shard))
+        self._manifest = Manifest(Path(flags["manifest"])) if flags.get("manifest") else None
+        self._store = FindingsStore(Path(flags["store"])) if flags.get("store") else None
+        self._pipeline = Pipeline(
+            self._download_source,
+            self._engine.lint,
+            download_workers=int(flags.get("download_workers", 8)),
+            queue_size=int(flags.get("queue_size", 32)),
+            manifest=self._manifest,
+        )
+        self._checkpoint: Optional[Checkpoint] = None
+
+    @staticmethod
+    def _is_python_source(info: ObjectInfo) -> bool:
+        if info.object_type == ObjectType.NOTEBOOK:
+            return info.language == Language.PYTHON
+        return info.object_type == ObjectType.FILE and info.path.endswith(".py")
+
+    def _is_scanned(self, info: ObjectInfo) -> bool:
+        # every shard lists the whole tree, but lints only its own share of it
+        return self._is_python_source(info) and (not self._shard or self._shard.owns(info.path))
+
+    def _list_directory(self, directory: str) -> List[ObjectInfo]:
+        return self._limiter.call(lambda: list(self._w.workspace.list(directory)))
+
+    def _download_source(self, info: ObjectInfo) -> str:
+        # workspace files are downloaded as they are, notebooks as source code with the notebook header
+        export_format = ExportFormat.AUTO if info.object_type == ObjectType.FILE else ExportFormat.SOURCE
+        with self._limiter.slot(), self._w.workspace.download(info.path, format=export_format) as f:
+            return f.read().decode("utf-8")
+
+    def _emit(self, report: Report):
+        for writer in self._writers:
+            writer.write(report)
+        if self._store:
+            self._store.write(report)
+
+    def _start_checkpoint(self) -> Optional[Checkpoint]:
+        flags = self._flags
+        resume = flags.get("resume", "false").lower() == "true"
+        if not flags.get("checkpoint") and not resume:
+            return None
+        suffix = f"-{self._shard.index}-of-{self._shard.total}" if self._shard else ""
+        checkpoint_path = Path(flags.get("checkpoint") or f".nbcheck-checkpoint{suffix}.json")
+        checkpoint_interval = float(flags.get("checkpoint_interval", 60))
+        if resume:
+            checkpoint = Checkpoint.resume(checkpoint_path, self._path, checkpoint_interval)
+        else:
+            checkpoint = Checkpoint(checkpoint_path, self._path, checkpoint_interval)
+        for report in checkpoint.reports():
+            self._emit(report)
+            if self._manifest:
+                self._manifest.keep(report.path)
+        return checkpoint
+
+    def _is_pending(self, info: ObjectInfo) -> bool:
+        return self._is_scanned(info) and not (self._checkpoint and self._checkpoint.is_linted(info.path))
+
+    def _on_listed(self, directory: str, children: List[ObjectInfo]):
+        if self._checkpoint:
+            self._checkpoint.listed(directory, [c for c in children if is_container(c) or self._is_scanned(c)])
+
+    def _reports(self) -> Iterator[Report]:
+        path = self._path
+        status = self._w.workspace.get_status(path)
+        if is_container(status):
+            self._checkpoint = checkpoint = self._start_checkpoint()
+            if self._flags.get("bulk_export", "false").lower() == "true":
+                # one request for the whole directory instead of one per notebook
+                archive = self._limiter.call(lambda: self._w.workspace.download(path, format=ExportFormat.SOURCE))
+                sources = archive_sources(path, archive)
+                return self._pipeline.run_sources((info, src) for info, src in sources if self._is_pending(info))
+            list_workers = int(self._flags.get("list_workers", 8))
+            walker = Walker(self._list_directory, workers=list_workers, on_listed=self._on_listed)
+            if checkpoint:
+                pending = itertools.chain(checkpoint.pending_objects(), walker.walk(*checkpoint.pending_directories()))
+            else:
+                pending = walker.walk(path)
+            # directories listed after the last snapshot are listed again, with children that are in the journal
+            return self._pipeline.run(item for item in pending if self._is_pending(item))
+        if status.object_type in (ObjectType.NOTEBOOK, ObjectType.FILE):
+            return self._pipeline.run([status] if self._is_scanned(status) else [])
+        print(f"❌ {path} is not a notebook, file, directory or repo")
+        return iter([])
+
+    def run(self):
+        if self._store:
+            self._store.start_scan(self._path)
+        reports = self._reports()
+        checkpoint = self._checkpoint
+        # pod evictions send SIGTERM, which should save the checkpoint just like Ctrl-C does
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(128 + signal.SIGTERM))
+        try:
+            for report in reports:
+                self._emit(report)
+                if checkpoint:
+                    checkpoint.linted(report)
+        except BaseException:
+            if checkpoint:
+                checkpoint.save()
+                checkpoint.close()
+                logger.warning(f"💾 saved checkpoint, continue with --resume: {checkpoint.path}")
+            if self._manifest:
+                # notebooks linted so far are not downloaded again by the next scan, resumed or not
+                self._manifest.save()
+            raise
+        for writer in self._writers:
+            writer.close()
+        logger.info(f"📈 workspace API: {self._limiter.stats()}")
+        logger.info(f"🧠 astroid modules: {self._engine.cache_stats()}")
+        logger.info(f"🔎 triage: {self._engine.triage_stats()}")
+        self._engine.close()
+        if self._store:
+            logger.info(f"🗄️ stored findings as scan {self._store.finish_scan()} in {self._flags['store']}")
+            self._store.close()
+        if checkpoint:
+            checkpoint.complete()
+        if self._manifest:
+            self._manifest.prune(self._path, self._shard.owns if self._shard else None)
+            self._manifest.save()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv if argv is None else argv
+    logging.basicConfig(
+        stream=sys.stderr, level=logging.INFO, format="%(asctime)s [%(name)s][%(levelname)s] %(message)s"
+    )
+    payload: Dict[str, Any] = json.loads(args[1])
+    flags = payload["flags"]
+    if flags.get("log_level", "info").lower() == "debug":
+        logging.getLogger("databricks.sdk").setLevel(logging.DEBUG)
+    output = OUTPUTS[flags.get("output") or "text"]()
+    command = payload["command"]
+    if command == "merge":
+        merge(flags, output)
+        return 0
+    if command == "regressions":
+        return regressions(flags, output)
+    w = WorkspaceClient()
+    limiter = AdaptiveLimiter(maximum=int(flags.get("max_requests", 16)))
+    limiter.observe_client(w)
+    if command == "jobcheck":
+        jobcheck(w, limiter, flags, output)
+        return 0
+    NotebookCheck(w, limiter, flags, output).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
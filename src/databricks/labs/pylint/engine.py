@@ -0,0 +1,122 @@
+import contextlib
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from astroid import nodes
+from pylint.lint import PyLinter
+from pylint.message import Message
+from pylint.reporters import CollectingReporter
+from pylint.typing import FileItem
+from pylint.utils import LinterStats
+
+from databricks.labs.pylint.findings import Finding, Report, module_name
+from databricks.labs.pylint.memory import CacheStats, ModuleCache
+from databricks.labs.pylint.triage import Triage
+
+logger = logging.getLogger(__name__)
+
+ENABLED_MESSAGES = (
+    "missing-data-security-mode",
+    "unsupported-runtime",
+    "dbutils-fs-cp",
+    "dbutils-fs-head",
+    "dbutils-fs-ls",
+    "dbutils-fs-mount",
+    "dbutils-credentials",
+    "dbutils-notebook-run",
+    "pat-token-leaked",
+    "internal-api",
+    "legacy-cli",
+    "incompatible-with-uc",
+    "notebooks-too-many-cells",
+    "notebooks-percent-run",
+    "spark-outside-function",
+    "use-display-instead-of-show",
+    "no-spark-argument-in-function",
+)
+
+
+def _finding(msg: Message) -> Finding:
+    return Finding(msg.path, msg.line, msg.column, msg.msg_id, msg.symbol, msg.msg, msg.confidence.name)
+
+
+class Engine:
+    """Lints sources in-process with a single, warm `PyLinter` that has all the plugin checkers registered.
+
+    Creating the linter, importing checkers and opening them happens once, so that every next notebook
+    pays only for parsing and checking its own source. Modules of linted notebooks are released right
+    after checking them and at most `max_modules` library modules stay cached, so that memory does not
+    grow with the number of notebooks.
+    """
+
+    def __init__(self, enabled: Sequence[str] = ENABLED_MESSAGES, max_modules: int = 256):
+        self._reporter = CollectingReporter()
+        self._linter = PyLinter(reporter=self._reporter)
+        self._linter.load_default_plugins()
+        self._linter.load_plugin_modules(["databricks.labs.pylint.all"])
+        self._linter.set_option("persistent", False)
+        self._linter.disable("all")
+        for msg in enabled:
+            self._linter.enable(msg)
+        self._linter.open()
+        self._linter.initialize()
+        self._stack = contextlib.ExitStack()
+        self._modules = self._stack.enter_context(ModuleCache(max_modules))
+        self._check_astroid_module = self._stack.enter_context(self._linter._astroid_module_checker())
+
+    def lint(self, path: str, source: str) -> Report:
+        modname = module_name(path)
+        self._reporter.reset()
+        self._linter.stats = LinterStats()
+        built: List[nodes.Module] = []
+
+        def get_ast(filepath: str, name: str) -> Optional[nodes.Module]:
+            module = self._linter.get_ast(filepath, name, data=source)
+            if module is not None:
+                built.append(module)
+            return module
+
+        try:
+            self._linter._check_file(get_ast, self._check_astroid_module, FileItem(modname, path, path))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.error(f"failed to lint {path}: {err}")
+        finally:
+            for module in built:
+                self._modules.release(module)
+        findings = [_finding(msg) for msg in self._reporter.messages]
+        return Report(path, modname, findings, self._score(modname))
+
+    def _score(self, modname: str) -> Optional[float]:
+        stats = self._linter.stats
+        if modname not in stats.by_module:
+            return None
+        statement = stats.by_module[modname]["statement"]
+        if statement == 0:
+            return None
+        evaluation = {
+            "fatal": stats.fatal,
+            "error": stats.error,
+            "warning": stats.warning,
+            "refactor": stats.refactor,
+            "convention": stats.convention,
+            "statement": statement,
+            "info": stats.info,
+        }
+        # same expression as the one configured for the `evaluation` option of pylint
+        return eval(self._linter.config.evaluation, {}, evaluation)  # pylint: disable=eval-used
+
+    def cache_stats(self) -> CacheStats:
+        return self._modules.stats()
+
+    def triage_stats(self) -> Dict[str, int]:
+        triage = next(c for c in self._linter.get_checkers() if isinstance(c, Triage))
+        return triage.stats()
+
+    def close(self):
+        self._stack.close()
+
+    def __enter__(self) -> "Engine":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -3,6 +3,8 @@ from eradicate import Eradicator
 from pylint.checkers import BaseRawFileChecker
 from pylint.interfaces import HIGH
 
+from databricks.labs.pylint.source import source_view
+
 
 class EradicateChecker(BaseRawFileChecker):
     name = "eradicate"
@@ -16,16 +18,21 @@ class EradicateChecker(BaseRawFileChecker):
         ),
     }
 
+    # commented out code needs a comment, see `databricks.labs.pylint.triage`
+    trigger_pattern = rb"#"
+
     def open(self) -> None:
         self._eradicator = Eradicator()
 
     def process_module(self, node: astroid.Module):
-        with node.stream() as stream:
-            source = stream.read().decode()
-            lines = source.splitlines()
-            for line_no in self._eradicator.commented_out_code_line_numbers(source):
-                src_line = lines[line_no - 1].strip()
-                self.add_message("dead-code", line=line_no, confidence=HIGH, args=(src_line,))
+        # same as Eradicator.commented_out_code_line_numbers(), over the source shared with other checkers
+        for token in source_view(node).comments:
+            if not token.line.lstrip().startswith("#"):
+                continue
+            if not self._eradicator.comment_contains_code(token.line):
+                continue
+            line_no = token.start[0]
+            self.add_message("dead-code", line=line_no, confidence=HIGH, args=(token.line.strip(),))
 
 
 def register(linter):
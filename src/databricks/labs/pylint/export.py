@@ -0,0 +1,46 @@
+import io
+import logging
+import posixpath
+import zipfile
+from typing import BinaryIO, Iterator, Tuple
+
+from databricks.sdk.service.workspace import Language, ObjectInfo, ObjectType
+
+logger = logging.getLogger(__name__)
+
+NOTEBOOK_HEADER = "# Databricks notebook source"
+
+
+def archive_sources(root: str, archive: BinaryIO) -> Iterator[Tuple[ObjectInfo, str]]:
+    """Yields Python notebooks and `.py` workspace files from a directory exported in `SOURCE` format, which
+    is a zip archive.
+
+    The archive is kept in memory and members are decompressed one at a time, so that nothing is written
+    to disk. Python notebooks are exported as `.py` members starting with the notebook header, and their
+    workspace path is the member name without the extension, relative to the exported directory. Workspace
+    files are exported as they are, so their path keeps the extension.
+    """
+    with zipfile.ZipFile(io.BytesIO(archive.read())) as zf:
+        for member in zf.infolist():
+            if member.is_dir() or not member.filename.endswith(".py"):
+                continue
+            with zf.open(member) as f:
+                raw = f.read()
+            try:
+                source = raw.decode("utf-8")
+            except UnicodeDecodeError as err:
+                logger.error(f"failed to decode {member.filename}: {err}")
+                continue
+            if not source.startswith(NOTEBOOK_HEADER):
+                yield ObjectInfo(path=_workspace_path(root, member.filename), object_type=ObjectType.FILE), source
+                continue
+            path = _workspace_path(root, member.filename[: -len(".py")])
+            yield ObjectInfo(path=path, object_type=ObjectType.NOTEBOOK, language=Language.PYTHON), source
+
+
+def _workspace_path(root: str, name: str) -> str:
+    # archives have the exported directory as the top folder
+    top, _, relative = name.partition("/")
+    if relative and top == posixpath.basename(root.rstrip("/")):
+        name = relative
+    return posixpath.join(root, name)
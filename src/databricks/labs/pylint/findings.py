@@ -0,0 +1,73 @@
+"""Results of linting, as plain data that imports neither pylint nor astroid, so that engines without them
+produce the same reports."""
+
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Finding:
+    path: str
+    line: int
+    column: int
+    msg_id: str
+    symbol: str
+    message: str
+    confidence: str
+
+    def as_text(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}: {self.msg_id}: {self.message} ({self.symbol})"
+
+
+@dataclass
+class Report:
+    path: str
+    module: str
+    findings: List[Finding] = field(default_factory=list)
+    score: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "Report":
+        findings = [Finding(**finding) for finding in raw.get("findings", [])]
+        return cls(raw["path"], raw["module"], findings, raw.get("score"))
+
+    def as_text(self) -> str:
+        """Render the report the same way `pylint` text output does for a single module."""
+        lines = []
+        if self.findings:
+            lines.append(f"************* Module {self.module}")
+            lines.extend(finding.as_text() for finding in self.findings)
+        if self.score is not None:
+            rating = f"Your code has been rated at {self.score:.2f}/10"
+            lines.extend(["", "-" * len(rating), rating, ""])
+        if not lines:
+            return ""
+        return "\n".join(lines) + "\n"
+
+
+def module_name(path: str) -> str:
+    name = os.path.basename(path)
+    # notebooks have no extension, but workspace files do
+    if name.endswith(".py"):
+        name = name[: -len(".py")]
+    # replace non-alphanumeric characters with underscores
+    return re.sub(r"\W+", "_", name)
+
+
+def shorten(text: str, width: Optional[int]) -> str:
+    """Cuts text to `width` characters, ending with `...` where it was cut."""
+    if not width or len(text) <= width:
+        return text
+    return text[: max(width - 3, 0)] + "..."
+
+
+def shorten_repr(value: str, width: Optional[int]) -> str:
+    """Same as `shorten(repr(value), width)`, but without formatting all of a long string first."""
+    if width and len(value) > width:
+        value = value[:width]
+    return shorten(repr(value), width)
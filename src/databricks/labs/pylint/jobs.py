@@ -0,0 +1,108 @@
+import collections
+import contextlib
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.jobs import BaseJob, JobsAPI
+
+from databricks.labs.pylint.airflow import CONFIDENCE, AirflowChecker, check_job_settings
+from databricks.labs.pylint.findings import Finding, Report, module_name
+from databricks.labs.pylint.throttle import AdaptiveLimiter
+
+logger = logging.getLogger(__name__)
+
+# array properties of job settings, that are split into pages of 100 elements
+PAGED_PROPERTIES = ("tasks", "job_clusters", "parameters", "environments")
+
+
+def job_report(job_id: int, settings: Dict[str, Any]) -> Report:
+    """Checks a job definition with the same cluster rules and confidence, that `AirflowChecker` applies to DAG
+    files."""
+    path = f"/jobs/{job_id}"
+    findings = []
+    for symbol, args in check_job_settings(settings):
+        msg_id, (template, *_) = next((k, v) for k, v in AirflowChecker.msgs.items() if v[1] == symbol)
+        findings.append(Finding(path, 0, 0, msg_id, symbol, template % args, CONFIDENCE.name))
+    return Report(path, module_name(settings.get("name") or str(job_id)), findings)
+
+
+class JobScanner:
+    """Streams reports for every job in the workspace, as pages of `jobs/list` arrive.
+
+    Pages are listed with tasks included, so that most jobs are checked without any further requests.
+    Jobs with more than 100 tasks or clusters come back truncated, and their full definitions are fetched
+    by a pool of workers, while the calling thread keeps checking the following jobs. At most `queue_size`
+    jobs are in flight, and reports are produced in the listing order.
+    """
+
+    def __init__(
+        self,
+        w: WorkspaceClient,
+        workers: int = 8,
+        queue_size: int = 32,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if queue_size < workers:
+            raise ValueError("queue_size must not be less than workers")
+        self._w = w
+        self._workers = workers
+        self._queue_size = queue_size
+        self._limiter = limiter
+
+    def run(self) -> Iterator[Report]:
+        in_flight: Deque[Tuple[int, Future]] = collections.deque()
+        with ThreadPoolExecutor(self._workers, thread_name_prefix="jobs") as pool:
+            # the SDK mixin fetches truncated jobs one by one while listing, so the plain API is used instead
+            for job in JobsAPI.list(self._w.jobs, expand_tasks=True, limit=100):
+                in_flight.append((job.job_id, self._submit(pool, job)))
+                if len(in_flight) < self._queue_size:
+                    continue
+                report = self._check_next(in_flight)
+                if report:
+                    yield report
+            while in_flight:
+                report = self._check_next(in_flight)
+                if report:
+                    yield report
+
+    def _submit(self, pool: ThreadPoolExecutor, job: BaseJob) -> Future:
+        if job.has_more:
+            return pool.submit(self._settings, job.job_id)
+        future: Future = Future()
+        future.set_result(job.settings.as_dict() if job.settings else {})
+        return future
+
+    def _settings(self, job_id: int) -> Dict[str, Any]:
+        """Fetches all pages of a job definition and joins their array properties."""
+        settings: Dict[str, Any] = {}
+        page_token = None
+        while True:
+            with self._slot():
+                job = JobsAPI.get(self._w.jobs, job_id, page_token=page_token)
+            page = job.settings.as_dict() if job.settings else {}
+            for key, value in page.items():
+                if key in PAGED_PROPERTIES and key in settings:
+                    settings[key].extend(value)
+                    continue
+                settings.setdefault(key, value)
+            if not job.next_page_token:
+                return settings
+            page_token = job.next_page_token
+
+    def _slot(self):
+        return self._limiter.slot() if self._limiter else contextlib.nullcontext()
+
+    @staticmethod
+    def _check_next(in_flight: Deque[Tuple[int, Future]]) -> Optional[Report]:
+        job_id, future = in_flight.popleft()
+        try:
+            settings = future.result()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.error(f"failed to get job {job_id}: {err}")
+            return None
+        logger.info(f"👀 checking: job {job_id}")
+        return job_report(job_id, settings)
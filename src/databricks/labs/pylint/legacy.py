@@ -1,8 +1,26 @@
 # pylint checker for imports
 
+import functools
+import re
+from typing import Callable
+
 import astroid
 from pylint.checkers import BaseChecker
-from pylint.interfaces import HIGH, INFERENCE
+from pylint.interfaces import CONFIDENCE_LEVELS, UNDEFINED
+
+from databricks.labs.pylint.calls import SourceArg, resolver
+from databricks.labs.pylint.rulebook import (
+    LEGACY_CONFIDENCE,
+    LEGACY_RULES,
+    UC_INCOMPATIBLE_BRUTE_FORCE,
+    RuleIndex,
+    incompatible_with_uc,
+)
+
+# confidence levels by their names in the rulebook
+CONFIDENCE = {
+    symbol: level for level in CONFIDENCE_LEVELS for symbol, name in LEGACY_CONFIDENCE.items() if level.name == name
+}
 
 
 class LegacyChecker(BaseChecker):
@@ -22,82 +40,60 @@ class LegacyChecker(BaseChecker):
         ),
     }
 
-    UC_INCOMPATIBLE_BRUTE_FORCE = {
-        "s3fs",
-        "boto3",
-        "graphframes",
-        "pyspark.ml",
-        # literals
-        "dbfs:",
-        "hive_metastore.",
-        "kafka.sasl.client.callback.handler.class",
-        "kafka.sasl.login.callback.handler.class",
-        "kafka.sasl.login.class",
-        "kafka.partition.assignment.strategy",
-        "kafka.ssl.truststore.location",
-        "kafka.ssl.keystore.location",
-        # calls
-        # "sc.", triggers false positives for "misc."
-        "spark.catalog.",
-        "spark._jsparkSession.catalog",
-        "spark._jspark",
-        "spark._jvm",
-        "._jdf",
-        "._jcol",
-        "spark.udf.registerJavaFunction",
-        "applyInPandas",
-        "mapInPandas",
-        "_jvm",
-        "SQLContext",
-        "emptyRDD",
-        "pickleFile",
-        "textFile",
-        "newAPIHadoopFile",
-        "newAPIHadoopRDD",
-        "hadoopFile",
-        "hadoopRDD",
-        "saveAsHadoopFile",
-        "saveAsHadoopDataset",
-        "saveAsNewAPIHadoopFile",
-        "saveAsNewAPIHadoopDataset",
-        "setJobGroup",
-        "setLocalProperty",
-        "applyInPandasWithState",
-    }
+    options = (
+        (
+            "uc-incompatible-needles",
+            {
+                "default": (),
+                "type": "csv",
+                "metavar": "<needles>",
+                "help": "More substrings of imports, calls and literals that are incompatible with Unity Catalog",
+            },
+        ),
+    )
+
+    UC_INCOMPATIBLE_BRUTE_FORCE = UC_INCOMPATIBLE_BRUTE_FORCE
+
+    # every file with messages of this checker has one of these, see `databricks.labs.pylint.triage`
+    trigger_words = ("databricks_cli", *UC_INCOMPATIBLE_BRUTE_FORCE)
+    trigger_strings = True
+
+    def open(self) -> None:
+        needles = tuple(self.linter.config.uc_incompatible_needles)
+        self._rules = RuleIndex(LEGACY_RULES + incompatible_with_uc(needles))
+        if not needles:
+            return
+        # the checker has to see every file, if any needle has no word to look for
+        if all(re.search(r"\w", needle, re.ASCII) for needle in needles):
+            self.trigger_words = (*self.trigger_words, *needles)
+        else:
+            self.trigger_words = ()
 
     def visit_import(self, node: astroid.Import):
-        # add message if databricks_cli is imported
         for name, _ in node.names:
-            if name.startswith("databricks_cli"):
-                self.add_message("legacy-cli", node=node, confidence=HIGH)
-            # very coarse check for UC incompatibility
-            for needle in self.UC_INCOMPATIBLE_BRUTE_FORCE:
-                if needle in name:
-                    self.add_message("incompatible-with-uc", node=node, args=(node.as_string(),), confidence=INFERENCE)
+            for symbol, args in self._rules.problems("import", name, self._source(node)):
+                self.add_message(symbol, node=node, args=args, confidence=CONFIDENCE[symbol])
 
     def visit_importfrom(self, node: astroid.ImportFrom):
-        if node.modname.startswith("databricks_cli"):
-            self.add_message("legacy-cli", node=node)
-        # very coarse check for UC incompatibility
-        for needle in self.UC_INCOMPATIBLE_BRUTE_FORCE:
-            if needle in node.modname:
-                self.add_message("incompatible-with-uc", node=node, args=(node.as_string(),), confidence=INFERENCE)
+        for symbol, args in self._rules.problems("import", node.modname, self._source(node)):
+            confidence = CONFIDENCE[symbol]
+            if symbol == "legacy-cli":
+                confidence = UNDEFINED
+            self.add_message(symbol, node=node, args=args, confidence=confidence)
 
     def visit_call(self, node: astroid.Call):
-        func_as_string = node.func.as_string()
-        # very coarse check for UC incompatibility
-        for needle in self.UC_INCOMPATIBLE_BRUTE_FORCE:
-            if needle in func_as_string:
-                self.add_message("incompatible-with-uc", node=node, args=(node.as_string(),), confidence=INFERENCE)
+        for symbol, args in self._rules.problems("call", resolver.name(node), self._source(node)):
+            self.add_message(symbol, node=node, args=args, confidence=CONFIDENCE[symbol])
 
     def visit_const(self, node: astroid.Const):
-        # very coarse check for UC incompatibility
-        value = node.value
-        if not isinstance(value, str):
+        if not isinstance(node.value, str):
             return
-        for needle in self.UC_INCOMPATIBLE_BRUTE_FORCE:
-            if needle in value:
-                self.add_message("incompatible-with-uc", node=node, args=(node.as_string(),), confidence=INFERENCE)
+        for symbol, args in self._rules.problems("literal", node.value, self._source(node)):
+            self.add_message(symbol, node=node, args=args, confidence=CONFIDENCE[symbol])
+
+    @staticmethod
+    def _source(node: astroid.NodeNG) -> Callable[[], SourceArg]:
+        return functools.partial(SourceArg, node)
 
 
 def register(linter):
@@ -0,0 +1,357 @@
+"""Lints Python sources for the rules of this plugin that need no inference, without pylint and astroid.
+
+    python -m databricks.labs.pylint.lexical [--jobs N] [--max-cells N] [--disable symbol,...]
+        [--uc-incompatible-needles needle,...] [--message-width N] path ...
+
+Sources are parsed with the standard `ast` module, which takes a fraction of the time of building astroid
+trees, so that whole repositories can be checked in seconds, e.g. as a pre-commit hook. Messages have the same
+ids, lines and columns as the ones of the pylint checkers, which share the rules with this module through
+`databricks.labs.pylint.rulebook`. Only on Python 3.8, which has no `ast.unparse()`, astroid renders the source
+code shown in messages.
+"""
+
+import argparse
+import ast
+import io
+import logging
+import os
+import re
+import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from databricks.labs.pylint.catalog import CHECKERS
+from databricks.labs.pylint.findings import Finding, Report, module_name, shorten, shorten_repr
+from databricks.labs.pylint.rulebook import (
+    DBUTILS_RULES,
+    LEGACY_CONFIDENCE,
+    LEGACY_RULES,
+    RuleIndex,
+    check_notebook,
+    incompatible_with_uc,
+)
+
+if sys.version_info < (3, 9):
+    import astroid
+
+logger = logging.getLogger(__name__)
+
+# messages of the checkers, whose rules are all in the rulebook
+LEXICAL_MESSAGES = tuple(
+    msg[1]
+    for spec in CHECKERS
+    if spec["class"] in {"NotebookChecker", "DbutilsChecker", "LegacyChecker"}
+    for msg in spec["msgs"].values()
+)
+
+# message id and template of every symbol
+MESSAGES = {msg[1]: (msg_id, msg[0]) for spec in CHECKERS for msg_id, msg in spec["msgs"].items()}
+
+PRAGMA = re.compile(r"#\s*pylint:\s*(disable-next|disable|skip-file)\b(?:\s*=\s*([\w\-]+(?:\s*,\s*[\w\-]+)*))?")
+
+SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+DBUTILS_INDEX = RuleIndex(DBUTILS_RULES)
+
+# symbol, line, column, arguments and confidence of a message
+Message = Tuple[str, int, int, Optional[Tuple[Any, ...]], str]
+
+
+def _dotted(node: ast.AST) -> Optional[str]:
+    """Source code of names like `dbutils.fs.ls`, which astroid and `ast` write the same way."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+if sys.version_info < (3, 9):
+
+    def _unparse(node: ast.AST, source: str) -> str:
+        segment = ast.get_source_segment(source, node) or ""
+        try:
+            # parentheses keep expressions spanning lines together
+            return astroid.extract_node(f"({segment})").as_string()
+        except astroid.AstroidSyntaxError:
+            return segment
+
+else:
+
+    def _unparse(node: ast.AST, _: str) -> str:
+        text = ast.unparse(node)
+        if " ** " not in text:
+            return text
+        # astroid writes the power operator without spaces around it, unlike all other binary operators
+        lines = text.split("\n")
+        spaces = []
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(text).readline):
+                if token.string != "**":
+                    continue
+                row, column = token.start
+                # `**` of keyword arguments and dict unpacking has no space after it
+                if token.line[column - 1 : column] == " " and token.line[column + 2 : column + 3] == " ":
+                    spaces.append((row - 1, column))
+        except tokenize.TokenError:
+            return text
+        for row, column in reversed(spaces):
+            line = lines[row]
+            lines[row] = line[: column - 1] + "**" + line[column + 3 :]
+        return "\n".join(lines)
+
+
+def _as_string(node: ast.AST, source: str) -> str:
+    """Same as `as_string()` of the astroid node."""
+    dotted = _dotted(node)
+    if dotted is not None:
+        return dotted
+    return _unparse(node, source)
+
+
+class _SourceArg:
+    """Same as `SourceArg` of `databricks.labs.pylint.calls`, for nodes of the standard `ast` module."""
+
+    __slots__ = ("node", "source", "width")
+
+    def __init__(self, node: ast.AST, source: str, width: int):
+        self.node = node
+        self.source = source
+        self.width = width
+
+    def __str__(self) -> str:
+        node = self.node
+        if self.width and isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return shorten_repr(node.value, self.width)
+        return shorten(_as_string(node, self.source), self.width)
+
+
+class _Visitor:
+    """Applies the rules of the dbutils and legacy checkers to every node of a module, the same way the pylint
+    walker visits astroid nodes, i.e. without docstrings, which astroid keeps out of the tree."""
+
+    def __init__(self, source: str, enabled: FrozenSet[str], legacy_rules: RuleIndex, width: int):
+        self._source = source
+        self._enabled = enabled
+        self._legacy_rules = legacy_rules
+        self._width = width
+        self.messages: List[Message] = []
+        # one message per node, symbol and arguments, as with `databricks.labs.pylint.messages`
+        self._added: Set[Tuple[int, str, Any]] = set()
+        # first and last lines of functions and classes, for the scope of pylint pragmas
+        self.scopes: List[Tuple[int, int]] = []
+
+    def visit(self, tree: ast.Module):
+        docstrings = set()
+        everything = list(ast.walk(tree))
+        for node in everything:
+            if isinstance(node, ast.Constant):
+                # astroid shows u"" strings without the prefix
+                node.kind = None
+        for node in everything:
+            if isinstance(node, (ast.Module, *SCOPES)):
+                docstring = node.body[0] if node.body else None
+                if isinstance(docstring, ast.Expr) and isinstance(docstring.value, ast.Constant):
+                    if isinstance(docstring.value.value, str):
+                        docstrings.add(id(docstring.value))
+                if not isinstance(node, ast.Module):
+                    self.scopes.append((node.lineno, node.end_lineno or node.lineno))
+            if isinstance(node, ast.Call):
+                self._visit_call(node)
+            elif isinstance(node, ast.Constant):
+                if id(node) not in docstrings:
+                    self._visit_constant(node)
+            elif isinstance(node, ast.Import):
+                self._visit_import(node)
+            elif isinstance(node, ast.ImportFrom):
+                self._visit_import_from(node)
+
+    def _add(self, symbol: str, node: ast.AST, args: Optional[Tuple[Any, ...]], confidence: str):
+        key = (id(node), symbol, tuple(id(arg.node) if isinstance(arg, _SourceArg) else arg for arg in args or ()))
+        if symbol not in self._enabled or key in self._added:
+            return
+        self._added.add(key)
+        self.messages.append((symbol, node.lineno, node.col_offset, args, confidence))  # type: ignore[attr-defined]
+
+    def _as_string(self, node: ast.AST) -> Callable[[], "_SourceArg"]:
+        return lambda: _SourceArg(node, self._source, self._width)
+
+    def _visit_call(self, node: ast.Call):
+        func = _as_string(node.func, self._source)
+        self._check(node, "call", func, lambda i: _SourceArg(node.args[i], self._source, self._width))
+
+    def _visit_constant(self, node: ast.Constant):
+        if isinstance(node.value, str):
+            self._check(node, "literal", node.value)
+
+    def _visit_import(self, node: ast.Import):
+        for alias in node.names:
+            self._check(node, "import", alias.name)
+
+    def _visit_import_from(self, node: ast.ImportFrom):
+        self._check(node, "import", node.module or "", from_import=True)
+
+    def _check(
+        self,
+        node: ast.AST,
+        node_type: str,
+        text: str,
+        arg: Optional[Callable[[int], Any]] = None,
+        from_import: bool = False,
+    ):
+        source = self._as_string(node)
+        for symbol, args in DBUTILS_INDEX.problems(node_type, text, source, arg, first=True):
+            self._add(symbol, node, args, "HIGH")
+        for symbol, args in self._legacy_rules.problems(node_type, text, source):
+            confidence = LEGACY_CONFIDENCE[symbol]
+            if from_import and symbol == "legacy-cli":
+                confidence = "UNDEFINED"
+            self._add(symbol, node, args, confidence)
+
+
+class _Pragmas:
+    """Lines where messages are disabled with `# pylint: disable=...` comments: comments after code apply to
+    their line, standalone comments apply until the end of their function, class or module,
+    and `disable-next` applies to the next line. Comments that enable messages again are not supported."""
+
+    def __init__(self, source: str, scopes: List[Tuple[int, int]]):
+        self._ranges: List[Tuple[Set[str], int, int]] = []
+        if "pylint:" not in source:
+            return
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type != tokenize.COMMENT or "pylint:" not in token.string:
+                continue
+            match = PRAGMA.search(token.string)
+            if not match:
+                continue
+            lineno, column = token.start
+            line = token.line
+            kind, names = match.groups()
+            disabled = {name.strip() for name in names.split(",")} if names else {"all"}
+            if kind == "skip-file":
+                self._ranges.append(({"all"}, 1, sys.maxsize))
+            elif kind == "disable-next":
+                self._ranges.append((disabled, lineno + 1, lineno + 1))
+            elif line[:column].strip():
+                self._ranges.append((disabled, lineno, lineno))
+            else:
+                enclosing = [scope for scope in scopes if scope[0] <= lineno <= scope[1]]
+                end = max(enclosing)[1] if enclosing else sys.maxsize
+                self._ranges.append((disabled, lineno, end))
+
+    def is_disabled(self, symbol: str, msg_id: str, line: int) -> bool:
+        for names, first, last in self._ranges:
+            if first <= line <= last and ("all" in names or symbol in names or msg_id in names):
+                return True
+        return False
+
+
+class LexicalEngine:
+    """Same interface as `Engine`, for the messages in `LEXICAL_MESSAGES`, so that it can replace it wherever
+    only these messages are needed. Reports have no score, as pylint computes it from all of its messages."""
+
+    def __init__(
+        self,
+        enabled: Sequence[str] = LEXICAL_MESSAGES,
+        max_cells: int = 75,
+        uc_incompatible_needles: Sequence[str] = (),
+        message_width: int = 200,
+    ):
+        unsupported = set(enabled) - set(LEXICAL_MESSAGES)
+        if unsupported:
+            raise ValueError(f"need inference: {', '.join(sorted(unsupported))}")
+        self._enabled = frozenset(enabled)
+        self._max_cells = max_cells
+        self._legacy_rules = RuleIndex(LEGACY_RULES + incompatible_with_uc(uc_incompatible_needles))
+        self._message_width = message_width
+
+    def lint(self, path: str, source: str) -> Report:
+        tree = ast.parse(source, path)
+        visitor = _Visitor(source, self._enabled, self._legacy_rules, self._message_width)
+        visitor.visit(tree)
+        messages = visitor.messages
+        for symbol, line in check_notebook(io.BytesIO(source.encode("utf-8")), self._max_cells):
+            if symbol in self._enabled:
+                confidence = "CONTROL_FLOW" if symbol == "notebooks-too-many-cells" else "HIGH"
+                messages.append((symbol, line, 0, None, confidence))
+        pragmas = _Pragmas(source, visitor.scopes)
+        findings = []
+        for symbol, line, column, args, confidence in sorted(messages, key=lambda m: (m[1], m[2])):
+            msg_id, template = MESSAGES[symbol]
+            if pragmas.is_disabled(symbol, msg_id, line):
+                continue
+            message = template % args if args is not None else template
+            findings.append(Finding(path, line, column, msg_id, symbol, message, confidence))
+        return Report(path, module_name(path), findings)
+
+
+def _python_files(paths: Sequence[str]) -> Iterator[str]:
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            yield from (os.path.join(root, f) for f in sorted(files) if f.endswith(".py"))
+
+
+def _lint_file(engine: LexicalEngine, path: str) -> Optional[Report]:
+    try:
+        with open(path, "rb") as f:
+            # same decoding as Python, with the encoding declaration of the file
+            encoding, _ = tokenize.detect_encoding(f.readline)
+            f.seek(0)
+            source = f.read().decode(encoding)
+        return engine.lint(path, source)
+    except (OSError, SyntaxError, ValueError) as err:
+        logger.error(f"failed to lint {path}: {err}")
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Python files or directories with them")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="processes to lint in, 0 for one per CPU")
+    parser.add_argument("--max-cells", type=int, default=75, help="maximum number of cells in a notebook")
+    parser.add_argument("--disable", default="", help="comma-separated symbols of messages to skip")
+    parser.add_argument(
+        "--uc-incompatible-needles",
+        default="",
+        help="comma-separated substrings of imports, calls and literals that are incompatible with Unity Catalog",
+    )
+    parser.add_argument(
+        "--message-width", type=int, default=200, help="longest source code shown in messages, 0 for no limit"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO, format="%(message)s")
+    disabled = {symbol.strip() for symbol in args.disable.split(",")}
+    needles = [needle.strip() for needle in args.uc_incompatible_needles.split(",") if needle.strip()]
+    engine = LexicalEngine(
+        [m for m in LEXICAL_MESSAGES if m not in disabled], args.max_cells, needles, args.message_width
+    )
+    files = list(_python_files(args.paths))
+    if args.jobs == 1:
+        return 1 if _print(_lint_file(engine, path) for path in files) else 0
+    workers = args.jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        chunksize = max(1, len(files) // (workers * 4))
+        failed = _print(pool.map(_lint_file, [engine] * len(files), files, chunksize=chunksize))
+    return 1 if failed else 0
+
+
+def _print(reports: Iterable[Optional[Report]]) -> bool:
+    failed = False
+    for report in reports:
+        if report is None or report.findings:
+            failed = True
+        if report:
+            sys.stdout.write(report.as_text())
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
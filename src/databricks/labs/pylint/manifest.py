@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from databricks.sdk.service.workspace import ObjectInfo
+
+from databricks.labs.pylint.__about__ import __version__
+from databricks.labs.pylint.findings import Report
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def write_atomically(path: Path, payload: Any):
+    """Writes JSON to a temporary file next to `path` and renames it, so that readers never see partial data."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, prefix=f".{path.name}.", delete=False) as f:
+        json.dump(payload, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(f.name, path)
+
+
+class Manifest:
+    """Local record of the notebooks linted by previous scans and the findings they produced.
+
+    Notebooks with the same `object_id` and `modified_at` are neither downloaded nor linted again,
+    while notebooks that were modified but have the same content only skip the linting.
+    Entries written by a different version of the plugin are ignored, as their findings may be stale.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        if not path.exists():
+            return
+        try:
+            with path.open() as f:
+                raw = json.load(f)
+        except ValueError as err:
+            logger.warning(f"ignoring corrupted manifest {path}: {err}")
+            return
+        if raw.get("version") != __version__:
+            logger.info(f"ignoring manifest {path} from version {raw.get('version')}")
+            return
+        self._entries = raw.get("entries", {})
+
+    def lookup(self, info: ObjectInfo) -> Optional[Report]:
+        entry = self._entries.get(info.path)
+        if not entry:
+            return None
+        if entry["object_id"] != info.object_id or entry["modified_at"] != info.modified_at:
+            return None
+        self._seen.add(info.path)
+        return Report.from_dict(entry["report"])
+
+    def lookup_content(self, info: ObjectInfo, sha256: str) -> Optional[Report]:
+        entry = self._entries.get(info.path)
+        if not entry or entry["sha256"] != sha256:
+            return None
+        report = Report.from_dict(entry["report"])
+        self.record(info, sha256, report)
+        return report
+
+    def record(self, info: ObjectInfo, sha256: str, report: Report):
+        self._seen.add(info.path)
+        self._entries[info.path] = {
+            "object_id": info.object_id,
+            "modified_at": info.modified_at,
+            "sha256": sha256,
+            "report": report.as_dict(),
+        }
+
+    def keep(self, path: str):
+        """Keeps the entry of a notebook that this scan did not look up, e.g. because its report came from the
+        journal of a resumed scan."""
+        self._seen.add(path)
+
+    def prune(self, root: str, owns: Optional[Callable[[str], bool]] = None):
+        """Forgets notebooks under `root` that were not seen by this scan, e.g. because they were deleted. Scans of
+        a shard pass `owns` of the shard, so that the entries of other shards in the same manifest are kept."""
+        prefix = root.rstrip("/") + "/"
+        for path in list(self._entries):
+            if path in self._seen:
+                continue
+            if owns is not None and not owns(path):
+                continue
+            if path == root or path.startswith(prefix):
+                del self._entries[path]
+
+    def save(self):
+        write_atomically(self._path, {"version": __version__, "entries": self._entries})
@@ -0,0 +1,147 @@
+import collections
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from astroid import MANAGER, nodes
+from astroid.inference_tip import clear_inference_tip_cache
+from astroid.manager import AstroidManager
+
+try:
+    # astroid has no public way to drop inference results without rebuilding builtins as `clear_cache()` does,
+    # and the results hold references to nodes of every linted source
+    from astroid.context import _invalidate_cache
+except ImportError:  # older astroid without a global inference cache
+
+    def _invalidate_cache():
+        pass
+
+
+logger = logging.getLogger(__name__)
+
+# modules that astroid needs for every inference and are expensive to rebuild
+PINNED = frozenset({"builtins", "typing", "collections", "abc", "functools", "sys", "os"})
+
+
+@dataclass
+class CacheStats:
+    modules: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self):
+        return (
+            f"modules={self.modules} hits={self.hits} misses={self.misses} "
+            f"evictions={self.evictions} hit_rate={self.hit_rate:.1%}"
+        )
+
+
+class _LruModules(collections.OrderedDict):
+    """Drop-in replacement for the `astroid_cache` dictionary of the astroid manager, that keeps at most
+    `max_modules` modules, evicting the least recently used ones first."""
+
+    def __init__(self, max_modules: int, pinned: Set[str]):
+        super().__init__()
+        self.max_modules = max_modules
+        self.pinned = pinned
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, modname: str) -> nodes.Module:
+        module = super().__getitem__(modname)
+        self.hits += 1
+        self.move_to_end(modname)
+        return module
+
+    def __setitem__(self, modname: str, module: nodes.Module):
+        if modname not in self:
+            self.misses += 1
+        super().__setitem__(modname, module)
+        self.move_to_end(modname)
+        self._evict()
+
+    def seed(self, modules: Dict[str, nodes.Module]):
+        """Adds modules that were built before the cache was installed, without counting them as misses."""
+        for modname, module in modules.items():
+            super().__setitem__(modname, module)
+        self._evict()
+
+    def setdefault(self, modname: str, module: nodes.Module) -> nodes.Module:  # type: ignore[override]
+        if modname in self:
+            return self[modname]
+        self[modname] = module
+        return module
+
+    def _evict(self):
+        if len(self) <= self.max_modules:
+            return
+        for modname in list(self.keys()):
+            if len(self) <= self.max_modules:
+                return
+            if modname in self.pinned:
+                continue
+            super().__delitem__(modname)
+            self.evictions += 1
+
+
+class ModuleCache:
+    """Bounds memory of astroid when a single process lints an unbounded number of sources.
+
+    Astroid keeps every parsed module in the global cache of its manager, and every inference result in a
+    global dictionary, so a long-running linter grows with every notebook it checks. While installed, the
+    module cache holds at most `max_modules` library modules, like `pyspark` or `databricks.sdk`, and
+    evicts the least recently used ones. `release` drops the module of a linted source together with the
+    inference results, which hold references to its nodes.
+    """
+
+    def __init__(self, max_modules: int = 256, manager: AstroidManager = MANAGER):
+        if max_modules < 1:
+            raise ValueError("max_modules must be positive")
+        self._max_modules = max_modules
+        self._manager = manager
+        self._modules: Optional[_LruModules] = None
+
+    def install(self):
+        modules = _LruModules(self._max_modules, set(PINNED) | set(self._manager.astroid_cache))
+        modules.seed(self._manager.astroid_cache)
+        self._swap(modules)
+        self._modules = modules
+
+    def uninstall(self):
+        if self._modules is None:
+            return
+        self._swap(dict(self._modules.items()))
+        self._modules = None
+
+    def _swap(self, modules: dict):
+        # the manager is a borg: new instances pick the cache up from the shared brain
+        AstroidManager.brain["astroid_cache"] = modules
+        self._manager.astroid_cache = modules
+
+    def release(self, module: nodes.Module):
+        """Forgets everything about a module that was built from the source of a single unit of work."""
+        cache = self._manager.astroid_cache
+        if dict.get(cache, module.name) is module:
+            del cache[module.name]
+        _invalidate_cache()
+        clear_inference_tip_cache()
+
+    def stats(self) -> CacheStats:
+        modules = self._modules
+        if modules is None:
+            return CacheStats(len(self._manager.astroid_cache), 0, 0, 0)
+        return CacheStats(len(modules), modules.hits, modules.misses, modules.evictions)
+
+    def __enter__(self) -> "ModuleCache":
+        self.install()
+        return self
+
+    def __exit__(self, *_):
+        self.uninstall()
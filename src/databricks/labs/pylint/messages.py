@@ -0,0 +1,82 @@
+import functools
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from astroid import nodes
+from pylint.checkers import BaseChecker
+
+from databricks.labs.pylint.cache import message_arguments
+from databricks.labs.pylint.calls import SourceArg, shorten
+
+
+class MessageFilter(BaseChecker):
+    """Keeps messages of this plugin's checkers short and unique: a node gets at most one message per symbol and
+    arguments, and arguments are cut to `message-width` characters, so that a long SQL literal matching several
+    rules is shown once and not in full. Source code of nodes in `SourceArg` arguments is cut before it is rendered.
+
+    It has no messages, so pylint never opens it, and the checkers registered by `databricks.labs.pylint.all`
+    hand themselves over to `guard()` instead.
+    """
+
+    name = "databricks-messages"
+    msgs: Dict[str, Any] = {}
+    options = (
+        (
+            "message-width",
+            {
+                "default": 200,
+                "type": "int",
+                "metavar": "<characters>",
+                "help": "Longest source code shown in messages of Databricks checkers, 0 for no limit",
+            },
+        ),
+    )
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self._module: Optional[nodes.Module] = None
+        self._added: Set[Tuple[int, str, Any]] = set()
+
+    def guard(self, checker: BaseChecker):
+        """Makes an opened checker add one message per node, symbol and arguments, with arguments cut to the
+        width."""
+        checker.add_message = self._filtering(checker.add_message)
+
+    def _filtering(self, add_message: Callable[..., None]) -> Callable[..., None]:
+        @functools.wraps(add_message)
+        def filtering(*args, **kwargs):
+            message = message_arguments(args, kwargs)
+            node = message.get("node")
+            if node is not None:
+                module = node.root()
+                if module is not self._module:
+                    self._module = module
+                    self._added = set()
+                # nodes are alive for as long as their module, so their ids are not reused before it changes
+                key = (id(node), message["msgid"], _identity(message.get("args")))
+                if key in self._added:
+                    return
+                self._added.add(key)
+            message["args"] = self._shortened(message.get("args"))
+            add_message(**message)
+
+        return filtering
+
+    def _shortened(self, args: Any) -> Any:
+        width = self.linter.config.message_width
+        if isinstance(args, tuple):
+            return tuple(self._shortened(arg) for arg in args)
+        if isinstance(args, SourceArg):
+            return SourceArg(args.node, width)
+        if isinstance(args, str):
+            return shorten(args, width)
+        return args
+
+
+def _identity(args: Any) -> Any:
+    """Arguments of a message, with the nodes of `SourceArg` instead of their source code, so that messages with the
+    same arguments are told apart without rendering them."""
+    if isinstance(args, tuple):
+        return tuple(_identity(arg) for arg in args)
+    if isinstance(args, SourceArg):
+        return SourceArg, id(args.node)
+    return args
@@ -1,6 +1,11 @@
+import collections
+from typing import Dict, List, Optional, Tuple
+
 from astroid import nodes  # type: ignore
 from pylint.checkers import BaseChecker
 
+from databricks.labs.pylint.calls import SourceArg, resolver
+
 DOC_EXPLICIT_DEPENDENCY_REQUIRED = """Using `patch` to mock dependencies in unit tests can introduce implicit 
 dependencies within a class, making it unclear to other developers. Constructor arguments, on the other hand, 
 explicitly declare dependencies, enhancing code readability and maintainability. However, reliance on `patch` 
@@ -29,6 +34,64 @@ maintainable unit tests. Moreover, reliance on `MagicMock` for testing leads to
 as updates to underlying implementations would necessitate changes across multiple unrelated unit tests."""
 
 
+# attributes, that make a mock useful in a test
+USAGES = ("return_value", "side_effect")
+
+# position of a node in the source code
+Position = Tuple[int, int]
+
+
+def _chain(node: nodes.NodeNG) -> Optional[List[str]]:
+    """Names of an attribute chain like `self.ws.jobs`, or `None` for other expressions."""
+    names = []
+    while isinstance(node, (nodes.Attribute, nodes.AssignAttr)):
+        names.append(node.attrname)
+        node = node.expr
+    if not isinstance(node, (nodes.Name, nodes.AssignName)):
+        return None
+    names.append(node.name)
+    return names[::-1]
+
+
+class MockUsages:
+    """Assertions, return values and side effects of every variable and attribute chain of a scope, including the
+    ones in nested blocks and functions, indexed in one pass over the scope. A usage belongs to the latest assignment
+    of the variable before it, so that a variable assigned again is not used by the usages of the new value."""
+
+    def __init__(self, scope: nodes.LocalsDictNodeNG):
+        # assignments and usages of every variable, with `True` for usages
+        events: Dict[str, List[Tuple[Position, bool]]] = collections.defaultdict(list)
+        for node in scope.nodes_of_class((nodes.AssignName, nodes.AssignAttr, nodes.Attribute)):
+            position = (node.lineno, node.col_offset)
+            chain = _chain(node)
+            if chain is None:
+                continue
+            if isinstance(node, (nodes.AssignName, nodes.AssignAttr)) and node.scope() is scope:
+                events[".".join(chain)].append((position, False))
+            if isinstance(node, nodes.AssignName) or not (chain[-1].startswith("assert") or chain[-1] in USAGES):
+                continue
+            # the mock may be any variable or attribute, that the usage is on
+            for i in range(1, len(chain)):
+                events[".".join(chain[:i])].append((position, True))
+        self._used: Dict[Tuple[str, Position], bool] = {}
+        for variable, found in events.items():
+            found.sort()
+            assigned: Optional[Position] = None
+            for position, usage in found:
+                if not usage:
+                    assigned = position
+                    self._used[variable, position] = False
+                elif assigned:
+                    self._used[variable, assigned] = True
+
+    def used(self, target: nodes.NodeNG) -> bool:
+        """Whether the value assigned to the target is used later on."""
+        chain = _chain(target)
+        if chain is None:
+            return False
+        return self._used.get((".".join(chain), (target.lineno, target.col_offset)), False)
+
+
 class MockingChecker(BaseChecker):
     name = "mocking"
     msgs = {
@@ -67,21 +130,29 @@ class MockingChecker(BaseChecker):
         ),
     )
 
+    # every file with messages of this checker has one of these, see `databricks.labs.pylint.triage`
+    trigger_words = ("MagicMock", "create_autospec", "patch")
+
     def open(self) -> None:
         self._require_explicit_dependency = self.linter.config.require_explicit_dependency
+        self._usages: Dict[nodes.LocalsDictNodeNG, MockUsages] = {}
+
+    def visit_module(self, _: nodes.Module):
+        # usages are indexed once per scope, and forgotten with the module
+        self._usages.clear()
 
     def visit_call(self, node: nodes.Call) -> None:
         # this also means that rare cases, like MagicMock(side_effect=...) are fine
-        if node.as_string() == "MagicMock()":
+        if not node.args and not node.keywords and resolver.name(node) == "MagicMock":
             # here we can go and figure out the expected type of the object being mocked based on the arguments
             # where it is being assigned to, but that is a bit too much for this check. Other people can add this later.
             self.add_message("obscure-mock", node=node)
-        if node.func.as_string() == "create_autospec" and self._no_mock_usage(node):
+        if resolver.name(node) == "create_autospec" and self._no_mock_usage(node):
             return
         if not node.args:
             return
-        if self._require_explicit_dependency and node.func.as_string() in {"mocker.patch", "patch"}:
-            argument_value = node.args[0].as_string()
+        if self._require_explicit_dependency and resolver.name(node) in {"mocker.patch", "patch"}:
+            argument_value = resolver.arg(node, 0)
             no_quotes = argument_value.strip("'\"")
             for module in self._require_explicit_dependency:
                 if not no_quotes.startswith(module):
@@ -91,31 +162,18 @@ class MockingChecker(BaseChecker):
     def _no_mock_usage(self, node: nodes.Call) -> bool:
         assignment = node.parent
         if not isinstance(assignment, nodes.Assign):
-            self.add_message("mock-no-assign", node=node, args=node.as_string())
+            self.add_message("mock-no-assign", node=node, args=SourceArg(node))
             return True
         if not assignment.targets:
-            self.add_message("mock-no-assign", node=node, args=assignment.as_string())
+            self.add_message("mock-no-assign", node=node, args=SourceArg(assignment))
             return True
-        mocked_type = node.args[0].as_string()
-        variable = assignment.targets[0].as_string()
-        has_assertion = False
-        has_return_value = False
-        for statement in assignment.parent.get_children():
-            statement_str = statement.as_string()
-            if not statement_str.startswith(f"{variable}."):
-                # this is not a method call on the variable we are interested in
-                continue
-            if ".assert" in statement_str:
-                has_assertion = True
-                break
-            if ".return_value" in statement_str:
-                has_return_value = True
-                break
-            if ".side_effect" in statement_str:
-                has_return_value = True
-                break
-        if not has_assertion and not has_return_value:
-            self.add_message("mock-no-usage", node=node, args=mocked_type)
+        scope = assignment.scope()
+        usages = self._usages.get(scope)
+        if usages is None:
+            usages = MockUsages(scope)
+            self._usages[scope] = usages
+        if not usages.used(assignment.targets[0]):
+            self.add_message("mock-no-usage", node=node, args=SourceArg(node.args[0]))
             return True
         return False
 
@@ -2,6 +2,9 @@ import astroid
 from pylint.checkers import BaseRawFileChecker
 from pylint.interfaces import CONTROL_FLOW, HIGH
 
+from databricks.labs.pylint.rulebook import check_notebook
+from databricks.labs.pylint.source import source_view
+
 
 class NotebookChecker(BaseRawFileChecker):
     __implements__ = (BaseRawFileChecker,)
@@ -35,6 +38,9 @@ class NotebookChecker(BaseRawFileChecker):
         ),
     )
 
+    # only notebooks have messages of this checker, see `databricks.labs.pylint.triage`
+    trigger_pattern = rb"\A# Databricks notebook source\n"
+
     def process_module(self, node: astroid.Module):
         """Read raw module. Need to do some tricks, as `ast` doesn't provide access for comments.
 
@@ -45,22 +51,9 @@ class NotebookChecker(BaseRawFileChecker):
         - https://github.com/facebookincubator/bowler (MIT), abandoned
         - https://github.com/PyCQA/redbaron (LGPLv3)
         """
-        cells = 1
-        too_many_cells_raised = False
-        with node.stream() as stream:
-            for lineno, line in enumerate(stream):
-                lineno += 1
-                if lineno == 1 and line != b"# Databricks notebook source\n":
-                    # this is not a Databricks notebook
-                    return
-                if line == b"# COMMAND ----------\n":
-                    cells += 1
-                if cells > self.linter.config.max_cells and not too_many_cells_raised:
-                    self.add_message("notebooks-too-many-cells", line=lineno + 1, confidence=CONTROL_FLOW)
-                    too_many_cells_raised = True
-                    continue
-                if line.startswith(b"# MAGIC %run"):
-                    self.add_message("notebooks-percent-run", line=lineno, confidence=HIGH)
+        for symbol, line in check_notebook(source_view(node).lines(), self.linter.config.max_cells):
+            confidence = CONTROL_FLOW if symbol == "notebooks-too-many-cells" else HIGH
+            self.add_message(symbol, line=line, confidence=confidence)
 
 
 def register(linter):
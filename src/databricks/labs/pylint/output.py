@@ -0,0 +1,68 @@
+import collections
+import json
+import posixpath
+import sys
+from typing import Counter, Optional, TextIO
+
+from databricks.labs.pylint.findings import Report
+
+
+class TextOutput:
+    """Prints reports the same way as `pylint` does."""
+
+    def __init__(self, out: Optional[TextIO] = None):
+        self._out = out or sys.stdout
+
+    def write(self, report: Report):
+        self._out.write(report.as_text())
+
+    def close(self):
+        self._out.flush()
+
+
+class JsonLinesOutput:
+    """Prints one JSON record per finding as soon as it is produced, followed by a single summary record.
+
+    Only counters are kept between reports, so memory does not grow with the number of scanned notebooks.
+    """
+
+    def __init__(self, out: Optional[TextIO] = None):
+        self._out = out or sys.stdout
+        self._notebooks = 0
+        self._findings = 0
+        self._by_symbol: Counter[str] = collections.Counter()
+        self._by_directory: Counter[str] = collections.Counter()
+
+    def write(self, report: Report):
+        self._notebooks += 1
+        directory = posixpath.dirname(report.path)
+        for finding in report.findings:
+            record = {
+                "type": "finding",
+                "path": report.path,
+                "msg_id": finding.msg_id,
+                "symbol": finding.symbol,
+                "line": finding.line,
+                "column": finding.column,
+                "confidence": finding.confidence,
+                "message": finding.message,
+            }
+            self._out.write(json.dumps(record) + "\n")
+            self._findings += 1
+            self._by_symbol[finding.symbol] += 1
+            self._by_directory[directory] += 1
+        self._out.flush()
+
+    def close(self):
+        summary = {
+            "type": "summary",
+            "notebooks": self._notebooks,
+            "findings": self._findings,
+            "by_symbol": dict(self._by_symbol.most_common()),
+            "by_directory": dict(self._by_directory.most_common()),
+        }
+        self._out.write(json.dumps(summary) + "\n")
+        self._out.flush()
+
+
+OUTPUTS = {"text": TextOutput, "jsonl": JsonLinesOutput}
@@ -0,0 +1,92 @@
+import collections
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+from databricks.sdk.service.workspace import ObjectInfo
+
+from databricks.labs.pylint.findings import Report
+from databricks.labs.pylint.manifest import Manifest, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+class Pipeline:
+    """Downloads notebooks with a pool of workers, while linting already downloaded ones in the calling thread.
+
+    At most `queue_size` notebooks are downloaded ahead of the linter, so that memory stays bounded
+    regardless of the workspace size. Reports are produced in the same order as the incoming objects.
+    With a manifest, unchanged notebooks are replayed from the previous scan instead.
+    """
+
+    def __init__(
+        self,
+        download: Callable[[ObjectInfo], str],
+        lint: Callable[[str, str], Report],
+        download_workers: int = 8,
+        queue_size: int = 32,
+        manifest: Optional[Manifest] = None,
+    ):
+        if download_workers < 1:
+            raise ValueError("download_workers must be positive")
+        if queue_size < download_workers:
+            raise ValueError("queue_size must not be less than download_workers")
+        self._download = download
+        self._lint = lint
+        self._download_workers = download_workers
+        self._queue_size = queue_size
+        self._manifest = manifest
+
+    def run(self, objects: Iterable[ObjectInfo]) -> Iterator[Report]:
+        in_flight: Deque[Tuple[ObjectInfo, Future]] = collections.deque()
+        with ThreadPoolExecutor(self._download_workers, thread_name_prefix="download") as pool:
+            for info in objects:
+                in_flight.append((info, self._submit(pool, info)))
+                if len(in_flight) < self._queue_size:
+                    continue
+                report = self._lint_next(in_flight)
+                if report:
+                    yield report
+            while in_flight:
+                report = self._lint_next(in_flight)
+                if report:
+                    yield report
+
+    def run_sources(self, sources: Iterable[Tuple[ObjectInfo, str]]) -> Iterator[Report]:
+        """Lints notebooks that were already fetched, e.g. from a directory archive."""
+        for info, source in sources:
+            yield self._check(info, source)
+
+    def _submit(self, pool: ThreadPoolExecutor, info: ObjectInfo) -> Future:
+        cached = self._manifest.lookup(info) if self._manifest else None
+        if not cached:
+            return pool.submit(self._download, info)
+        logger.info(f"⏩ unchanged: {info.path}")
+        future: Future = Future()
+        future.set_result(cached)
+        return future
+
+    def _lint_next(self, in_flight: Deque[Tuple[ObjectInfo, Future]]) -> Optional[Report]:
+        info, future = in_flight.popleft()
+        try:
+            source = future.result()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.error(f"failed to download {info.path}: {err}")
+            return None
+        if isinstance(source, Report):
+            return source
+        return self._check(info, source)
+
+    def _check(self, info: ObjectInfo, source: str) -> Report:
+        if not self._manifest:
+            logger.info(f"👀 checking: {info.path}")
+            return self._lint(info.path, source)
+        sha256 = content_hash(source)
+        cached = self._manifest.lookup_content(info, sha256)
+        if cached:
+            logger.info(f"⏩ same content: {info.path}")
+            return cached
+        logger.info(f"👀 checking: {info.path}")
+        report = self._lint(info.path, source)
+        self._manifest.record(info, sha256, report)
+        return report
@@ -14,6 +14,9 @@ class ReadabilityChecker(BaseChecker):
         ),
     }
 
+    # every file with messages of this checker has one of these, see `databricks.labs.pylint.triage`
+    trigger_words = ("for",)
+
     def visit_listcomp(self, node: nodes.ListComp) -> None:
         if node.lineno != node.end_lineno:
             self.add_message("rewrite-as-for-loop", node=node)
@@ -0,0 +1,284 @@
+"""Rules of the checkers that need no inference, and the index matching them, which import neither pylint nor
+astroid, so that `databricks.labs.pylint.lexical` shares them with the checkers without their start-up time."""
+
+import collections
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# calls are matched by the source code of the called function, imports by module names, literals by string values
+NODE_TYPES = ("call", "import", "literal")
+MATCHES = ("equals", "prefix", "suffix", "contains")
+
+# symbol of the message and its arguments, if any
+Problem = Tuple[str, Optional[Tuple[Any, ...]]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Adds a message for nodes of a type, whose text matches the pattern.
+
+    Arguments of the message are `node` for the source code of the node, `argN` for the source code of the N-th
+    positional argument of a call, or the `message` of a custom rule. Source code comes from callbacks, that may
+    return objects formatting it only when the message is.
+    """
+
+    symbol: str
+    node: str
+    match: str
+    pattern: str
+    args: Tuple[str, ...] = ()
+    message: Optional[str] = None
+
+    def args_of(self, arg: Callable[[int], Any], node: Callable[[], Any]) -> Optional[Tuple[Any, ...]]:
+        if self.message is not None:
+            return (self.message,)
+        rendered = tuple(node() if name == "node" else arg(int(name[len("arg") :])) for name in self.args)
+        return rendered or None
+
+
+class Automaton:
+    """Aho-Corasick automaton, that finds all needles in a text in one pass over it, so that the time to search does
+    not grow with the number of needles. Transitions that fall back to the root state are not stored, so that the
+    automaton stays as small as the trie of the needles, even for large alphabets. Texts are searched with one
+    substring test per needle instead, when that takes less time."""
+
+    def __init__(self, needles: Sequence[str]):
+        self.needles = list(needles)
+        goto: List[Dict[str, int]] = [{}]
+        found: List[Tuple[int, ...]] = [()]
+        for i, needle in enumerate(self.needles):
+            state = 0
+            for char in needle:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    found.append(())
+                state = following
+            found[state] += (i,)
+        # transitions of every state include the ones of its fail state, except for the root state
+        self._delta = [dict(transitions) for transitions in goto]
+        self._root = goto[0]
+        fail = [0] * len(goto)
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in goto[state].items():
+                queue.append(following)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[following] = goto[fallback].get(char, 0) if state else 0
+                found[following] += found[fail[following]]
+                if fail[following]:
+                    self._delta[following] = {**self._delta[fail[following]], **goto[following]}
+        self._found: List[Optional[Tuple[int, ...]]] = [indexes or None for indexes in found]
+
+    def find(self, text: str) -> List[int]:
+        """Indexes of the needles found in the text, in the order of the needles."""
+        # substring tests run in C, so they are faster for a few needles, see `scripts/bench_needles.py`
+        if len(self.needles) * (len(text) + 136) < 242 * (len(text) + 12):
+            return [i for i, needle in enumerate(self.needles) if needle in text]
+        return self.scan(text)
+
+    def scan(self, text: str) -> List[int]:
+        """Same as `find()`, but always with the automaton."""
+        delta, root, found = self._delta, self._root, self._found
+        matched = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char) or root.get(char, 0)
+            needles = found[state]
+            if needles:
+                matched.update(needles)
+        return sorted(matched)
+
+
+_Entries = List[Tuple[int, Rule]]
+
+
+def _no_args(index: int) -> Any:
+    raise IndexError(f"no positional argument {index}")
+
+
+class RuleIndex:
+    """Rules compiled into lookups per node type: a hash lookup for equal texts, one per distinct length of
+    prefixes and suffixes, and an automaton for substrings, so that the cost of matching does not grow with the
+    number of rules. Matches come in the order of the rules."""
+
+    def __init__(self, rules: Iterable[Rule]):
+        self._equals: Dict[str, Dict[str, _Entries]] = {node: {} for node in NODE_TYPES}
+        self._prefixes: Dict[str, Dict[int, Dict[str, _Entries]]] = {node: {} for node in NODE_TYPES}
+        self._suffixes: Dict[str, Dict[int, Dict[str, _Entries]]] = {node: {} for node in NODE_TYPES}
+        self._contains: Dict[str, _Entries] = {node: [] for node in NODE_TYPES}
+        self.rules = list(rules)
+        for order, rule in enumerate(self.rules):
+            entry = (order, rule)
+            if rule.match == "equals":
+                self._equals[rule.node].setdefault(rule.pattern, []).append(entry)
+            elif rule.match == "prefix":
+                by_length = self._prefixes[rule.node].setdefault(len(rule.pattern), {})
+                by_length.setdefault(rule.pattern, []).append(entry)
+            elif rule.match == "suffix":
+                by_length = self._suffixes[rule.node].setdefault(len(rule.pattern), {})
+                by_length.setdefault(rule.pattern, []).append(entry)
+            else:
+                self._contains[rule.node].append(entry)
+        self._automata = {
+            node: Automaton([rule.pattern for _, rule in entries]) for node, entries in self._contains.items()
+        }
+
+    def match(self, node: str, text: str) -> List[Rule]:
+        found = list(self._equals[node].get(text, ()))
+        for length, prefixes in self._prefixes[node].items():
+            if length <= len(text):
+                found.extend(prefixes.get(text[:length], ()))
+        for length, suffixes in self._suffixes[node].items():
+            if length <= len(text):
+                found.extend(suffixes.get(text[len(text) - length :], ()))
+        contains = self._contains[node]
+        if contains:
+            found.extend(contains[i] for i in self._automata[node].find(text))
+        found.sort(key=lambda entry: entry[0])
+        return [rule for _, rule in found]
+
+    def problems(
+        self,
+        node_type: str,
+        text: str,
+        node: Callable[[], Any],
+        arg: Optional[Callable[[int], Any]] = None,
+        first: bool = False,
+    ) -> Iterator[Problem]:
+        """Messages for the text of a node, from all matching rules or only from the first one, with one message
+        per symbol and arguments, e.g. one for all needles found in a literal, but one for every custom rule with
+        its own message. The source code of the node and of call arguments is asked for only by the rules needing
+        it."""
+        matched = self.match(node_type, text)
+        seen = set()
+        for rule in matched[:1] if first else matched:
+            key = (rule.symbol, rule.args, rule.message)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield rule.symbol, rule.args_of(arg or _no_args, node)
+
+
+# rules of `databricks.labs.pylint.dbutils`
+MOUNT_CALLS = (
+    "dbutils.fs.mount",
+    "dbutils.fs.mounts",
+    "dbutils.fs.unmount",
+    "dbutils.fs.updateMount",
+    "dbutils.fs.refreshMounts",
+)
+
+# only the first matching rule applies to a node, so their order matters
+DBUTILS_RULES = (
+    # add message if dbutils.fs.cp() is used
+    Rule("dbutils-fs-cp", "call", "equals", "dbutils.fs.cp", args=("arg0", "arg1")),
+    # add message if dbutils.fs.head() is used
+    Rule("dbutils-fs-head", "call", "equals", "dbutils.fs.head", args=("arg0",)),
+    # add message if dbutils.fs.ls("/tmp") is used
+    Rule("dbutils-fs-ls", "call", "equals", "dbutils.fs.ls", args=("arg0",)),
+    # add message if dbutils.fs.mount("s3a://%s" % aws_bucket_name, "/mnt/%s" % mount_name) is used
+    *(Rule("dbutils-fs-mount", "call", "equals", name) for name in MOUNT_CALLS),
+    # add message if dbutils.credentials.* is used
+    Rule("dbutils-credentials", "call", "prefix", "dbutils.credentials."),
+    # add message if dbutils.notebook.run("My Other Notebook", 60) is used
+    Rule("dbutils-notebook-run", "call", "equals", "dbutils.notebook.run", args=("arg0", "arg1")),
+    Rule("internal-api", "call", "suffix", "getDbutils", args=("node",)),
+    Rule("internal-api", "call", "contains", ".notebook().getContext()", args=("node",)),
+    Rule("internal-api", "call", "contains", ".notebook.entry_point", args=("node",)),
+    Rule("internal-api", "call", "contains", ".apiToken", args=("node",)),
+    # add a message if dbruntime is imported
+    Rule("internal-api", "import", "prefix", "dbruntime", args=("node",)),
+    # add a message if string matches dapi[0-9a-f]{32}, dkea[0-9a-f]{32}, or dosa[0-9a-f]{32}
+    *(Rule("pat-token-leaked", "literal", "prefix", prefix) for prefix in ("dapi", "dkea", "dosa")),
+)
+
+
+# rules of `databricks.labs.pylint.legacy`
+UC_INCOMPATIBLE_BRUTE_FORCE = {
+    "s3fs",
+    "boto3",
+    "graphframes",
+    "pyspark.ml",
+    # literals
+    "dbfs:",
+    "hive_metastore.",
+    "kafka.sasl.client.callback.handler.class",
+    "kafka.sasl.login.callback.handler.class",
+    "kafka.sasl.login.class",
+    "kafka.partition.assignment.strategy",
+    "kafka.ssl.truststore.location",
+    "kafka.ssl.keystore.location",
+    # calls
+    # "sc.", triggers false positives for "misc."
+    "spark.catalog.",
+    "spark._jsparkSession.catalog",
+    "spark._jspark",
+    "spark._jvm",
+    "._jdf",
+    "._jcol",
+    "spark.udf.registerJavaFunction",
+    "applyInPandas",
+    "mapInPandas",
+    "_jvm",
+    "SQLContext",
+    "emptyRDD",
+    "pickleFile",
+    "textFile",
+    "newAPIHadoopFile",
+    "newAPIHadoopRDD",
+    "hadoopFile",
+    "hadoopRDD",
+    "saveAsHadoopFile",
+    "saveAsHadoopDataset",
+    "saveAsNewAPIHadoopFile",
+    "saveAsNewAPIHadoopDataset",
+    "setJobGroup",
+    "setLocalProperty",
+    "applyInPandasWithState",
+}
+
+
+def incompatible_with_uc(needles: Iterable[str]) -> Tuple[Rule, ...]:
+    """Very coarse check for UC incompatibility, with a message for every needle found in the text of a node."""
+    return tuple(
+        Rule("incompatible-with-uc", node_type, "contains", needle, args=("node",))
+        for node_type in NODE_TYPES
+        for needle in needles
+    )
+
+
+LEGACY_RULES = (
+    # add message if databricks_cli is imported
+    Rule("legacy-cli", "import", "prefix", "databricks_cli"),
+    *incompatible_with_uc(sorted(UC_INCOMPATIBLE_BRUTE_FORCE)),
+)
+
+# names of the confidence levels, legacy-cli of `from databricks_cli import ...` has always been reported without
+# confidence
+LEGACY_CONFIDENCE = {"legacy-cli": "HIGH", "incompatible-with-uc": "INFERENCE"}
+
+
+# rules of `databricks.labs.pylint.notebooks`
+def check_notebook(lines: Iterable[bytes], max_cells: int) -> Iterator[Tuple[str, int]]:
+    """Yields symbols of messages and their line numbers for the raw lines of a notebook source."""
+    cells = 1
+    too_many_cells_raised = False
+    for lineno, line in enumerate(lines):
+        lineno += 1
+        if lineno == 1 and line != b"# Databricks notebook source\n":
+            # this is not a Databricks notebook
+            return
+        if line == b"# COMMAND ----------\n":
+            cells += 1
+        if cells > max_cells and not too_many_cells_raised:
+            yield "notebooks-too-many-cells", lineno + 1
+            too_many_cells_raised = True
+            continue
+        if line.startswith(b"# MAGIC %run"):
+            yield "notebooks-percent-run", lineno
@@ -0,0 +1,101 @@
+import functools
+import re
+import sys
+from pathlib import Path
+from typing import List
+
+import astroid
+from pylint.checkers import BaseChecker
+from pylint.interfaces import HIGH
+
+from databricks.labs.pylint.calls import SourceArg, resolver
+from databricks.labs.pylint.rulebook import MATCHES, NODE_TYPES, Rule, RuleIndex
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+TOML_TABLE = ("tool", "databricks-labs-pylint", "rules")
+
+
+def load_rules(path: Path) -> List[Rule]:
+    """Reads custom rules from `[[tool.databricks-labs-pylint.rules]]` tables of a TOML file, if it exists."""
+    if not path.is_file():
+        return []
+    with path.open("rb") as f:
+        config = tomllib.load(f)
+    for key in TOML_TABLE:
+        config = config.get(key, {})
+    rules = []
+    for i, raw in enumerate(config, 1):
+        where = f"{path}: rule {i}"
+        node = raw.get("node")
+        if node not in NODE_TYPES:
+            raise ValueError(f"{where}: node must be one of {', '.join(NODE_TYPES)}, got {node!r}")
+        matches = [match for match in MATCHES if match in raw]
+        if len(matches) != 1:
+            raise ValueError(f"{where}: needs exactly one of {', '.join(MATCHES)}")
+        pattern = raw[matches[0]]
+        message = raw.get("message")
+        if not isinstance(pattern, str) or not pattern or not isinstance(message, str):
+            raise ValueError(f"{where}: needs a non-empty {matches[0]} and a message")
+        rules.append(Rule("custom-rule", node, matches[0], pattern, message=message))
+    return rules
+
+
+class RulesChecker(BaseChecker):
+    name = "databricks-rules"
+
+    msgs = {
+        "R8924": (
+            "%s",
+            "custom-rule",
+            "Custom rule from the `[[tool.databricks-labs-pylint.rules]]` tables of the `rules-file`.",
+        ),
+    }
+
+    options = (
+        (
+            "rules-file",
+            {
+                "default": "pyproject.toml",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "TOML file with custom rules for calls, imports and literals",
+            },
+        ),
+    )
+
+    def open(self) -> None:
+        self._rules = RuleIndex(load_rules(Path(self.linter.config.rules_file)))
+        patterns = [rule.pattern for rule in self._rules.rules]
+        # every file with messages of this checker has a word of these, see `databricks.labs.pylint.triage`
+        if not patterns:
+            # never matches, so that files are not checked without rules
+            self.trigger_pattern = rb"(?!)"
+        elif all(re.search(r"\w", pattern, re.ASCII) for pattern in patterns):
+            self.trigger_words = tuple(patterns)
+            self.trigger_strings = True
+
+    def _check(self, node: astroid.NodeNG, node_type: str, text: str):
+        for symbol, args in self._rules.problems(node_type, text, functools.partial(SourceArg, node)):
+            self.add_message(symbol, node=node, args=args, confidence=HIGH)
+
+    def visit_call(self, node: astroid.Call):
+        self._check(node, "call", resolver.name(node))
+
+    def visit_import(self, node: astroid.Import):
+        for name, _ in node.names:
+            self._check(node, "import", name)
+
+    def visit_importfrom(self, node: astroid.ImportFrom):
+        self._check(node, "import", node.modname)
+
+    def visit_const(self, node: astroid.Const):
+        if isinstance(node.value, str):
+            self._check(node, "literal", node.value)
+
+
+def register(linter):
+    linter.register_checker(RulesChecker(linter))
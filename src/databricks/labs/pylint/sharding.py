@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from databricks.labs.pylint.__about__ import __version__
+from databricks.labs.pylint.findings import Report
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of `total` disjoint parts of a scan, numbered from 1.
+
+    Notebooks are assigned to shards by a stable hash of their path, so that every runner agrees on the
+    assignment without any coordination.
+    """
+
+    index: int
+    total: int
+
+    @classmethod
+    def parse(cls, spec: str) -> "Shard":
+        try:
+            index, total = (int(part) for part in spec.split("/"))
+        except ValueError as err:
+            raise ValueError(f"shard must be in k/N format: {spec}") from err
+        if not 1 <= index <= total:
+            raise ValueError(f"shard index must be between 1 and {total}: {spec}")
+        return cls(index, total)
+
+    def owns(self, path: str) -> bool:
+        return zlib.crc32(path.encode("utf-8")) % self.total == self.index - 1
+
+    def __str__(self):
+        return f"{self.index}/{self.total}"
+
+
+class ResultsWriter:
+    """Writes reports as JSON lines, preceded by a header with the scanned path and shard.
+
+    Reports are written to a temporary file, that is renamed only after the scan completes, so that
+    partial results of crashed runners are never merged.
+    """
+
+    def __init__(self, path: Path, root: str, shard: Optional[Shard] = None):
+        self._path = path
+        self._tmp = path.with_name(f".{path.name}.tmp")
+        self._f = self._tmp.open("w")
+        header = {"version": __version__, "root": root, "shard": str(shard) if shard else None}
+        self._f.write(json.dumps(header) + "\n")
+
+    def write(self, report: Report):
+        self._f.write(json.dumps(report.as_dict()) + "\n")
+
+    def close(self):
+        self._f.close()
+        os.replace(self._tmp, self._path)
+
+
+def merge_results(paths: Iterable[Path]) -> List[Report]:
+    """Combines results of all shards into reports sorted by path, the same way as for a single runner."""
+    reports: Dict[str, Report] = {}
+    roots = set()
+    shards = set()
+    totals = set()
+    for path in paths:
+        with path.open() as f:
+            header = json.loads(f.readline())
+            roots.add(header["root"])
+            if header["shard"]:
+                shard = Shard.parse(header["shard"])
+                shards.add(shard.index)
+                totals.add(shard.total)
+            for line in f:
+                report = Report.from_dict(json.loads(line))
+                reports[report.path] = report
+    if len(roots) > 1:
+        raise ValueError(f"cannot merge results of different paths: {', '.join(sorted(roots))}")
+    if len(totals) > 1:
+        raise ValueError(f"cannot merge results of different shard counts: {sorted(totals)}")
+    for total in totals:
+        missing = set(range(1, total + 1)) - shards
+        if missing:
+            logger.warning(f"results are missing for shards: {', '.join(f'{i}/{total}' for i in sorted(missing))}")
+    return [reports[path] for path in sorted(reports)]
@@ -0,0 +1,61 @@
+import functools
+import io
+import tokenize
+import weakref
+from typing import Iterator, List
+
+from astroid import nodes
+
+
+class SourceView:
+    """Source of a module, that raw checkers of this plugin share instead of reading the file each on their own.
+
+    The file is read once, and comment tokens, that carry the text of their lines, are computed only when one of
+    the checkers needs them, and then only once.
+    """
+
+    def __init__(self, data: bytes, encoding: str = "utf-8"):
+        self.data = data
+        self._encoding = encoding
+
+    @property
+    def text(self) -> str:
+        # not kept, as the checkers need only the comments of the text
+        return self.data.decode(self._encoding)
+
+    def lines(self) -> Iterator[bytes]:
+        """Raw lines with their line endings, like iterating over the file."""
+        data = self.data
+        start = 0
+        while start < len(data):
+            end = data.find(b"\n", start) + 1 or len(data)
+            yield data[start:end]
+            start = end
+
+    @functools.cached_property
+    def comments(self) -> List[tokenize.TokenInfo]:
+        """Comment tokens of the text, up to the first tokenizer error, if any. Other tokens are not kept, as no
+        checker of this plugin needs them, and they take many times the memory of the source."""
+        comments: List[tokenize.TokenInfo] = []
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(self.text).readline):
+                if token.type == tokenize.COMMENT:
+                    comments.append(token)
+        except (tokenize.TokenError, IndentationError):
+            pass
+        return comments
+
+
+# views of modules that are being checked, only the last one is kept
+_views: "weakref.WeakKeyDictionary[nodes.Module, SourceView]" = weakref.WeakKeyDictionary()
+
+
+def source_view(module: nodes.Module) -> SourceView:
+    """Returns the shared view of the module source, reading it only for the first checker that asks."""
+    view = _views.get(module)
+    if view is None:
+        with module.stream() as stream:
+            view = SourceView(stream.read(), module.file_encoding or "utf-8")
+        _views.clear()
+        _views[module] = view
+    return view
@@ -1,7 +1,17 @@
+from typing import Dict, Optional, Set
+
 import astroid
+from astroid import nodes
 from pylint.checkers import BaseChecker
 from pylint.interfaces import CONTROL_FLOW, INFERENCE
 
+from databricks.labs.pylint.calls import SourceArg
+
+# where the `spark` name comes from in a scope
+PARAMETER = "parameter"
+LOCAL = "local"
+GLOBAL = "global"
+
 
 class SparkChecker(BaseChecker):
     name = "spark"
@@ -27,29 +37,70 @@ class SparkChecker(BaseChecker):
         ),
     }
 
-    def visit_name(self, node: astroid.Name):
+    # every file with messages of this checker has one of these, see `databricks.labs.pylint.triage`
+    trigger_words = ("spark", "show")
+
+    def open(self) -> None:
+        self._bindings: Dict[nodes.LocalsDictNodeNG, str] = {}
+        self._functions: Dict[nodes.LocalsDictNodeNG, Optional[nodes.FunctionDef]] = {}
+        self._reported: Set[nodes.FunctionDef] = set()
+
+    def visit_module(self, _: nodes.Module):
+        # scopes are looked up once per module, and forgotten with it
+        self._bindings.clear()
+        self._functions.clear()
+        self._reported.clear()
+
+    def visit_name(self, node: nodes.Name):
         if node.name != "spark":
             return
-        in_node = node
-        while in_node and not isinstance(in_node, astroid.FunctionDef):
-            in_node = in_node.parent
-        if not in_node:
+        scope = node.scope()
+        if self._binding(scope) != GLOBAL:
+            return
+        function = self._function(scope)
+        if not function:
             self.add_message("spark-outside-function", node=node, confidence=CONTROL_FLOW)
             return
-        has_spark_arg = False
-        for arg in in_node.args.arguments:
-            if arg.name == "spark":
-                has_spark_arg = True
-                break
-        if not has_spark_arg:
-            self.add_message(
-                "no-spark-argument-in-function", node=in_node, args=(in_node.name,), confidence=CONTROL_FLOW
-            )
+        if function in self._reported:
+            return
+        self._reported.add(function)
+        self.add_message("no-spark-argument-in-function", node=function, args=(function.name,), confidence=CONTROL_FLOW)
+
+    def _binding(self, scope: nodes.LocalsDictNodeNG) -> str:
+        """Whether `spark` is a parameter, a local or a global in a scope, where closures see the parameters and
+        locals of the functions around them, but not class attributes."""
+        binding = self._bindings.get(scope)
+        if binding:
+            return binding
+        if isinstance(scope, nodes.Module):
+            binding = GLOBAL
+        elif isinstance(scope, (nodes.FunctionDef, nodes.Lambda)) and "spark" in scope.argnames():
+            binding = PARAMETER
+        elif not isinstance(scope, nodes.ClassDef) and "spark" in scope.locals:
+            binding = LOCAL
+        else:
+            # names declared `global` are in the locals of the module
+            binding = self._binding(scope.parent.scope())
+        self._bindings[scope] = binding
+        return binding
+
+    def _function(self, scope: nodes.LocalsDictNodeNG) -> Optional[nodes.FunctionDef]:
+        """Function or method the scope is in, if any: lambdas, comprehensions and classes belong to the
+        function around them."""
+        if scope in self._functions:
+            return self._functions[scope]
+        function: Optional[nodes.FunctionDef] = None
+        if isinstance(scope, nodes.FunctionDef):
+            function = scope
+        elif not isinstance(scope, nodes.Module):
+            function = self._function(scope.parent.scope())
+        self._functions[scope] = function
+        return function
 
     def visit_attribute(self, node: astroid.Attribute):
         if node.attrname == "show" and isinstance(node.expr, astroid.Call):
             self.add_message(
-                "use-display-instead-of-show", node=node, args=(node.expr.as_string(),), confidence=INFERENCE
+                "use-display-instead-of-show", node=node, args=(SourceArg(node.expr),), confidence=INFERENCE
             )
 
 
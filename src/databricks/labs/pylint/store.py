@@ -0,0 +1,175 @@
+import collections
+import hashlib
+import posixpath
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Counter, Dict, Iterator, List, Optional, Tuple
+
+from databricks.labs.pylint.findings import Finding, Report, module_name
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    root TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    path TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    msg_id TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    confidence TEXT NOT NULL,
+    message TEXT NOT NULL,
+    fingerprint INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_by_fingerprint ON findings (scan_id, fingerprint);
+CREATE INDEX IF NOT EXISTS findings_by_symbol ON findings (scan_id, symbol);
+CREATE INDEX IF NOT EXISTS findings_by_directory ON findings (scan_id, directory);
+"""
+
+COLUMNS = "path, symbol, msg_id, line, col, confidence, message"
+INSERT = f"INSERT INTO findings (scan_id, {COLUMNS}, directory, fingerprint) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def fingerprints(report: Report) -> Iterator[Tuple[Finding, int]]:
+    """Identifies findings by what they are and where, but not by line numbers, that shift with every edit
+    above them. Repeated findings of the same kind in a file are told apart by the order of occurrence.
+    Fingerprints are 64-bit integers, which keeps the index used to compare scans small."""
+    seen: Counter[Tuple[str, str]] = collections.Counter()
+    for finding in report.findings:
+        key = (finding.symbol, finding.message)
+        seen[key] += 1
+        raw = "\0".join([report.path, finding.symbol, finding.message, str(seen[key])])
+        digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).digest()
+        yield finding, int.from_bytes(digest, "big", signed=True)
+
+
+class FindingsStore:
+    """Keeps findings of all scans in a local SQLite database, so that scans can be compared with each other.
+
+    Findings are buffered and inserted `batch_size` rows at a time, each batch in a single transaction.
+    Every query is answered from an index on the scan id and the compared column, so comparing scans
+    takes milliseconds even with millions of stored findings.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 1000):
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._batch_size = batch_size
+        self._pending: List[Tuple[Any, ...]] = []
+        self._scan_id: Optional[int] = None
+
+    def start_scan(self, root: str) -> int:
+        with self._conn:
+            cursor = self._conn.execute("INSERT INTO scans (root, started_at) VALUES (?, ?)", (root, time.time()))
+        self._scan_id = cursor.lastrowid
+        return self._scan_id
+
+    def write(self, report: Report):
+        if self._scan_id is None:
+            raise ValueError("scan is not started")
+        directory = posixpath.dirname(report.path)
+        for finding, fingerprint in fingerprints(report):
+            self._pending.append(
+                (
+                    self._scan_id,
+                    report.path,
+                    finding.symbol,
+                    finding.msg_id,
+                    finding.line,
+                    finding.column,
+                    finding.confidence,
+                    finding.message,
+                    directory,
+                    fingerprint,
+                )
+            )
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(INSERT, self._pending)
+        self._pending.clear()
+
+    def finish_scan(self) -> int:
+        """Marks the scan as complete, so that it can be compared with the other ones."""
+        scan_id = self._scan_id
+        if scan_id is None:
+            raise ValueError("scan is not started")
+        self._flush()
+        with self._conn:
+            self._conn.execute("UPDATE scans SET finished_at = ? WHERE id = ?", (time.time(), scan_id))
+        self._scan_id = None
+        return scan_id
+
+    def scans(self) -> List[Dict[str, Any]]:
+        cursor = self._conn.execute("SELECT id, root, started_at, finished_at FROM scans ORDER BY id")
+        return [dict(zip(("id", "root", "started_at", "finished_at"), row)) for row in cursor]
+
+    def latest_scan(self, before: Optional[int] = None) -> Optional[int]:
+        """Returns the last finished scan, optionally the last one before the given scan."""
+        query = "SELECT MAX(id) FROM scans WHERE finished_at IS NOT NULL"
+        args: Tuple[Any, ...] = ()
+        if before is not None:
+            query += " AND id < ?"
+            args = (before,)
+        (scan_id,) = self._conn.execute(query, args).fetchone()
+        return scan_id
+
+    def new_findings(self, scan_id: int, since: int) -> Iterator[Report]:
+        """Findings of `scan_id` that were not there in scan `since`, i.e. regressions."""
+        return self._difference(scan_id, since)
+
+    def fixed_findings(self, scan_id: int, since: int) -> Iterator[Report]:
+        """Findings of scan `since` that are gone in `scan_id`."""
+        return self._difference(since, scan_id)
+
+    def _difference(self, scan_id: int, other: int) -> Iterator[Report]:
+        cursor = self._conn.execute(
+            f"SELECT {COLUMNS} FROM findings f WHERE f.scan_id = ? AND NOT EXISTS "
+            "(SELECT 1 FROM findings o WHERE o.scan_id = ? AND o.fingerprint = f.fingerprint) "
+            "ORDER BY f.path, f.line",
+            (scan_id, other),
+        )
+        report: Optional[Report] = None
+        for path, symbol, msg_id, line, col, confidence, message in cursor:
+            if report is None or report.path != path:
+                if report:
+                    yield report
+                report = Report(path, module_name(path))
+            report.findings.append(Finding(path, line, col, msg_id, symbol, message, confidence))
+        if report:
+            yield report
+
+    def by_symbol(self, scan_id: int) -> Dict[str, int]:
+        cursor = self._conn.execute(
+            "SELECT symbol, COUNT(*) AS n FROM findings WHERE scan_id = ? GROUP BY symbol ORDER BY n DESC", (scan_id,)
+        )
+        return dict(cursor.fetchall())
+
+    def by_directory(self, scan_id: int) -> Dict[str, int]:
+        cursor = self._conn.execute(
+            "SELECT directory, COUNT(*) AS n FROM findings WHERE scan_id = ? GROUP BY directory ORDER BY n DESC",
+            (scan_id,),
+        )
+        return dict(cursor.fetchall())
+
+    def close(self):
+        self._flush()
+        self._conn.close()
+
+    def __enter__(self) -> "FindingsStore":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -0,0 +1,139 @@
+import contextlib
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, TypeVar
+
+import requests
+from databricks.sdk import WorkspaceClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THROTTLED = (429, 503)
+
+
+@dataclass
+class LimiterStats:
+    concurrency: int
+    in_flight: int
+    requests: int
+    throttled: int
+    errors: int
+    throughput: float
+
+    def __str__(self):
+        return (
+            f"concurrency={self.concurrency} in_flight={self.in_flight} requests={self.requests} "
+            f"throttled={self.throttled} errors={self.errors} throughput={self.throughput:.1f}/s"
+        )
+
+
+class AdaptiveLimiter:  # pylint: disable=too-many-instance-attributes
+    """Limits concurrent workspace API calls with additive increase and multiplicative decrease (AIMD).
+
+    Every healthy and fast enough response raises the limit by `1/limit`, so that it grows by one request
+    per full window of requests. A 429 or 503 response halves the limit, but only once per round-trip:
+    responses to requests that were sent before the last decrease report congestion that was already
+    handled. A `Retry-After` header additionally pauses all new requests for the given amount of seconds.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 32,
+        latency_threshold: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("expected 1 <= minimum <= initial <= maximum")
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._latency_threshold = latency_threshold
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = -math.inf
+        self._started = clock()
+        self._requests = 0
+        self._throttled = 0
+        self._errors = 0
+
+    @property
+    def concurrency(self) -> int:
+        # tolerate floating point errors of the additive increases
+        return int(self._limit + 1e-9)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._cond:
+            while True:
+                wait = self._paused_until - self._clock()
+                if wait <= 0 and self._in_flight < self.concurrency:
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def call(self, fn: Callable[[], T]) -> T:
+        with self.slot():
+            return fn()
+
+    def observe(self, status: int, latency: float, retry_after: Optional[float] = None):
+        with self._cond:
+            now = self._clock()
+            if status in THROTTLED:
+                self._throttled += 1
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                if now - latency >= self._last_decrease:
+                    self._limit = max(float(self._minimum), self._limit / 2)
+                    self._last_decrease = now
+                    logger.debug(f"throttled with {status}, lowering concurrency to {self.concurrency}")
+                return
+            self._requests += 1
+            if status >= 500:
+                self._errors += 1
+                return
+            if latency > self._latency_threshold:
+                return
+            self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def observe_client(self, w: WorkspaceClient):
+        """Observes every HTTP response of the client, including the ones retried by the SDK itself."""
+        session: requests.Session = w.api_client._api_client._session
+        session.hooks["response"].append(self._on_response)
+
+    def _on_response(self, response: requests.Response, *_, **__):
+        retry_after = None
+        header = response.headers.get("Retry-After")
+        if header:
+            try:
+                retry_after = float(header)
+            except ValueError:
+                logger.debug(f"ignoring Retry-After: {header}")
+        self.observe(response.status_code, response.elapsed.total_seconds(), retry_after)
+
+    def stats(self) -> LimiterStats:
+        with self._cond:
+            elapsed = max(self._clock() - self._started, 1e-9)
+            return LimiterStats(
+                concurrency=self.concurrency,
+                in_flight=self._in_flight,
+                requests=self._requests,
+                throttled=self._throttled,
+                errors=self._errors,
+                throughput=self._requests / elapsed,
+            )
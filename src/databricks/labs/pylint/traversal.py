@@ -0,0 +1,90 @@
+import collections
+import logging
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Set
+
+from databricks.sdk.service.workspace import ObjectInfo, ObjectType
+
+logger = logging.getLogger(__name__)
+
+# repos are listed the same way as directories
+CONTAINERS = (ObjectType.DIRECTORY, ObjectType.REPO)
+
+
+def is_container(info: ObjectInfo) -> bool:
+    return info.object_type in CONTAINERS
+
+
+class Walker:
+    """Walks a workspace tree, fanning out `list` calls for directories across a pool of workers.
+
+    Objects are streamed to the caller as soon as their parent directory is listed, so that the lint
+    stage can start before the whole tree is known. Discovered directories wait in a queue of paths, and
+    at most `workers` of them are being listed at a time, only while the caller keeps consuming, which
+    keeps the amount of buffered listings proportional to the number of workers, not to the size of the
+    tree. Closing the walk cancels listings that did not start and does not wait for the running ones.
+
+    The optional `on_listed` callback is invoked from the calling thread with every listed directory and
+    its children, before any of the children is yielded.
+    """
+
+    def __init__(
+        self,
+        list_dir: Callable[[str], Iterable[ObjectInfo]],
+        workers: int = 8,
+        on_listed: Optional[Callable[[str, List[ObjectInfo]], None]] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        self._list_dir = list_dir
+        self._workers = workers
+        self._on_listed = on_listed
+
+    def walk(self, *paths: str) -> Iterator[ObjectInfo]:
+        results: "queue.Queue" = queue.Queue()
+        pending: Deque[str] = collections.deque(paths)
+        running: Set[Future] = set()
+        pool = ThreadPoolExecutor(self._workers, thread_name_prefix="list")
+        listing = 0
+
+        def submit():
+            nonlocal listing
+            while pending and listing < self._workers:
+                future = pool.submit(self._list, pending.popleft(), results)
+                running.add(future)
+                future.add_done_callback(running.discard)
+                listing += 1
+
+        try:
+            while pending or listing:
+                submit()
+                path, children = results.get()
+                listing -= 1
+                if children is None:
+                    continue
+                yield from self._children(path, children, pending, submit)
+        finally:
+            for future in list(running):
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _children(
+        self, path: str, children: List[ObjectInfo], pending: Deque[str], submit: Callable[[], None]
+    ) -> Iterator[ObjectInfo]:
+        if self._on_listed:
+            self._on_listed(path, children)
+        pending.extend(item.path for item in children if is_container(item))
+        # keep the workers busy while the caller consumes the children
+        submit()
+        for item in children:
+            if not is_container(item):
+                yield item
+
+    def _list(self, path: str, results: "queue.Queue"):
+        try:
+            children: Optional[List[ObjectInfo]] = list(self._list_dir(path))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.error(f"failed to list {path}: {err}")
+            children = None
+        results.put((path, children))
@@ -0,0 +1,176 @@
+import collections
+import functools
+import re
+from typing import Callable, Counter, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from astroid import nodes
+from pylint.checkers import BaseChecker
+from pylint.reporters.ureports.nodes import Section, Table
+
+from databricks.labs.pylint.source import source_view
+
+# identifiers are NFKC-normalized by the parser, so non-ASCII ones may spell out any word, and so may the
+# source of a file with an encoding declared in one of the first two lines
+ANYTHING = rb"[^\x00-\x7f]|\A(?:[^\n]*\n)?[ \t\f]*#[^\n]*coding[:=]"
+
+# constant strings differ from their source code only with escapes or implicit concatenation of literals
+ESCAPE = rb"\\"
+# comments end with a newline, so that runs of "#" after a literal cannot be split into comments in many ways
+ADJACENT_LITERALS = re.compile(rb"[\"']+(?:\s|#[^\n]*\n)*[rRbBuUfF]{0,2}[\"']+")
+
+
+def trigger_words(triggers: Iterable[str]) -> Set[str]:
+    """Attribute chains like `spark.catalog.` may have spaces and comments around dots in the source code, so
+    only one of their identifiers has to be there: the one already triggering on its own, or else the longest.
+    Words are ASCII, as every file with other characters is checked anyway, e.g. `caf` for `café`."""
+    chains = [re.findall(r"\w+", trigger, re.ASCII) for trigger in sorted(triggers)]
+    words = {chain[0] for chain in chains if len(chain) == 1}
+    for chain in chains:
+        if not words.intersection(chain):
+            words.add(max(chain, key=len))
+    return words
+
+
+class Triage(BaseChecker):
+    """Skips the checkers of this plugin for files, that cannot have any of their messages.
+
+    Checkers declare what every file with their messages contains: raw checkers as `trigger_pattern` over
+    the bytes of a file, AST checkers as `trigger_words` of their identifiers. Checkers with
+    `trigger_strings` also look for these words in string constants, that may be spelled with escapes
+    or concatenated from several literals, so such files are checked just in case. A single pattern with
+    a group per checker is searched in the shared source of the file, with groups dropped as soon as they match.
+    Checkers without triggers are never skipped.
+
+    Counts of checked and skipped files are in the `RP8901` report, for files checked in this process.
+    """
+
+    name = "databricks-triage"
+    msgs: Dict[str, tuple] = {}
+    options = (
+        (
+            "triage",
+            {
+                "default": True,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Skip Databricks checkers for files that do not contain any words they look for",
+            },
+        ),
+    )
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self.reports = (("RP8901", "Triage of Databricks checkers", self._report),)
+        self._checkers: Dict[str, BaseChecker] = {}
+        self._groups: Dict[str, str] = {}
+        self._patterns: Dict[Tuple[FrozenSet[str], bool], "re.Pattern[bytes]"] = {}
+        self._module: Optional[nodes.Module] = None
+        self._triggered: Set[str] = set()
+        self.files = 0
+        self.skipped: Counter[str] = collections.Counter()
+
+    def guard(self, checker: BaseChecker):
+        """Makes an opened checker skip files without its triggers."""
+        if not self.linter.config.triage:
+            return
+        if not getattr(checker, "trigger_pattern", None) and not getattr(checker, "trigger_words", None):
+            return
+        self._checkers[checker.name] = checker
+        self._groups = {f"c{i}": name for i, name in enumerate(self._checkers)}
+        self._patterns.clear()
+        for member in dir(checker):
+            if member.startswith(("visit_", "leave_")) or member == "process_module":
+                setattr(checker, member, self._guarded(checker.name, getattr(checker, member)))
+
+    def _guarded(self, name: str, method: Callable[[nodes.NodeNG], None]) -> Callable[[nodes.NodeNG], None]:
+        # wraps() keeps the messages, that pylint reads to skip methods of disabled messages
+        @functools.wraps(method)
+        def guarded(node: nodes.NodeNG):
+            module = node.root()
+            if module is not self._module:
+                self._switch(module)
+            if name not in self._triggered:
+                return None
+            return method(node)
+
+        return guarded
+
+    def _switch(self, module: nodes.Module):
+        self._module = module
+        # the source is read once for all checkers of this plugin
+        self._triggered = self.triggered(source_view(module).data)
+        self.files += 1
+        for name in self._checkers:
+            if name not in self._triggered:
+                self.skipped[name] += 1
+
+    def triggered(self, source: bytes) -> Set[str]:
+        """Returns names of the checkers that have to check a file with the given source."""
+        remaining = frozenset(self._checkers)
+        triggered: Set[str] = set()
+        adjacent_literals = False
+        pos = 0
+        while remaining:
+            match = self._pattern(remaining, adjacent_literals).search(source, pos)
+            if not match:
+                break
+            if match.lastgroup == "anything":
+                return set(self._checkers)
+            if match.lastgroup == "adjacent":
+                adjacent_literals = True
+            else:
+                name = self._groups[match.lastgroup]
+                triggered.add(name)
+                remaining -= {name}
+            # other groups may match at the same position
+            pos = match.start()
+        strings = [name for name in remaining if getattr(self._checkers[name], "trigger_strings", False)]
+        if adjacent_literals and strings:
+            joined = ADJACENT_LITERALS.sub(b"", source)
+            for name in strings:
+                if re.search(self._words(name), joined):
+                    triggered.add(name)
+        return triggered
+
+    def _words(self, name: str) -> bytes:
+        words = trigger_words(self._checkers[name].trigger_words)
+        return b"|".join(re.escape(word.encode("ascii")) for word in sorted(words))
+
+    def _pattern(self, remaining: FrozenSet[str], adjacent_literals: bool) -> "re.Pattern[bytes]":
+        key = (remaining, adjacent_literals)
+        if key not in self._patterns:
+            self._patterns[key] = self._compile(remaining, adjacent_literals)
+        return self._patterns[key]
+
+    def _compile(self, remaining: FrozenSet[str], adjacent_literals: bool) -> "re.Pattern[bytes]":
+        groups: List[bytes] = []
+        parsed = False
+        for group, name in self._groups.items():
+            if name not in remaining:
+                continue
+            checker = self._checkers[name]
+            pattern = getattr(checker, "trigger_pattern", None)
+            if pattern is None:
+                parsed = True
+                pattern = self._words(name)
+                if getattr(checker, "trigger_strings", False):
+                    pattern += b"|" + ESCAPE
+                    if not adjacent_literals:
+                        groups.append(b"(?P<adjacent>" + ADJACENT_LITERALS.pattern + b")")
+            groups.append(b"(?P<" + group.encode() + b">" + pattern + b")")
+        if parsed:
+            groups.insert(0, b"(?P<anything>" + ANYTHING + b")")
+        # a checker with string triggers adds the same group only once
+        unique = list(dict.fromkeys(groups))
+        return re.compile(b"|".join(unique))
+
+    def stats(self) -> Dict[str, int]:
+        """Number of triaged files and how many of them every checker skipped."""
+        return {"files": self.files, **{f"{name} skipped": self.skipped[name] for name in self._checkers}}
+
+    def _report(self, sect: Section, *_):
+        lines = ["checker", "checked", "skipped"]
+        for name in self._checkers:
+            skipped = self.skipped[name]
+            lines += [name, str(self.files - skipped), str(skipped)]
+        sect.append(Table(children=lines, cols=3, rheaders=1))
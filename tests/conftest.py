@@ -3,6 +3,7 @@ from typing import Generic, Type, TypeVar
 import astroid
 import astroid.rebuilder
 import pytest
+from fake_workspace import FakeWorkspace
 from pylint.checkers import BaseChecker
 from pylint.testutils import UnittestLinter
 
@@ -45,3 +46,11 @@ def lint_with():
         return TestSupport(klass, config)
 
     yield factory
+
+
+@pytest.fixture
+def fake_workspace():
+    workspace = FakeWorkspace()
+    workspace.start()
+    yield workspace
+    workspace.stop()
@@ -81,3 +81,19 @@ DatabricksSubmitRunOperator( #@
         "[missing-data-security-mode] ephemeral cluster missing `data_security_mode` "
         "required for Unity Catalog compatibility"
     ) in messages
+
+
+def test_tasks_without_new_cluster_do_not_hide_the_following_ones(lint_with):
+    messages = (
+        lint_with(AirflowChecker)
+        << """from airflow.providers.databricks.operators.databricks import DatabricksCreateJobsOperator
+tasks = [
+    {"task_key": "shared", "existing_cluster_id": "0123-456789-abcdef"},
+    {"task_key": "banana", "new_cluster": {"spark_version": "7.3.x-scala2.12"}},
+]
+DatabricksCreateJobsOperator( #@
+    task_id="jobs_create_named",
+    tasks=tasks
+)"""
+    )
+    assert "[unsupported-runtime] banana cluster has unsupported runtime: 7.3.x-scala2.12" in messages
@@ -0,0 +1,70 @@
+import importlib
+import subprocess
+import sys
+
+from pylint.checkers import BaseRawFileChecker
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from databricks.labs.pylint.catalog import CHECKERS
+
+
+def test_catalog_is_up_to_date():
+    for spec in CHECKERS:
+        klass = getattr(importlib.import_module(spec["module"]), spec["class"])
+        assert spec["name"] == klass.name
+        assert spec["msgs"] == klass.msgs
+        assert spec["options"] == klass.options
+        assert spec["raw"] == issubclass(klass, BaseRawFileChecker), "run `make fmt` to regenerate the catalog"
+
+
+def test_only_checkers_with_enabled_messages_are_imported(tmp_path):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text("dbutils.fs.ls('/')\n")
+    args = ["--load-plugins=databricks.labs.pylint.all", "--disable=all", "--enable=dbutils-fs-ls", str(notebook)]
+    script = f"""
+import sys
+from pylint.lint import Run
+Run({args!r}, exit=False)
+print(sorted(m for m in sys.modules if m.startswith("databricks.labs.pylint.") or m == "eradicate"))
+"""
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+
+    assert "(dbutils-fs-ls)" in out
+    assert out.splitlines()[-1] == str(
+        [
+            "databricks.labs.pylint.__about__",
+            "databricks.labs.pylint.all",
+            "databricks.labs.pylint.cache",
+            "databricks.labs.pylint.calls",
+            "databricks.labs.pylint.catalog",
+            "databricks.labs.pylint.dbutils",
+            "databricks.labs.pylint.findings",
+            "databricks.labs.pylint.messages",
+            "databricks.labs.pylint.rulebook",
+            "databricks.labs.pylint.source",
+            "databricks.labs.pylint.triage",
+        ]
+    )
+
+
+def test_options_of_lazy_checkers_keep_configured_values(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text("# Databricks notebook source\nx = 1\n\n# COMMAND ----------\n\ny = 2\n")
+    reporter = CollectingReporter()
+
+    Run(
+        [
+            "--load-plugins=databricks.labs.pylint.all",
+            "--disable=all",
+            "--enable=notebooks-too-many-cells",
+            "--max-cells=1",
+            "--persistent=n",
+            str(notebook),
+        ],
+        reporter=reporter,
+        exit=False,
+    )
+
+    assert [m.symbol for m in reporter.messages] == ["notebooks-too-many-cells"]
@@ -0,0 +1,135 @@
+import json
+import os
+import time
+
+import pytest
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from databricks.labs.pylint.cache import CacheDirectory, message_arguments
+from databricks.labs.pylint.eradicate import EradicateChecker
+
+SOURCE = """# Databricks notebook source
+def f():
+    dbutils.fs.ls("/")  # pylint: disable=dbutils-fs-ls
+    dbutils.fs.ls("/x")
+    # print("hello")
+"""
+
+
+@pytest.fixture(autouse=True)
+def outside_of_project(tmp_path, monkeypatch):
+    # otherwise pylint picks up the configuration of this project
+    monkeypatch.chdir(tmp_path)
+
+
+def lint(path, cache, *args):
+    reporter = CollectingReporter()
+    Run(
+        ["--load-plugins=databricks.labs.pylint.all", "--disable=all", "--enable=dbutils-fs-ls,dead-code", *args]
+        + ["--persistent=n", f"--result-cache-dir={cache}", str(path)],
+        reporter=reporter,
+        exit=False,
+    )
+    return sorted((m.line, m.column, m.symbol, m.msg, m.obj) for m in reporter.messages)
+
+
+def count_calls(monkeypatch):
+    calls = []
+    process_module = EradicateChecker.process_module
+
+    def counting(self, node):
+        calls.append(node.file)
+        return process_module(self, node)
+
+    monkeypatch.setattr(EradicateChecker, "process_module", counting)
+    return calls
+
+
+def test_cached_messages_are_replayed_without_checking(tmp_path, monkeypatch):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(SOURCE)
+    calls = count_calls(monkeypatch)
+
+    first = lint(notebook, tmp_path / "cache")
+    second = lint(notebook, tmp_path / "cache")
+
+    assert first == [
+        (4, 4, "dbutils-fs-ls", "Use Databricks SDK instead: w.dbfs.list('/x')", "f"),
+        (5, 0, "dead-code", 'Remove commented out code: # print("hello")', ""),
+    ]
+    assert second == first
+    assert len(calls) == 1
+
+
+def test_changed_content_or_options_are_misses(tmp_path, monkeypatch):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(SOURCE)
+    calls = count_calls(monkeypatch)
+
+    lint(notebook, tmp_path / "cache")
+    lint(notebook, tmp_path / "cache", "--max-cells=1")
+    lint(notebook, tmp_path / "cache", "--enable=notebooks-percent-run")
+    notebook.write_text(SOURCE + "# x = 1\n")
+    changed = lint(notebook, tmp_path / "cache")
+
+    assert len(calls) == 4
+    assert (6, 0, "dead-code", "Remove commented out code: # x = 1", "") in changed
+
+
+def test_no_cache_without_directory(tmp_path, monkeypatch):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(SOURCE)
+    calls = count_calls(monkeypatch)
+
+    lint(notebook, "")
+    lint(notebook, "")
+
+    assert len(calls) == 2
+
+
+def test_corrupted_entry_is_a_miss(tmp_path):
+    cache = CacheDirectory(tmp_path, max_size=1024, max_age=60)
+    cache.put("abcdef", [1, 2])
+    (tmp_path / "ab" / "abcdef.json").write_text("[1, ")
+
+    assert cache.get("abcdef") is None
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_prune_removes_old_then_least_recently_used_entries(tmp_path):
+    cache = CacheDirectory(tmp_path, max_size=30, max_age=3600)
+    for i, key in enumerate(["aa1", "bb2", "cc3", "dd4"]):
+        cache.put(key, "x" * 10)
+        entry = tmp_path / key[:2] / f"{key}.json"
+        os.utime(entry, (time.time() - 100 + i, time.time() - 100 + i))
+    os.utime(tmp_path / "aa" / "aa1.json", (0, 0))
+    assert cache.get("bb2") == "x" * 10
+
+    cache.prune()
+
+    left = sorted(p.name for p in tmp_path.glob("*/*.json"))
+    assert left == ["bb2.json", "dd4.json"]
+    assert json.loads((tmp_path / "bb" / "bb2.json").read_text()) == "x" * 10
+
+
+def test_prune_runs_once_in_a_while(tmp_path):
+    cache = CacheDirectory(tmp_path, max_size=0, max_age=3600)
+    cache.prune()
+    cache.put("aa1", "x")
+
+    cache.prune()
+    assert cache.get("aa1") == "x"
+
+    cache.prune(force=True)
+    assert cache.get("aa1") is None
+
+
+def test_message_arguments_are_named_however_they_are_passed():
+    assert message_arguments(("dbutils-fs-ls", None, "node"), {"args": ("'/tmp'",)}) == {
+        "msgid": "dbutils-fs-ls",
+        "line": None,
+        "node": "node",
+        "args": ("'/tmp'",),
+    }
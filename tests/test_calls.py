@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import astroid
+import pytest
+from astroid import nodes
+from astroid.nodes.as_string import AsStringVisitor
+
+from databricks.labs.pylint.calls import CallResolver, SourceArg, shorten
+
+PROJECT = Path(__file__).parent.parent
+
+
+def test_same_source_code_as_astroid():
+    resolver = CallResolver()
+    for path in (*(PROJECT / "tests" / "samples").rglob("*.py"), *(PROJECT / "src").rglob("*.py")):
+        module = astroid.parse(path.read_text(), path=str(path))
+        for call in module.nodes_of_class(nodes.Call):
+            assert resolver.name(call) == call.func.as_string()
+            assert resolver.as_string(call) == call.as_string()
+            for i, arg in enumerate(call.args):
+                assert resolver.arg(call, i) == arg.as_string()
+
+
+def test_chained_calls_are_rendered_once(monkeypatch):
+    rendered = []
+    visit_call = AsStringVisitor.visit_call
+
+    def counting(self, node):
+        rendered.append(node.lineno)
+        return visit_call(self, node)
+
+    monkeypatch.setattr(AsStringVisitor, "visit_call", counting)
+    module = astroid.parse("spark.table('a').filter(x > 1).select('b').limit(10).show()\n")
+    resolver = CallResolver()
+
+    calls = list(module.nodes_of_class(nodes.Call))
+    names = [resolver.name(call) for call in calls]
+    again = [resolver.name(call) for call in calls]
+
+    assert names[0] == "spark.table('a').filter(x > 1).select('b').limit(10).show"
+    assert again == names
+    assert len(rendered) == len(calls) - 1
+
+
+def test_cache_is_dropped_for_another_module():
+    resolver = CallResolver()
+    first = astroid.parse("f(1)\n")
+    second = astroid.parse("g(2)\n")
+
+    assert resolver.as_string(next(first.nodes_of_class(nodes.Call))) == "f(1)"
+    assert resolver.as_string(next(second.nodes_of_class(nodes.Call))) == "g(2)"
+
+
+@pytest.mark.parametrize(
+    "value, width, shortened",
+    [
+        ("dbfs:/x", 200, "'dbfs:/x'"),
+        ("dbfs:/x", 0, "'dbfs:/x'"),
+        ("dbfs:/" + "x" * 20, 10, "'dbfs:/..."),
+        ("it's" * 10, 12, '"it\'sit\'s...'),
+    ],
+)
+def test_shortened_literals_are_cut_before_they_are_formatted(value, width, shortened):
+    node = astroid.extract_node(f"print({value!r})").args[0]
+
+    assert CallResolver().shortened(node, width) == shortened
+    assert str(SourceArg(node, width)) == shortened
+    assert shortened == shorten(node.as_string(), width)
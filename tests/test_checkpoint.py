@@ -0,0 +1,189 @@
+import itertools
+import json
+
+import pytest
+from databricks.sdk.service.workspace import ObjectInfo, ObjectType
+
+from databricks.labs.pylint.checkpoint import Checkpoint
+from databricks.labs.pylint.findings import Report
+from databricks.labs.pylint.pipeline import Pipeline
+from databricks.labs.pylint.traversal import Walker
+
+
+class Tree:
+    def __init__(self):
+        self.children = {
+            "/Users": ["/Users/a", "/Users/b"],
+            "/Users/a": ["/Users/a/1", "/Users/a/2", "/Users/a/c"],
+            "/Users/a/c": ["/Users/a/c/3"],
+            "/Users/b": ["/Users/b/4", "/Users/b/5"],
+        }
+        self.listed = []
+
+    def list_dir(self, path: str):
+        self.listed.append(path)
+        for child in self.children[path]:
+            object_type = ObjectType.DIRECTORY if child in self.children else ObjectType.NOTEBOOK
+            yield ObjectInfo(path=child, object_type=object_type)
+
+
+class Interrupted(Exception):
+    pass
+
+
+def scan(checkpoint: Checkpoint, tree: Tree, fail_after: int = -1, killed: bool = False):
+    out = [report.path for report in checkpoint.reports()]
+    walker = Walker(tree.list_dir, workers=1, on_listed=checkpoint.listed)
+    pending = itertools.chain(checkpoint.pending_objects(), walker.walk(*checkpoint.pending_directories()))
+    pipeline = Pipeline(lambda info: info.path, lambda path, _: Report(path, path), 1, 1)
+    try:
+        for report in pipeline.run(info for info in pending if not checkpoint.is_linted(info.path)):
+            if len(out) == fail_after:
+                raise Interrupted()
+            out.append(report.path)
+            checkpoint.linted(report)
+    except Interrupted:
+        if not killed:
+            checkpoint.save()
+        # the journal of a killed process has the reports written up to the last flush
+        checkpoint.close()
+        raise
+    return out
+
+
+@pytest.mark.parametrize("fail_after", [0, 1, 2, 3, 4])
+def test_resume_has_no_duplicates_or_lost_results(tmp_path, fail_after):
+    tree = Tree()
+    with pytest.raises(Interrupted):
+        scan(Checkpoint(tmp_path / "checkpoint.json", "/Users"), tree, fail_after)
+    tree.listed.clear()
+
+    checkpoint = Checkpoint.resume(tmp_path / "checkpoint.json", "/Users")
+    pending_directories = checkpoint.pending_directories()
+    out = scan(checkpoint, tree)
+
+    assert sorted(out) == ["/Users/a/1", "/Users/a/2", "/Users/a/c/3", "/Users/b/4", "/Users/b/5"]
+    # directories recorded as listed in the checkpoint are not listed again
+    assert set(tree.listed) <= set(pending_directories)
+
+
+def test_resume_after_kill_has_no_duplicates(tmp_path):
+    tree = Tree()
+    now = [0.0]
+
+    def clock():
+        # the interval passes once, while the scan is in the middle of /Users/a
+        now[0] += 1
+        return 100.0 if now[0] >= 4 else 0.0
+
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Users", interval=10, clock=clock)
+    with pytest.raises(Interrupted):
+        scan(checkpoint, tree, fail_after=4, killed=True)
+    tree.listed.clear()
+
+    out = scan(Checkpoint.resume(tmp_path / "checkpoint.json", "/Users"), tree)
+
+    assert sorted(out) == ["/Users/a/1", "/Users/a/2", "/Users/a/c/3", "/Users/b/4", "/Users/b/5"]
+    # directories listed after the snapshot are listed again
+    assert tree.listed
+
+
+def test_checkpoint_is_saved_periodically(tmp_path):
+    now = [0.0]
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Users", interval=10, clock=lambda: now[0])
+
+    checkpoint.listed("/Users", [ObjectInfo(path="/Users/a", object_type=ObjectType.NOTEBOOK)])
+    assert not (tmp_path / "checkpoint.json").exists()
+
+    now[0] = 11
+    checkpoint.linted(Report("/Users/a", "a"))
+    raw = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert raw["directories"] == []
+    assert raw["objects"] == {}
+    assert "reports" not in raw
+    journal = (tmp_path / "checkpoint.reports.jsonl").read_text().splitlines()
+    assert [json.loads(line)["path"] for line in journal] == ["/Users/a"]
+
+
+def test_reports_are_appended_to_the_journal(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Users", interval=3600)
+    checkpoint.listed("/Users", [ObjectInfo(path=f"/Users/{i}", object_type=ObjectType.NOTEBOOK) for i in range(3)])
+
+    for i in range(3):
+        checkpoint.linted(Report(f"/Users/{i}", str(i)))
+    checkpoint.save()
+    checkpoint.close()
+
+    raw = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert raw["objects"] == {}
+    resumed = Checkpoint.resume(tmp_path / "checkpoint.json", "/Users")
+    assert [report.path for report in resumed.reports()] == ["/Users/0", "/Users/1", "/Users/2"]
+    assert resumed.is_linted("/Users/1")
+
+
+def test_partially_written_report_is_linted_again(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Users")
+    checkpoint.listed("/Users", [ObjectInfo(path=f"/Users/{i}", object_type=ObjectType.NOTEBOOK) for i in range(2)])
+    checkpoint.linted(Report("/Users/0", "0"))
+    checkpoint.save()
+    checkpoint.close()
+    with (tmp_path / "checkpoint.reports.jsonl").open("a") as f:
+        f.write('{"path": "/Users/1", "mod')
+
+    resumed = Checkpoint.resume(tmp_path / "checkpoint.json", "/Users")
+    resumed.linted(Report("/Users/1", "1"))
+    resumed.close()
+
+    assert [info.path for info in resumed.pending_objects()] == []
+    journal = (tmp_path / "checkpoint.reports.jsonl").read_text().splitlines()
+    assert [json.loads(line)["path"] for line in journal] == ["/Users/0", "/Users/1"]
+
+
+def test_new_scan_starts_with_an_empty_journal(tmp_path):
+    (tmp_path / "checkpoint.reports.jsonl").write_text(json.dumps(Report("/Users/old", "old").as_dict()) + "\n")
+
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Users")
+    checkpoint.save()
+    checkpoint.close()
+
+    assert not list(checkpoint.reports())
+    assert not list(Checkpoint.resume(tmp_path / "checkpoint.json", "/Users").reports())
+
+
+def test_resume_without_checkpoint_starts_from_scratch(tmp_path):
+    checkpoint = Checkpoint.resume(tmp_path / "checkpoint.json", "/Users")
+
+    assert checkpoint.pending_directories() == ["/Users"]
+    assert not list(checkpoint.reports())
+
+
+def test_resume_from_checkpoint_of_other_path_fails(tmp_path):
+    Checkpoint(tmp_path / "checkpoint.json", "/Users").save()
+
+    with pytest.raises(ValueError):
+        Checkpoint.resume(tmp_path / "checkpoint.json", "/Repos")
+
+
+def test_complete_removes_checkpoint(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Users")
+    checkpoint.save()
+
+    checkpoint.complete()
+
+    assert not (tmp_path / "checkpoint.json").exists()
+    assert not (tmp_path / "checkpoint.reports.jsonl").exists()
+
+
+def test_repos_are_listed_like_directories(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", "/Repos")
+
+    checkpoint.listed(
+        "/Repos",
+        [
+            ObjectInfo(path="/Repos/project", object_type=ObjectType.REPO),
+            ObjectInfo(path="/Repos/utils.py", object_type=ObjectType.FILE),
+        ],
+    )
+
+    assert checkpoint.pending_directories() == ["/Repos/project"]
+    assert [info.path for info in checkpoint.pending_objects()] == ["/Repos/utils.py"]
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from databricks.labs.pylint.engine import Engine, module_name
+
+SAMPLES = Path(__file__).parent / "samples"
+
+
+def test_module_name():
+    assert module_name("/Users/foo@example.com/My Notebook (1)") == "My_Notebook_1_"
+    assert module_name("/Repos/foo@example.com/project/my-utils.py") == "my_utils"
+
+
+def test_lint_has_same_output_as_pylint():
+    source = (SAMPLES / "p/percent_run.py").read_text()
+    with Engine() as engine:
+        report = engine.lint("/Users/me/percent run", source)
+    assert report.as_text() == (
+        "************* Module percent_run\n"
+        "/Users/me/percent run:7:0: R8914: Using %run is not allowed (notebooks-percent-run)\n"
+        "/Users/me/percent run:15:5: C8915: Using spark outside the function is leading to untestable code "
+        "(spark-outside-function)\n"
+        "/Users/me/percent run:24:5: C8915: Using spark outside the function is leading to untestable code "
+        "(spark-outside-function)\n"
+        "\n"
+        "-----------------------------------\n"
+        "Your code has been rated at 2.50/10\n"
+        "\n"
+    )
+
+
+def test_linter_is_reused_between_notebooks():
+    source = (SAMPLES / "p/percent_run.py").read_text()
+    with Engine() as engine:
+        first = engine.lint("/Users/me/first", source)
+        clean = engine.lint("/Users/me/clean", "x = 1\n")
+        second = engine.lint("/Users/me/second", source)
+    assert not clean.findings
+    assert clean.score == 10.0
+    assert [f.symbol for f in first.findings] == [f.symbol for f in second.findings]
+    assert second.score == first.score
+    assert {f.path for f in second.findings} == {"/Users/me/second"}
+
+
+def test_only_enabled_messages_are_reported():
+    with Engine(enabled=["dbutils-fs-ls"]) as engine:
+        report = engine.lint("/Users/me/nb", "dbutils.fs.ls('/tmp')\ndbutils.fs.head('/tmp/x')\n")
+    assert [f.symbol for f in report.findings] == ["dbutils-fs-ls"]
+
+
+def test_triage_skips_checkers_of_sources_without_triggers():
+    with Engine() as engine:
+        engine.lint("/Users/me/plain", "def add(a, b):\n    return a + b\n")
+        engine.lint("/Users/me/percent run", (SAMPLES / "p/percent_run.py").read_text())
+        stats = engine.triage_stats()
+    assert stats["files"] == 2
+    assert stats["databricks-notebooks skipped"] == 1
+    assert stats["databricks-dbutils skipped"] == 2
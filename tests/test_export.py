@@ -0,0 +1,58 @@
+import io
+import zipfile
+
+from databricks.sdk.service.workspace import ExportFormat, ObjectType
+
+from databricks.labs.pylint.engine import Engine
+from databricks.labs.pylint.export import archive_sources
+from databricks.labs.pylint.pipeline import Pipeline
+
+
+def test_python_notebooks_are_streamed_from_directory_archive(fake_workspace):
+    fake_workspace.add_notebook("/Users/me/project/first", "dbutils.fs.ls('/tmp')\n")
+    fake_workspace.add_notebook("/Users/me/project/nested/second", "x = 1\n")
+    fake_workspace.add_notebook("/Users/me/project/query", "SELECT 1", language="SQL")
+    fake_workspace.add_file("/Users/me/project/lib/utils.py", "def foo():\n    pass\n")
+    fake_workspace.add_file("/Users/me/project/README.md", "# Project\n")
+    w = fake_workspace.client()
+
+    archive = w.workspace.download("/Users/me/project", format=ExportFormat.SOURCE)
+    sources = {info.path: (info.object_type, source) for info, source in archive_sources("/Users/me/project", archive)}
+
+    assert sources == {
+        "/Users/me/project/first": (ObjectType.NOTEBOOK, "# Databricks notebook source\ndbutils.fs.ls('/tmp')\n"),
+        "/Users/me/project/lib/utils.py": (ObjectType.FILE, "def foo():\n    pass\n"),
+        "/Users/me/project/nested/second": (ObjectType.NOTEBOOK, "# Databricks notebook source\nx = 1\n"),
+    }
+    assert fake_workspace.calls["/api/2.0/workspace/export"] == 1
+
+
+def test_archive_is_linted_without_per_notebook_requests(fake_workspace):
+    for i in range(10):
+        fake_workspace.add_notebook(f"/Users/me/project/nb_{i}", "dbutils.fs.ls('/tmp')\n")
+    w = fake_workspace.client()
+
+    with Engine() as engine:
+        pipeline = Pipeline(lambda _: "", engine.lint)
+        archive = w.workspace.download("/Users/me/project", format=ExportFormat.SOURCE)
+        reports = list(pipeline.run_sources(archive_sources("/Users/me/project", archive)))
+
+    assert len(reports) == 10
+    assert {f.symbol for r in reports for f in r.findings} == {"dbutils-fs-ls"}
+    assert fake_workspace.calls["/api/2.0/workspace/export"] == 1
+    assert fake_workspace.calls["/api/2.0/workspace/list"] == 0
+
+
+def test_workspace_files_in_archive_keep_their_extension():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("utils.py", "def foo(): pass\n")
+        zf.writestr("notebook.py", "# Databricks notebook source\nfoo()\n")
+    buffer.seek(0)
+
+    objects = [(info.path, info.object_type) for info, _ in archive_sources("/Repos/me/project", buffer)]
+
+    assert objects == [
+        ("/Repos/me/project/utils.py", ObjectType.FILE),
+        ("/Repos/me/project/notebook", ObjectType.NOTEBOOK),
+    ]
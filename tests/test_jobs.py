@@ -0,0 +1,74 @@
+from databricks.sdk.errors import NotFound
+from databricks.sdk.service.jobs import JobsAPI
+
+from databricks.labs.pylint.jobs import JobScanner, job_report
+
+
+def job_settings(name: str, spark_version: str, tasks: int = 1, **cluster):
+    return {
+        "name": name,
+        "job_clusters": [
+            {"job_cluster_key": "main", "new_cluster": {"spark_version": spark_version, **cluster}},
+        ],
+        "tasks": [{"task_key": f"task_{i}", "job_cluster_key": "main"} for i in range(tasks)],
+    }
+
+
+def test_job_report_uses_airflow_rules():
+    settings = job_settings("Nightly ETL", "7.3.x-scala2.12")
+    settings["tasks"].append({"task_key": "ingest", "new_cluster": {"spark_version": "13.3.x-scala2.12"}})
+
+    report = job_report(42, settings)
+
+    assert report.module == "Nightly_ETL"
+    assert [f.as_text() for f in report.findings] == [
+        "/jobs/42:0:0: W8901: main cluster missing `data_security_mode` required for Unity Catalog compatibility "
+        "(missing-data-security-mode)",
+        "/jobs/42:0:0: W8902: main cluster has unsupported runtime: 7.3.x-scala2.12 (unsupported-runtime)",
+        "/jobs/42:0:0: W8901: ingest cluster missing `data_security_mode` required for Unity Catalog "
+        "compatibility (missing-data-security-mode)",
+    ]
+    assert {f.confidence for f in report.findings} == {"INFERENCE"}
+
+
+def test_jobs_are_checked_from_listed_pages(fake_workspace):
+    for i in range(150):
+        fake_workspace.add_job(job_settings(f"job_{i}", "7.3.x-scala2.12" if i % 10 == 0 else "14.3.x-scala2.12"))
+    w = fake_workspace.client()
+
+    reports = list(JobScanner(w).run())
+
+    assert [r.path for r in reports] == [f"/jobs/{i + 1}" for i in range(150)]
+    assert sum(len(r.findings) for r in reports) == 150 + 15
+    assert fake_workspace.calls["/api/2.2/jobs/list"] == 2
+    assert fake_workspace.calls["/api/2.2/jobs/get"] == 0
+
+
+def test_truncated_jobs_are_fetched_in_full(fake_workspace):
+    settings = job_settings("huge", "14.3.x-scala2.12", tasks=250, data_security_mode="NONE")
+    settings["tasks"][-1]["new_cluster"] = {"spark_version": "7.3.x-scala2.12", "data_security_mode": "NONE"}
+    fake_workspace.add_job(settings)
+    fake_workspace.add_job(job_settings("small", "14.3.x-scala2.12", data_security_mode="NONE"))
+    w = fake_workspace.client()
+
+    reports = list(JobScanner(w, workers=2, queue_size=2).run())
+
+    assert [f.as_text() for f in reports[0].findings] == [
+        "/jobs/1:0:0: W8902: task_249 cluster has unsupported runtime: 7.3.x-scala2.12 (unsupported-runtime)",
+    ]
+    assert not reports[1].findings
+    assert fake_workspace.calls["/api/2.2/jobs/get"] == 3
+
+
+def test_jobs_deleted_while_scanning_are_skipped(fake_workspace, monkeypatch):
+    fake_workspace.add_job(job_settings("huge", "7.3.x-scala2.12", tasks=150))
+    fake_workspace.add_job(job_settings("small", "7.3.x-scala2.12"))
+    w = fake_workspace.client()
+
+    def deleted(job_id: int, **_):
+        raise NotFound(f"job {job_id} does not exist")
+
+    monkeypatch.setattr(JobsAPI, "get", lambda _, job_id, **kw: deleted(job_id, **kw))
+    reports = list(JobScanner(w).run())
+
+    assert [r.module for r in reports] == ["small"]
@@ -1,4 +1,6 @@
 import pytest
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
 
 from databricks.labs.pylint.legacy import LegacyChecker
 
@@ -44,3 +46,35 @@ def test_legacy_cli(lint_with, code):
 def test_un_incompatible(lint_with, code):
     messages = lint_with(LegacyChecker) << code
     assert "[incompatible-with-uc] Incompatible with Unity Catalog" in messages.pop()
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "df.rdd.map(lambda row: row)",
+        """spark.read.load(
+            'wasbs://container@account/path' #@
+        )""",
+    ],
+)
+def test_more_uc_incompatible_needles(lint_with, code):
+    messages = lint_with(LegacyChecker, uc_incompatible_needles=("rdd.", "wasbs://")) << code
+    assert "[incompatible-with-uc] Incompatible with Unity Catalog" in messages.pop()
+
+
+@pytest.mark.parametrize("needle", ["café", "é"])
+def test_non_ascii_uc_incompatible_needles(tmp_path, monkeypatch, needle):
+    # otherwise pylint picks up the configuration of this project
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "plain.py").write_text("menu = 'tea'\n")
+    (tmp_path / "escaped.py").write_text("menu = 'caf\\xe9'\n")
+    (tmp_path / "unicode.py").write_text("menu = 'café'\n", encoding="utf-8")
+    reporter = CollectingReporter()
+    args = ["--load-plugins=databricks.labs.pylint.all", "--disable=all", "--enable=incompatible-with-uc"]
+
+    Run([*args, f"--uc-incompatible-needles={needle}", "--persistent=n", "."], reporter=reporter, exit=False)
+
+    assert sorted((m.path, m.symbol) for m in reporter.messages) == [
+        ("escaped.py", "incompatible-with-uc"),
+        ("unicode.py", "incompatible-with-uc"),
+    ]
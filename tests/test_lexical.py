@@ -0,0 +1,128 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from databricks.labs.pylint.engine import Engine
+from databricks.labs.pylint.lexical import LEXICAL_MESSAGES, LexicalEngine, main
+
+PROJECT = Path(__file__).parent.parent
+
+TOKEN = "dapi" + "0" * 32
+
+TRICKY = {
+    "docstrings.py": f'"""{TOKEN}"""\n\n\nclass A:\n    """dbfs:/x"""\n\n    def f(self):\n        "dbfs:/y"\n',
+    "formatting.py": (
+        'dbutils.fs.ls(u"/x")\n'
+        "dbutils.fs.cp(a ** 2, -b)\n"
+        'dbutils.fs.head(f"{x!r:>10}")\n'
+        "dbutils.fs.ls(a ** -b + ' ** ' + f(**kw))\n"
+    ),
+    "imports.py": "from . import boto3\nfrom .dbruntime import x\nimport databricks_cli.sdk, s3fs as fs\n",
+    "nested.py": f"x = [dbutils.fs.ls(p) for p in (lambda: '{TOKEN}')()]\nspark.catalog.listTables().count()\n",
+    "pragmas.py": (
+        "dbutils.fs.ls('/a')  # pylint: disable=dbutils-fs-ls\n"
+        "# pylint: disable-next=R8905\n"
+        "dbutils.fs.ls('/b')\n"
+        "def f():  # pylint: disable=dbutils-fs-ls\n"
+        "    dbutils.fs.ls('/c')\n"
+        "def g():\n"
+        "    # pylint: disable=dbutils-fs-ls\n"
+        "    dbutils.fs.ls('/d')\n"
+        "dbutils.fs.ls('/e')\n"
+    ),
+    "skipped.py": "# pylint: skip-file\ndbutils.fs.ls('/a')\n",
+    "long_literals.py": (
+        f"spark.sql(\"SELECT * FROM hive_metastore.db.t WHERE path = 'dbfs:/{'x' * 300}'\")\n"
+        f"spark._jvm.foo('{'y' * 300}', 'dbfs:/')\n"
+        "import boto3, s3fs\n"
+    ),
+    "notebook.py": "# Databricks notebook source\nx = 1\n# COMMAND ----------\n# MAGIC %run ./other\n",
+}
+
+
+def findings(engine, path: Path):
+    report = engine.lint(str(path), path.read_text(encoding="utf-8"))
+    return sorted(
+        (str(Path(f.path).resolve()), f.line, f.column, f.msg_id, f.symbol, f.message, f.confidence)
+        for f in report.findings
+    )
+
+
+def test_same_findings_as_pylint(tmp_path, monkeypatch):
+    # otherwise pylint picks up the configuration of this project
+    monkeypatch.chdir(tmp_path)
+    for name, source in TRICKY.items():
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    paths = [tmp_path, PROJECT / "tests" / "samples", PROJECT / "src", PROJECT / "tests"]
+    files = sorted(f for path in paths for f in Path(path).rglob("*.py"))
+
+    lexical = LexicalEngine(max_cells=1)
+    with Engine(LEXICAL_MESSAGES) as engine:
+        engine._linter.set_option("max-cells", 1)
+        for path in files:
+            assert findings(lexical, path) == findings(engine, path), path
+
+    symbols = {(Path(f[0]).name, f[4]) for path in files for f in findings(lexical, path)}
+    assert ("docstrings.py", "pat-token-leaked") not in symbols
+    assert ("nested.py", "pat-token-leaked") in symbols
+    assert ("imports.py", "legacy-cli") in symbols
+    assert ("notebook.py", "notebooks-too-many-cells") in symbols
+    long_literals = findings(lexical, tmp_path / "long_literals.py")
+    # the literal on the first line has two needles, but only one message
+    assert [f[1] for f in long_literals] == [1, 2, 2, 3]
+    assert max(len(f[5]) for f in long_literals) == len("Incompatible with Unity Catalog: ") + 200
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="astroid renders messages without ast.unparse()")
+def test_imports_neither_pylint_nor_astroid():
+    code = "import sys, databricks.labs.pylint.lexical; print(sorted({m.split('.')[0] for m in sys.modules}))"
+
+    modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert "'pylint'" not in modules
+    assert "'astroid'" not in modules
+
+
+def test_pragmas_disable_messages():
+    source = TRICKY["pragmas.py"]
+
+    report = LexicalEngine().lint("pragmas.py", source)
+
+    assert [(f.line, f.message) for f in report.findings] == [
+        (5, "Use Databricks SDK instead: w.dbfs.list('/c')"),
+        (9, "Use Databricks SDK instead: w.dbfs.list('/e')"),
+    ]
+
+
+def test_messages_that_need_inference_are_rejected():
+    with pytest.raises(ValueError, match="spark-outside-function"):
+        LexicalEngine(["dbutils-fs-ls", "spark-outside-function"])
+
+
+def test_main_prints_findings(tmp_path, capsys):
+    (tmp_path / "clean.py").write_text("x = 1\n")
+    (tmp_path / "broken.py").write_text("def (:\n")
+    (tmp_path / "bad.py").write_text("import databricks_cli\ndbutils.fs.ls('/')\n")
+
+    assert main([str(tmp_path / "clean.py")]) == 0
+    assert main(["--disable=dbutils-fs-ls,legacy-cli", str(tmp_path / "bad.py")]) == 0
+    assert main([str(tmp_path)]) == 1
+    assert main(["--jobs=2", str(tmp_path)]) == 1
+    out = capsys.readouterr().out
+    assert out.splitlines() == 2 * [
+        "************* Module bad",
+        f"{tmp_path / 'bad.py'}:1:0: R8911: Don't use databricks_cli, use databricks.sdk instead: "
+        "pip install databricks-sdk (legacy-cli)",
+        f"{tmp_path / 'bad.py'}:2:0: R8905: Use Databricks SDK instead: w.dbfs.list('/') (dbutils-fs-ls)",
+    ]
+
+
+def test_more_uc_incompatible_needles():
+    source = "df.rdd.map(lambda row: row)\n"
+
+    assert not LexicalEngine().lint("rdd.py", source).findings
+    report = LexicalEngine(uc_incompatible_needles=["rdd."]).lint("rdd.py", source)
+
+    assert [f.message for f in report.findings] == ["Incompatible with Unity Catalog: df.rdd.map(lambda row: row)"]
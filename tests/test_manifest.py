@@ -0,0 +1,128 @@
+import json
+
+from databricks.sdk.service.workspace import ObjectInfo
+
+from databricks.labs.pylint.findings import Finding, Report
+from databricks.labs.pylint.manifest import Manifest, content_hash
+from databricks.labs.pylint.pipeline import Pipeline
+from databricks.labs.pylint.sharding import Shard
+
+
+def notebook(path: str, modified_at: int = 1) -> ObjectInfo:
+    return ObjectInfo(path=path, object_id=hash(path), modified_at=modified_at)
+
+
+def dbutils_lint(path: str, source: str) -> Report:
+    findings = []
+    if "dbutils" in source:
+        findings.append(Finding(path, 1, 0, "R8905", "dbutils-fs-ls", "Use Databricks SDK instead", "HIGH"))
+    return Report(path, "nb", findings, 5.0)
+
+
+class Workspace:
+    def __init__(self, sources):
+        self.sources = sources
+        self.downloads = []
+
+    def download(self, info: ObjectInfo) -> str:
+        self.downloads.append(info.path)
+        return self.sources[info.path]
+
+
+def scan(manifest: Manifest, workspace: Workspace, objects):
+    linted = []
+
+    def lint(path: str, source: str) -> Report:
+        linted.append(path)
+        return dbutils_lint(path, source)
+
+    reports = list(Pipeline(workspace.download, lint, 2, 2, manifest=manifest).run(objects))
+    manifest.prune("/Users/me")
+    manifest.save()
+    return reports, linted
+
+
+def test_unchanged_notebooks_are_replayed(tmp_path):
+    workspace = Workspace({"/Users/me/a": "dbutils.fs.ls('/')", "/Users/me/b": "x = 1"})
+    objects = [notebook("/Users/me/a"), notebook("/Users/me/b")]
+
+    first, linted = scan(Manifest(tmp_path / "manifest.json"), workspace, objects)
+    assert linted == ["/Users/me/a", "/Users/me/b"]
+
+    workspace.downloads.clear()
+    second, linted = scan(Manifest(tmp_path / "manifest.json"), workspace, objects)
+
+    assert not linted
+    assert not workspace.downloads
+    assert second == first
+
+
+def test_modified_notebooks_are_downloaded_and_relinted(tmp_path):
+    workspace = Workspace({"/Users/me/a": "dbutils.fs.ls('/')"})
+    scan(Manifest(tmp_path / "manifest.json"), workspace, [notebook("/Users/me/a")])
+
+    workspace.sources["/Users/me/a"] = "x = 1"
+    reports, linted = scan(Manifest(tmp_path / "manifest.json"), workspace, [notebook("/Users/me/a", 2)])
+
+    assert linted == ["/Users/me/a"]
+    assert not reports[0].findings
+
+
+def test_touched_notebooks_with_same_content_are_not_relinted(tmp_path):
+    workspace = Workspace({"/Users/me/a": "dbutils.fs.ls('/')"})
+    scan(Manifest(tmp_path / "manifest.json"), workspace, [notebook("/Users/me/a")])
+
+    reports, linted = scan(Manifest(tmp_path / "manifest.json"), workspace, [notebook("/Users/me/a", 2)])
+
+    assert not linted
+    assert workspace.downloads == ["/Users/me/a", "/Users/me/a"]
+    assert reports[0].findings[0].symbol == "dbutils-fs-ls"
+
+
+def test_deleted_notebooks_are_pruned(tmp_path):
+    workspace = Workspace({"/Users/me/a": "x = 1", "/Users/me/b": "x = 2"})
+    scan(Manifest(tmp_path / "manifest.json"), workspace, [notebook("/Users/me/a"), notebook("/Users/me/b")])
+
+    scan(Manifest(tmp_path / "manifest.json"), workspace, [notebook("/Users/me/a")])
+
+    raw = json.loads((tmp_path / "manifest.json").read_text())
+    assert list(raw["entries"]) == ["/Users/me/a"]
+    assert raw["entries"]["/Users/me/a"]["sha256"] == content_hash("x = 1")
+
+
+def test_shards_keep_entries_of_other_shards(tmp_path):
+    paths = [f"/Users/me/{i}" for i in range(8)]
+    workspace = Workspace({path: "x = 1" for path in paths})
+    shards = [Shard(1, 2), Shard(2, 2)]
+    for shard in shards:
+        manifest = Manifest(tmp_path / "manifest.json")
+        list(
+            Pipeline(workspace.download, dbutils_lint, 2, 2, manifest=manifest).run(
+                notebook(path) for path in paths if shard.owns(path)
+            )
+        )
+        manifest.prune("/Users/me", shard.owns)
+        manifest.save()
+
+    raw = json.loads((tmp_path / "manifest.json").read_text())
+    assert sorted(raw["entries"]) == paths
+
+
+def test_manifest_from_other_version_is_ignored(tmp_path):
+    path = tmp_path / "manifest.json"
+    info = notebook("/Users/me/a")
+    manifest = Manifest(path)
+    manifest.record(info, "abc", Report("/Users/me/a", "a"))
+    manifest.save()
+    raw = json.loads(path.read_text())
+    raw["version"] = "0.0.1"
+    path.write_text(json.dumps(raw))
+
+    assert Manifest(path).lookup(info) is None
+
+
+def test_corrupted_manifest_is_ignored(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json")
+
+    assert Manifest(path).lookup(notebook("/Users/me/a")) is None
@@ -0,0 +1,60 @@
+import astroid
+import pytest
+from astroid import MANAGER
+from astroid.context import _INFERENCE_CACHE
+
+from databricks.labs.pylint.engine import Engine
+from databricks.labs.pylint.memory import ModuleCache
+
+
+def test_library_modules_are_evicted_least_recently_used_first():
+    MANAGER.ast_from_module_name("builtins")
+    with ModuleCache(max_modules=len(MANAGER.astroid_cache) + 2) as cache:
+        astroid.parse("x = 1", module_name="lib_a")
+        astroid.parse("y = 2", module_name="lib_b")
+        MANAGER.ast_from_module_name("lib_a")
+        astroid.parse("z = 3", module_name="lib_c")
+
+        assert "lib_a" in MANAGER.astroid_cache
+        assert "lib_b" not in MANAGER.astroid_cache
+        assert "builtins" in MANAGER.astroid_cache
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+        assert stats.hit_rate == 0.25
+
+
+def test_released_module_is_forgotten():
+    with ModuleCache() as cache:
+        module = astroid.parse("import os\nx = os.path.join('a', 'b')\n", module_name="notebook_1")
+        next(module.body[1].value.infer())
+        assert MANAGER.astroid_cache["notebook_1"] is module
+        assert _INFERENCE_CACHE
+
+        cache.release(module)
+
+        assert "notebook_1" not in MANAGER.astroid_cache
+        assert not _INFERENCE_CACHE
+
+
+def test_uninstall_keeps_cached_modules():
+    with ModuleCache():
+        MANAGER.ast_from_module_name("json")
+    assert type(MANAGER.astroid_cache) is dict  # pylint: disable=unidiomatic-typecheck
+    assert "json" in MANAGER.astroid_cache
+
+
+def test_max_modules_must_be_positive():
+    with pytest.raises(ValueError):
+        ModuleCache(max_modules=0)
+
+
+def test_engine_memory_does_not_grow_with_notebooks():
+    source = "import json\n\nfor i in range(3):\n    print(json.dumps({'i': i}))\n\ndbutils.fs.ls('/')\n"
+    with Engine(max_modules=64) as engine:
+        pinned = len(MANAGER.astroid_cache)
+        for i in range(300):
+            report = engine.lint(f"/Users/me/notebook_{i}", source)
+            assert [f.symbol for f in report.findings] == ["dbutils-fs-ls"]
+        assert not any(modname.startswith("notebook_") for modname in MANAGER.astroid_cache)
+        assert engine.cache_stats().modules <= max(64, pinned)
+        assert not _INFERENCE_CACHE
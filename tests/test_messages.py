@@ -0,0 +1,94 @@
+import pytest
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from databricks.labs.pylint.calls import CallResolver
+
+SQL = "SELECT * FROM hive_metastore.db.t WHERE path = 'dbfs:/" + "x" * 300 + "'"
+
+
+@pytest.fixture(autouse=True)
+def outside_of_project(tmp_path, monkeypatch):
+    # otherwise pylint picks up the configuration of this project
+    monkeypatch.chdir(tmp_path)
+
+
+def lint(path, *args):
+    reporter = CollectingReporter()
+    Run(
+        ["--load-plugins=databricks.labs.pylint.all", "--disable=all", "--enable=incompatible-with-uc", *args]
+        + ["--persistent=n", str(path)],
+        reporter=reporter,
+        exit=False,
+    )
+    return [(m.line, m.msg) for m in reporter.messages]
+
+
+def test_one_message_per_node_and_symbol_cut_to_width(tmp_path):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(f'spark.sql("{SQL}")\n')
+
+    messages = lint(notebook)
+
+    assert messages == [(1, "Incompatible with Unity Catalog: " + repr(SQL)[:197] + "...")]
+
+
+def test_no_limit(tmp_path):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(f'spark.sql("{SQL}")\n')
+
+    messages = lint(notebook, "--message-width=0")
+
+    assert messages == [(1, "Incompatible with Unity Catalog: " + repr(SQL))]
+
+
+def test_arguments_of_disabled_messages_are_not_rendered(tmp_path, monkeypatch):
+    rendered = []
+    shortened = CallResolver.shortened
+
+    def counting(self, node, width):
+        rendered.append(node.lineno)
+        return shortened(self, node, width)
+
+    monkeypatch.setattr(CallResolver, "shortened", counting)
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(f'spark.sql("{SQL}")  # pylint: disable=incompatible-with-uc\nspark.sql("dbfs:/x")\n')
+
+    messages = lint(notebook)
+
+    assert messages == [(2, "Incompatible with Unity Catalog: 'dbfs:/x'")]
+    assert rendered == [2]
+
+
+def test_messages_with_other_arguments_for_the_same_node(tmp_path):
+    dag = tmp_path / "dag.py"
+    dag.write_text(
+        "from airflow.providers.databricks.operators.databricks import DatabricksCreateJobsOperator\n"
+        "cluster = {'spark_version': '7.3.x-scala2.12', 'num_workers': 2}\n"
+        "tasks = [{'task_key': 'a', 'new_cluster': cluster}, {'task_key': 'b', 'new_cluster': cluster}]\n"
+        "DatabricksCreateJobsOperator(task_id='create', tasks=tasks)\n"
+    )
+
+    messages = lint(dag, "--enable=missing-data-security-mode,unsupported-runtime")
+
+    assert messages == [
+        (4, "a cluster missing `data_security_mode` required for Unity Catalog compatibility"),
+        (4, "a cluster has unsupported runtime: 7.3.x-scala2.12"),
+        (4, "b cluster missing `data_security_mode` required for Unity Catalog compatibility"),
+        (4, "b cluster has unsupported runtime: 7.3.x-scala2.12"),
+    ]
+
+
+def test_custom_rules_matching_the_same_node(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        "[[tool.databricks-labs-pylint.rules]]\n"
+        'node = "call"\nprefix = "legacy_client."\nmessage = "Use the new client"\n\n'
+        "[[tool.databricks-labs-pylint.rules]]\n"
+        'node = "call"\nsuffix = ".upload_file"\nmessage = "Use volumes"\n'
+    )
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text("legacy_client.upload_file('x')\n")
+
+    messages = lint(notebook, "--enable=custom-rule")
+
+    assert messages == [(1, "Use the new client"), (1, "Use volumes")]
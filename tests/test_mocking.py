@@ -76,3 +76,67 @@ mocked_thing.foo.bar.assert_called_once()
     )
 
     assert not messages
+
+
+def test_mock_used_in_nested_statements(lint_with):
+    messages = (
+        lint_with(MockingChecker)
+        << """def test_something():
+    ws = (
+        create_autospec(WorkspaceClient) #@
+    )
+    with patch_env():
+        for _ in range(3):
+            run(ws)
+    if True:
+        ws.jobs.list.assert_called()
+"""
+    )
+
+    assert not messages
+
+
+def test_mock_assigned_again_before_usage(lint_with):
+    messages = (
+        lint_with(MockingChecker)
+        << """def test_something():
+    ws = (
+        create_autospec(WorkspaceClient) #@
+    )
+    run(ws)
+    ws = create_autospec(WorkspaceClient)
+    ws.jobs.list.return_value = []
+"""
+    )
+
+    assert "[mock-no-usage] Missing usage of mock for WorkspaceClient" in messages
+
+
+def test_mock_in_attribute(lint_with):
+    messages = (
+        lint_with(MockingChecker)
+        << """class TestJobs:
+    def setup(self):
+        self.ws = (
+            create_autospec(WorkspaceClient) #@
+        )
+        self.ws.jobs.list.side_effect = NotFound()
+"""
+    )
+
+    assert not messages
+
+
+def test_mock_without_usage(lint_with):
+    messages = (
+        lint_with(MockingChecker)
+        << """def test_something():
+    ws = (
+        create_autospec(WorkspaceClient) #@
+    )
+    other.jobs.list.return_value = []
+    assert run(ws)
+"""
+    )
+
+    assert "[mock-no-usage] Missing usage of mock for WorkspaceClient" in messages
@@ -0,0 +1,73 @@
+import io
+import json
+import tracemalloc
+
+from databricks.labs.pylint.findings import Finding, Report
+from databricks.labs.pylint.output import JsonLinesOutput, TextOutput
+
+
+def report(path: str, *symbols: str) -> Report:
+    findings = [Finding(path, i + 1, 0, "R8905", symbol, "message", "HIGH") for i, symbol in enumerate(symbols)]
+    return Report(path, "notebook", findings, 5.0)
+
+
+def test_text_output():
+    out = io.StringIO()
+    output = TextOutput(out)
+
+    output.write(report("/Users/me/a", "dbutils-fs-ls"))
+    output.close()
+
+    assert out.getvalue().startswith("************* Module notebook\n/Users/me/a:1:0: R8905: message (dbutils-fs-ls)\n")
+
+
+def test_json_lines_output():
+    out = io.StringIO()
+    output = JsonLinesOutput(out)
+
+    output.write(report("/Users/me/a", "dbutils-fs-ls", "dbutils-fs-cp"))
+    output.write(report("/Users/me/b"))
+    output.write(report("/Users/you/c", "dbutils-fs-ls"))
+    output.close()
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[0] == {
+        "type": "finding",
+        "path": "/Users/me/a",
+        "msg_id": "R8905",
+        "symbol": "dbutils-fs-ls",
+        "line": 1,
+        "column": 0,
+        "confidence": "HIGH",
+        "message": "message",
+    }
+    assert [r["path"] for r in records[:-1]] == ["/Users/me/a", "/Users/me/a", "/Users/you/c"]
+    assert records[-1] == {
+        "type": "summary",
+        "notebooks": 3,
+        "findings": 3,
+        "by_symbol": {"dbutils-fs-ls": 2, "dbutils-fs-cp": 1},
+        "by_directory": {"/Users/me": 2, "/Users/you": 1},
+    }
+
+
+class NullWriter(io.TextIOBase):
+    def write(self, s):
+        return len(s)
+
+
+def test_json_lines_output_memory_is_flat():
+    output = JsonLinesOutput(NullWriter())
+
+    def scan(count: int) -> int:
+        tracemalloc.start()
+        for i in range(count):
+            output.write(report(f"/Users/me/notebook_{i}", "dbutils-fs-ls", "dbutils-fs-cp"))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small = scan(100)
+    large = scan(10_000)
+
+    assert large < small * 2
@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+from databricks.sdk.service.workspace import ObjectInfo
+
+from databricks.labs.pylint.findings import Report
+from databricks.labs.pylint.pipeline import Pipeline
+
+
+def notebooks(count: int):
+    for i in range(count):
+        yield ObjectInfo(path=f"/Users/me/notebook_{i}")
+
+
+def echo_lint(path: str, source: str) -> Report:
+    return Report(path, source)
+
+
+def test_reports_are_ordered_as_incoming_notebooks():
+    def download(info: ObjectInfo) -> str:
+        # later notebooks finish downloading earlier
+        time.sleep((10 - int(info.path.split("_")[-1])) / 1000)
+        return info.path.upper()
+
+    pipeline = Pipeline(download, echo_lint, download_workers=4, queue_size=8)
+    reports = list(pipeline.run(notebooks(10)))
+
+    assert [r.path for r in reports] == [f"/Users/me/notebook_{i}" for i in range(10)]
+    assert [r.module for r in reports] == [f"/USERS/ME/NOTEBOOK_{i}" for i in range(10)]
+
+
+def test_downloads_do_not_run_far_ahead_of_linter():
+    lock = threading.Lock()
+    downloaded = []
+    ahead = []
+
+    def download(info: ObjectInfo) -> str:
+        with lock:
+            downloaded.append(info.path)
+        return ""
+
+    def lint(path: str, source: str) -> Report:
+        time.sleep(0.001)
+        with lock:
+            ahead.append(len(downloaded) - len(ahead))
+        return Report(path, source)
+
+    pipeline = Pipeline(download, lint, download_workers=2, queue_size=4)
+    assert len(list(pipeline.run(notebooks(50)))) == 50
+    assert max(ahead) <= 4
+
+
+def test_downloads_overlap_with_linting():
+    def download(_: ObjectInfo) -> str:
+        time.sleep(0.02)
+        return ""
+
+    def lint(path: str, source: str) -> Report:
+        time.sleep(0.02)
+        return Report(path, source)
+
+    started = time.monotonic()
+    assert len(list(Pipeline(download, lint, download_workers=4, queue_size=8).run(notebooks(20)))) == 20
+    # sequential would take 20 * (0.02 + 0.02) = 0.8s
+    assert time.monotonic() - started < 0.7
+
+
+def test_failed_download_is_skipped():
+    def download(info: ObjectInfo) -> str:
+        if info.path.endswith("_3"):
+            raise OSError("connection reset")
+        return ""
+
+    reports = list(Pipeline(download, echo_lint, download_workers=2, queue_size=2).run(notebooks(5)))
+
+    assert [r.path for r in reports] == [f"/Users/me/notebook_{i}" for i in (0, 1, 2, 4)]
+
+
+def test_queue_size_must_fit_workers():
+    with pytest.raises(ValueError):
+        Pipeline(echo_lint, echo_lint, download_workers=8, queue_size=4)
@@ -0,0 +1,203 @@
+import pytest
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from databricks.labs.pylint.rulebook import UC_INCOMPATIBLE_BRUTE_FORCE, Automaton, Rule, RuleIndex
+from databricks.labs.pylint.rules import RulesChecker, load_rules
+
+RULES = """
+[[tool.databricks-labs-pylint.rules]]
+node = "call"
+prefix = "spark.sparkContext."
+message = "Use the Spark session instead of the Spark context"
+
+[[tool.databricks-labs-pylint.rules]]
+node = "import"
+equals = "pandas_profiling"
+message = "Use ydata_profiling instead"
+
+[[tool.databricks-labs-pylint.rules]]
+node = "literal"
+contains = "/dbfs/mnt/"
+message = "Use Unity Catalog Volumes"
+"""
+
+
+def test_matches_in_the_order_of_rules():
+    index = RuleIndex(
+        [
+            Rule("a", "call", "contains", "fs."),
+            Rule("b", "call", "equals", "dbutils.fs.ls"),
+            Rule("c", "call", "suffix", ".ls"),
+            Rule("d", "call", "prefix", "dbutils."),
+            Rule("e", "call", "prefix", "dbutils.fs.cp"),
+            Rule("f", "import", "equals", "dbutils.fs.ls"),
+        ]
+    )
+
+    assert [rule.symbol for rule in index.match("call", "dbutils.fs.ls")] == ["a", "b", "c", "d"]
+    assert [rule.symbol for rule in index.match("call", "ls")] == []
+    assert [rule.symbol for rule in index.match("import", "dbutils.fs.ls")] == ["f"]
+
+
+@pytest.mark.parametrize(
+    "text, found",
+    [
+        ("spark._jvm.foo", ["_jvm", "spark._jvm"]),
+        ("spark._jsparkSession.catalog", ["spark._jspark", "spark._jsparkSession.catalog"]),
+        ("df._jdf._jdf", ["._jdf"]),
+        ("applyInPandasWithState", ["applyInPandas", "applyInPandasWithState"]),
+        ("sc.pickleFile('dbfs:/x')", ["dbfs:", "pickleFile"]),
+        ("spark.table", []),
+        ("", []),
+    ],
+)
+def test_automaton_finds_overlapping_needles(text, found):
+    needles = sorted(UC_INCOMPATIBLE_BRUTE_FORCE)
+    automaton = Automaton(needles)
+
+    assert [needles[i] for i in automaton.scan(text)] == found
+    assert [needles[i] for i in automaton.find(text)] == found
+
+
+def test_automaton_finds_the_same_needles_as_substring_search():
+    needles = ["he", "she", "his", "hers", "e", "ers", "rs", "he"]
+    automaton = Automaton(needles)
+    for length in range(7):
+        for number in range(6**length):
+            text = "".join("hersix"[number // 6**i % 6] for i in range(length))
+            assert automaton.scan(text) == [i for i, needle in enumerate(needles) if needle in text], text
+
+
+def test_renders_only_needed_arguments():
+    rendered = []
+
+    def node():
+        rendered.append("node")
+        return "dbutils.fs.cp('a', 'b')"
+
+    index = RuleIndex(
+        [
+            Rule("cp", "call", "equals", "dbutils.fs.cp", args=("arg1", "arg0")),
+            Rule("x", "call", "prefix", "d"),
+        ]
+    )
+
+    assert list(index.problems("call", "dbutils.fs.cp", node, lambda i: "ab"[i], first=True)) == [("cp", ("b", "a"))]
+    assert list(index.problems("call", "dbutils.fs.cp", node, lambda i: "ab"[i])) == [("cp", ("b", "a")), ("x", None)]
+    assert not rendered
+
+
+def test_one_problem_per_symbol_and_arguments():
+    index = RuleIndex(
+        [
+            Rule("incompatible-with-uc", "literal", "contains", "dbfs:", args=("node",)),
+            Rule("incompatible-with-uc", "literal", "contains", "hive_metastore.", args=("node",)),
+            Rule("custom-rule", "literal", "contains", "dbfs:", message="a"),
+            Rule("custom-rule", "literal", "contains", "hive_metastore.", message="b"),
+        ]
+    )
+
+    problems = index.problems("literal", "hive_metastore.x dbfs:/", lambda: "node")
+
+    assert list(problems) == [("incompatible-with-uc", ("node",)), ("custom-rule", ("a",)), ("custom-rule", ("b",))]
+
+
+def test_load_rules(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(RULES)
+
+    rules = load_rules(pyproject)
+
+    assert rules[1] == Rule(
+        "custom-rule", "import", "equals", "pandas_profiling", message="Use ydata_profiling instead"
+    )
+    assert [rule.match for rule in rules] == ["prefix", "equals", "contains"]
+    assert load_rules(tmp_path / "missing.toml") == []
+
+
+@pytest.mark.parametrize(
+    "rule, error",
+    [
+        ('node = "attribute"\nequals = "x"\nmessage = "y"', "node must be one of call, import, literal"),
+        ('node = "call"\nmessage = "y"', "needs exactly one of equals, prefix, suffix, contains"),
+        ('node = "call"\nequals = "x"\nprefix = "x"\nmessage = "y"', "needs exactly one of"),
+        ('node = "call"\nequals = ""\nmessage = "y"', "needs a non-empty equals and a message"),
+        ('node = "call"\nequals = "x"', "needs a non-empty equals and a message"),
+    ],
+)
+def test_invalid_rules(tmp_path, rule, error):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(f"[[tool.databricks-labs-pylint.rules]]\n{rule}\n")
+
+    with pytest.raises(ValueError, match=f"rule 1: {error}"):
+        load_rules(pyproject)
+
+
+@pytest.mark.parametrize(
+    "code, message",
+    [
+        ("spark.sparkContext.parallelize([1, 2])", "Use the Spark session instead of the Spark context"),
+        ("import pandas_profiling", "Use ydata_profiling instead"),
+        ("from pandas_profiling import ProfileReport", "Use ydata_profiling instead"),
+        ("open('/dbfs/mnt/raw/x.csv')", None),
+        ("open(\n'/dbfs/mnt/raw/x.csv' #@\n)", "Use Unity Catalog Volumes"),
+    ],
+)
+def test_custom_rules(lint_with, tmp_path, code, message):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(RULES)
+
+    messages = lint_with(RulesChecker, rules_file=str(pyproject)) << code
+
+    assert messages == ({f"[custom-rule] {message}"} if message else set())
+
+
+def test_no_rules(lint_with, tmp_path):
+    checker = lint_with(RulesChecker, rules_file=str(tmp_path / "pyproject.toml"))
+
+    assert checker << "spark.sparkContext.parallelize([1, 2])" == set()
+
+
+def test_rules_from_pyproject_of_current_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(RULES)
+    job = "import pandas_profiling\n\n\ndef rows(spark):\n    return spark.sparkContext.emptyRDD()\n"
+    (tmp_path / "job.py").write_text(job)
+    (tmp_path / "plain.py").write_text("import pandas\n")
+    reporter = CollectingReporter()
+
+    Run(
+        ["--load-plugins=databricks.labs.pylint.all", "--disable=all", "--enable=custom-rule", "--persistent=n", "."],
+        reporter=reporter,
+        exit=False,
+    )
+
+    assert sorted((m.path, m.line, m.msg) for m in reporter.messages) == [
+        ("job.py", 1, "Use ydata_profiling instead"),
+        ("job.py", 5, "Use the Spark session instead of the Spark context"),
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["café", "é"])
+def test_rules_with_non_ascii_patterns(tmp_path, monkeypatch, pattern):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text(
+        f'[[tool.databricks-labs-pylint.rules]]\nnode = "literal"\ncontains = "{pattern}"\nmessage = "No cafés"\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "plain.py").write_text("menu = 'tea'\n")
+    (tmp_path / "escaped.py").write_text("menu = 'caf\\xe9'\n")
+    (tmp_path / "unicode.py").write_text("menu = 'café'\n", encoding="utf-8")
+    reporter = CollectingReporter()
+
+    Run(
+        ["--load-plugins=databricks.labs.pylint.all", "--disable=all", "--enable=custom-rule", "--persistent=n", "."],
+        reporter=reporter,
+        exit=False,
+    )
+
+    assert sorted((m.path, m.msg) for m in reporter.messages) == [
+        ("escaped.py", "No cafés"),
+        ("unicode.py", "No cafés"),
+    ]
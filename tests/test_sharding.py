@@ -0,0 +1,93 @@
+import pytest
+
+from databricks.labs.pylint.findings import Finding, Report
+from databricks.labs.pylint.sharding import ResultsWriter, Shard, merge_results
+
+PATHS = [f"/Users/me/project_{i}/notebook_{j}" for i in range(20) for j in range(50)]
+
+
+def test_parse():
+    assert Shard.parse("2/4") == Shard(2, 4)
+    assert str(Shard(2, 4)) == "2/4"
+
+
+@pytest.mark.parametrize("spec", ["0/4", "5/4", "1", "a/b", "1/2/3"])
+def test_parse_invalid(spec):
+    with pytest.raises(ValueError):
+        Shard.parse(spec)
+
+
+def test_every_path_belongs_to_exactly_one_shard():
+    shards = [Shard(k, 4) for k in range(1, 5)]
+
+    owners = [[shard for shard in shards if shard.owns(path)] for path in PATHS]
+
+    assert all(len(owner) == 1 for owner in owners)
+    # roughly even split
+    assert all(150 < sum(1 for owner in owners if owner[0] == shard) < 350 for shard in shards)
+
+
+def test_assignment_is_stable():
+    assert [Shard(3, 7).owns(path) for path in PATHS] == [Shard(3, 7).owns(path) for path in PATHS]
+
+
+def report(path: str) -> Report:
+    finding = Finding(path, 1, 0, "R8905", "dbutils-fs-ls", "Use Databricks SDK instead: w.dbfs.list('/')", "HIGH")
+    return Report(path, path.rsplit("/", 1)[-1], [finding], 5.0)
+
+
+def write_shards(tmp_path, total: int, paths):
+    files = []
+    for k in range(1, total + 1):
+        shard = Shard(k, total)
+        writer = ResultsWriter(tmp_path / f"results-{k}.jsonl", "/Users/me", shard)
+        for path in paths:
+            if shard.owns(path):
+                writer.write(report(path))
+        writer.close()
+        files.append(tmp_path / f"results-{k}.jsonl")
+    return files
+
+
+def test_merged_shards_are_same_as_single_runner(tmp_path):
+    (tmp_path / "single").mkdir()
+    single = write_shards(tmp_path / "single", 1, reversed(PATHS))
+    sharded = write_shards(tmp_path, 3, PATHS)
+
+    assert merge_results(sharded) == merge_results(single)
+    assert [r.path for r in merge_results(sharded)] == sorted(PATHS)
+
+
+def test_merge_deduplicates_reports(tmp_path):
+    files = write_shards(tmp_path, 2, PATHS)
+
+    merged = merge_results(files + files)
+
+    assert len(merged) == len(PATHS)
+
+
+def test_merge_warns_about_missing_shards(tmp_path, caplog):
+    files = write_shards(tmp_path, 3, PATHS)
+
+    merge_results(files[:2])
+
+    assert "results are missing for shards: 3/3" in caplog.text
+
+
+def test_merge_of_different_paths_fails(tmp_path):
+    first = ResultsWriter(tmp_path / "first.jsonl", "/Users/me")
+    first.close()
+    second = ResultsWriter(tmp_path / "second.jsonl", "/Repos/me")
+    second.close()
+
+    with pytest.raises(ValueError):
+        merge_results([tmp_path / "first.jsonl", tmp_path / "second.jsonl"])
+
+
+def test_unfinished_results_are_not_visible(tmp_path):
+    writer = ResultsWriter(tmp_path / "results.jsonl", "/Users/me", Shard(1, 2))
+    writer.write(report("/Users/me/a"))
+
+    assert not (tmp_path / "results.jsonl").exists()
+    writer.close()
+    assert (tmp_path / "results.jsonl").exists()
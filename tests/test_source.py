@@ -0,0 +1,37 @@
+import astroid
+
+from databricks.labs.pylint.source import SourceView, source_view
+
+
+def test_lines_split_only_on_newlines():
+    view = SourceView(b"a = 1\r\nb = '\rc'\n\nd = 2")
+
+    assert list(view.lines()) == [b"a = 1\r\n", b"b = '\rc'\n", b"\n", b"d = 2"]
+
+
+def test_comments_up_to_the_first_error():
+    view = SourceView("# x = 1\ns = 'ü'\nif s:\n        a\n    b\n# y = 2\n".encode("latin-1"), "latin-1")
+
+    assert view.text.startswith("# x = 1\ns = 'ü'")
+    assert [(t.string, t.start) for t in view.comments] == [("# x = 1", (1, 0))]
+
+
+def test_module_source_is_read_once():
+    module = astroid.parse("x = 1\n")
+    module.file_bytes = b"x = 1\n"
+    reads = []
+    stream = module.stream
+
+    def counting():
+        reads.append(module)
+        return stream()
+
+    module.stream = counting
+
+    first = source_view(module)
+    second = source_view(module)
+    other = source_view(astroid.parse("y = 2\n"))
+
+    assert first is second
+    assert other is not first
+    assert len(reads) == 1
@@ -1,3 +1,7 @@
+import astroid
+from pylint.testutils import UnittestLinter
+from pylint.utils import ASTWalker
+
 from databricks.labs.pylint.spark import SparkChecker
 
 
@@ -45,3 +49,63 @@ def test_df_show(lint_with):
         "[use-display-instead-of-show] Rewrite to display in a notebook: display(spark.read.csv('file.csv'))"
         in messages
     )
+
+
+def lint_module(code: str):
+    linter = UnittestLinter()
+    checker = SparkChecker(linter)
+    checker.open()
+    walker = ASTWalker(linter)
+    walker.add_checker(checker)
+    walker.walk(astroid.parse(code))
+    return sorted((m.msg_id, m.node.lineno) for m in linter.release_messages())
+
+
+def test_one_message_per_function():
+    code = """def do_something(x):
+    spark.table('a')
+    return [spark.table(t) for t in x]
+
+
+def do_more(x):
+    return spark.table(x)
+"""
+    assert lint_module(code) == [("no-spark-argument-in-function", 1), ("no-spark-argument-in-function", 6)]
+
+
+def test_spark_from_enclosing_scopes():
+    code = """def with_closure(spark):
+    def inner(x):
+        return spark.table(x)
+
+    return inner
+
+
+def with_local():
+    spark = SparkSession.builder.getOrCreate()
+    return lambda x: spark.table(x)
+
+
+def with_global():
+    global spark
+    spark = SparkSession.builder.getOrCreate()
+    return spark
+
+
+class Job:
+    def run(self, spark):
+        return spark.table('a')
+
+    def rerun(self):
+        return spark.table('a')
+
+
+tables = map(lambda spark: spark.table('a'), sessions)
+first = [spark.table('a') for spark in sessions]
+spark.table('b')
+"""
+    assert lint_module(code) == [
+        ("no-spark-argument-in-function", 13),
+        ("no-spark-argument-in-function", 23),
+        ("spark-outside-function", 29),
+    ]
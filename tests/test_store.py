@@ -0,0 +1,82 @@
+import time
+
+from databricks.labs.pylint.findings import Finding, Report
+from databricks.labs.pylint.store import FindingsStore
+
+
+def report(path: str, *symbols) -> Report:
+    findings = [Finding(path, line, 0, "R8905", symbol, "msg", "HIGH") for symbol, line in symbols]
+    return Report(path, "notebook", findings)
+
+
+def record(store: FindingsStore, *reports: Report) -> int:
+    store.start_scan("/Users")
+    for r in reports:
+        store.write(r)
+    return store.finish_scan()
+
+
+def test_regressions_ignore_shifted_lines(tmp_path):
+    store = FindingsStore(tmp_path / "findings.db")
+    first = record(
+        store,
+        report("/Users/a/x", ("dbutils-fs-ls", 1), ("dbutils-fs-ls", 5)),
+        report("/Users/b/y", ("dbutils-fs-cp", 3)),
+    )
+    second = record(
+        store,
+        # a line added on top shifts both findings, a third one is new
+        report("/Users/a/x", ("dbutils-fs-ls", 2), ("dbutils-fs-ls", 6), ("dbutils-fs-ls", 9)),
+        report("/Users/c/z", ("internal-api", 1)),
+    )
+
+    regressions = list(store.new_findings(second, since=first))
+    fixed = list(store.fixed_findings(second, since=first))
+
+    assert [f.as_text() for r in regressions for f in r.findings] == [
+        "/Users/a/x:9:0: R8905: msg (dbutils-fs-ls)",
+        "/Users/c/z:1:0: R8905: msg (internal-api)",
+    ]
+    assert [f.as_text() for r in fixed for f in r.findings] == ["/Users/b/y:3:0: R8905: msg (dbutils-fs-cp)"]
+    assert store.by_symbol(second) == {"dbutils-fs-ls": 3, "internal-api": 1}
+    assert store.by_directory(second) == {"/Users/a": 3, "/Users/c": 1}
+
+
+def test_unfinished_scans_are_not_compared(tmp_path):
+    store = FindingsStore(tmp_path / "findings.db")
+    first = record(store, report("/Users/a/x", ("dbutils-fs-ls", 1)))
+    store.start_scan("/Users")
+    store.write(report("/Users/a/x"))
+    store.close()
+
+    store = FindingsStore(tmp_path / "findings.db")
+    assert store.latest_scan() == first
+    assert store.latest_scan(before=first) is None
+    assert len(store.scans()) == 2
+
+
+def test_findings_are_inserted_in_batches(tmp_path):
+    store = FindingsStore(tmp_path / "findings.db", batch_size=100)
+    store.start_scan("/Users")
+    for i in range(250):
+        store.write(report(f"/Users/nb_{i}", ("dbutils-fs-ls", 1)))
+    other = FindingsStore(tmp_path / "findings.db")
+    (visible,) = other._conn.execute("SELECT COUNT(*) FROM findings").fetchone()  # pylint: disable=protected-access
+    assert visible == 200
+    store.finish_scan()
+    (visible,) = other._conn.execute("SELECT COUNT(*) FROM findings").fetchone()  # pylint: disable=protected-access
+    assert visible == 250
+
+
+def test_regressions_are_fast_over_large_scans(tmp_path):
+    store = FindingsStore(tmp_path / "findings.db", batch_size=10_000)
+    reports = [report(f"/Users/d_{i % 100}/nb_{i}", ("dbutils-fs-ls", 1), ("dbutils-fs-cp", 2)) for i in range(10_000)]
+    first = record(store, *reports)
+    second = record(store, *reports, report("/Users/new", ("internal-api", 1)))
+
+    started = time.monotonic()
+    regressions = list(store.new_findings(second, since=first))
+    elapsed = time.monotonic() - started
+
+    assert [r.path for r in regressions] == ["/Users/new"]
+    assert elapsed < 1
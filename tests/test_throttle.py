@@ -0,0 +1,130 @@
+import threading
+
+import pytest
+from databricks.sdk.service.workspace import ExportFormat, ObjectInfo
+
+from databricks.labs.pylint.findings import Report
+from databricks.labs.pylint.pipeline import Pipeline
+from databricks.labs.pylint.throttle import AdaptiveLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_concurrency_grows_while_healthy():
+    limiter = AdaptiveLimiter(initial=2, maximum=8, clock=FakeClock())
+
+    for _ in range(10):
+        limiter.observe(200, 0.1)
+
+    # 2 -> 2.5 -> 2.9 -> 3.24 -> ... -> 4.09
+    assert limiter.concurrency == 4
+
+
+def test_concurrency_is_capped():
+    limiter = AdaptiveLimiter(initial=2, maximum=3, clock=FakeClock())
+
+    for _ in range(100):
+        limiter.observe(200, 0.1)
+
+    assert limiter.concurrency == 3
+
+
+def test_slow_responses_do_not_grow_concurrency():
+    limiter = AdaptiveLimiter(initial=2, latency_threshold=1.0, clock=FakeClock())
+
+    for _ in range(10):
+        limiter.observe(200, 1.5)
+
+    assert limiter.concurrency == 2
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_throttling_halves_concurrency_once_per_round_trip(status):
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial=16, maximum=16, clock=clock)
+
+    # all of these requests were sent before the first decrease
+    for _ in range(5):
+        limiter.observe(status, 0.5)
+    assert limiter.concurrency == 8
+
+    clock.now += 1
+    limiter.observe(status, 0.5)
+    assert limiter.concurrency == 4
+    assert limiter.stats().throttled == 6
+
+
+def test_concurrency_does_not_drop_below_minimum():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial=2, minimum=1, clock=clock)
+
+    for _ in range(10):
+        clock.now += 1
+        limiter.observe(429, 0.1)
+
+    assert limiter.concurrency == 1
+
+
+def test_errors_are_counted_but_do_not_grow_concurrency():
+    limiter = AdaptiveLimiter(initial=2, clock=FakeClock())
+
+    limiter.observe(500, 0.1)
+    limiter.observe(200, 0.1)
+
+    stats = limiter.stats()
+    assert (stats.requests, stats.errors, stats.concurrency) == (2, 1, 2)
+
+
+def test_slots_are_limited_by_concurrency():
+    limiter = AdaptiveLimiter(initial=2, maximum=2)
+    lock = threading.Lock()
+    running = []
+    concurrency = []
+    release = threading.Event()
+
+    def work():
+        with limiter.slot():
+            with lock:
+                running.append(1)
+                concurrency.append(len(running))
+            release.wait(1)
+            with lock:
+                running.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert max(concurrency) == 2
+
+
+def test_backs_off_from_throttling_workspace(fake_workspace):
+    for i in range(30):
+        fake_workspace.add_notebook(f"/Users/me/nb_{i}", "x = 1\n")
+    fake_workspace.throttle(max_concurrency=2, retry_after=0, latency=0.02)
+    w = fake_workspace.client()
+    limiter = AdaptiveLimiter(initial=8, maximum=8)
+    limiter.observe_client(w)
+
+    def download(info: ObjectInfo) -> str:
+        with limiter.slot(), w.workspace.download(info.path, format=ExportFormat.SOURCE) as f:
+            return f.read().decode()
+
+    objects = [ObjectInfo(path=f"/Users/me/nb_{i}") for i in range(30)]
+    reports = list(Pipeline(download, Report, download_workers=8, queue_size=8).run(objects))
+
+    stats = limiter.stats()
+    assert len(reports) == 30
+    assert fake_workspace.throttled > 0
+    assert stats.throttled == fake_workspace.throttled
+    assert stats.concurrency < 8
+    assert stats.requests == 30
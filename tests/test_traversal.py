@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Dict, List
+
+from databricks.sdk.errors import PermissionDenied
+from databricks.sdk.service.workspace import ObjectInfo, ObjectType
+
+from databricks.labs.pylint.traversal import Walker
+
+
+def fake_tree(depth: int, fan_out: int, notebooks: int) -> Dict[str, List[ObjectInfo]]:
+    tree = {}
+
+    def build(path: str, level: int):
+        children = [ObjectInfo(path=f"{path}/nb_{i}", object_type=ObjectType.NOTEBOOK) for i in range(notebooks)]
+        if level < depth:
+            for i in range(fan_out):
+                child = f"{path}/dir_{i}"
+                children.append(ObjectInfo(path=child, object_type=ObjectType.DIRECTORY))
+                build(child, level + 1)
+        tree[path] = children
+
+    build("/Users", 0)
+    return tree
+
+
+def test_walks_all_levels():
+    tree = fake_tree(depth=3, fan_out=3, notebooks=2)
+
+    found = [item.path for item in Walker(tree.__getitem__, workers=4).walk("/Users")]
+
+    expected = [item.path for items in tree.values() for item in items if item.object_type != ObjectType.DIRECTORY]
+    assert sorted(found) == sorted(expected)
+    assert len(found) == 2 * (1 + 3 + 9 + 27)
+
+
+def test_lists_directories_concurrently():
+    tree = fake_tree(depth=2, fan_out=8, notebooks=1)
+    lock = threading.Lock()
+    running = []
+    concurrency = []
+
+    def list_dir(path: str):
+        with lock:
+            running.append(path)
+            concurrency.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(path)
+        return tree[path]
+
+    assert len(list(Walker(list_dir, workers=8).walk("/Users"))) == 1 + 8 + 64
+    assert max(concurrency) > 1
+
+
+def test_streams_objects_before_tree_is_listed():
+    tree = fake_tree(depth=2, fan_out=4, notebooks=1)
+    listed = []
+
+    def list_dir(path: str):
+        listed.append(path)
+        return tree[path]
+
+    first = next(iter(Walker(list_dir, workers=1).walk("/Users")))
+
+    assert first.path == "/Users/nb_0"
+    assert len(listed) < len(tree)
+
+
+def test_failed_listing_does_not_stop_the_walk():
+    tree = fake_tree(depth=1, fan_out=2, notebooks=1)
+
+    def list_dir(path: str):
+        if path == "/Users/dir_0":
+            raise PermissionDenied("no access")
+        return tree[path]
+
+    found = sorted(item.path for item in Walker(list_dir, workers=2).walk("/Users"))
+
+    assert found == ["/Users/dir_1/nb_0", "/Users/nb_0"]
+
+
+def test_walks_into_repos(fake_workspace):
+    fake_workspace.add_directory("/Repos/me")
+    fake_workspace.add_repo("/Repos/me/project")
+    fake_workspace.add_file("/Repos/me/project/src/utils.py", "def foo():\n    pass\n")
+    fake_workspace.add_notebook("/Repos/me/project/notebooks/etl", "x = 1\n")
+    w = fake_workspace.client()
+
+    found = {item.path: item.object_type for item in Walker(w.workspace.list).walk("/Repos")}
+
+    assert found == {
+        "/Repos/me/project/src/utils.py": ObjectType.FILE,
+        "/Repos/me/project/notebooks/etl": ObjectType.NOTEBOOK,
+    }
+
+
+def test_lists_at_most_workers_directories_ahead_of_the_caller():
+    tree = fake_tree(depth=3, fan_out=10, notebooks=1)
+    listed = []
+
+    def list_dir(path: str):
+        listed.append(path)
+        return tree[path]
+
+    walk = Walker(list_dir, workers=2).walk("/Users")
+    next(walk)
+    time.sleep(0.1)
+
+    assert len(listed) == 1 + 2
+    walk.close()
+
+
+def test_close_does_not_wait_for_pending_listings():
+    tree = fake_tree(depth=2, fan_out=4, notebooks=1)
+    release = threading.Event()
+    listed = []
+
+    def list_dir(path: str):
+        listed.append(path)
+        if path != "/Users":
+            release.wait()
+        return tree[path]
+
+    walk = Walker(list_dir, workers=2).walk("/Users")
+    next(walk)
+    started = time.monotonic()
+    walk.close()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 1
+    assert len(listed) <= 1 + 2
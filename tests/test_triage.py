@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from databricks.labs.pylint.catalog import CHECKERS
+from databricks.labs.pylint.triage import Triage, trigger_words
+
+SYMBOLS = ",".join(msg[1] for spec in CHECKERS for msg in spec["msgs"].values())
+
+TRICKY = {
+    "escaped_token.py": 'TOKEN = "\\x64api' + "0" * 32 + '"\n',
+    "concatenated_token.py": 'TOKEN = (\n    "da"  # split\n    "pi' + "0" * 32 + '"\n)\n',
+    "concatenated_triple_quotes.py": 'PATH = """db""" f"fs:/tmp"\nOTHER = "db""""fs:/x"""\n',
+    "spaced_chain.py": "def f(spark):\n    spark . catalog .listTables()\n",
+    "normalized_identifier.py": "ｓpark.range(1)\n",
+    "encoding.py": "# -*- coding: utf-8 -*-\nimport databricks_cli\n",
+    "banner_comment.py": 'TITLE = "dbfs"  # ' + "#" * 60 + "\n",
+    "empty.py": "",
+    "plain.py": '"""Nothing to see here."""\n\n\ndef add(a, b):\n    return a + b\n',
+}
+
+
+@pytest.fixture(autouse=True)
+def outside_of_project(tmp_path, monkeypatch):
+    # otherwise pylint picks up the configuration of this project
+    monkeypatch.chdir(tmp_path)
+
+
+def lint(triage: bool, *paths: Path):
+    reporter = CollectingReporter()
+    run = Run(
+        ["--load-plugins=databricks.labs.pylint.all", "--disable=all", f"--enable={SYMBOLS}", "--persistent=n"]
+        + [f"--triage={'y' if triage else 'n'}", *[str(p) for p in paths]],
+        reporter=reporter,
+        exit=False,
+    )
+    messages = sorted((m.path, m.line, m.column, m.symbol, m.msg) for m in reporter.messages)
+    return messages, next(c for c in run.linter.get_checkers() if isinstance(c, Triage))
+
+
+def test_triage_never_skips_files_with_messages(tmp_path):
+    for name, source in TRICKY.items():
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    project = Path(__file__).parent.parent
+    paths = [tmp_path, project / "tests" / "samples", project / "src", project / "tests"]
+
+    with_triage, triage = lint(True, *paths)
+    without_triage, _ = lint(False, *paths)
+
+    assert with_triage == without_triage
+    assert sum(triage.skipped.values()) > 0
+    symbols = {(Path(path).name, symbol) for path, _, _, symbol, _ in with_triage}
+    assert ("escaped_token.py", "pat-token-leaked") in symbols
+    assert ("concatenated_token.py", "pat-token-leaked") in symbols
+    assert ("concatenated_triple_quotes.py", "incompatible-with-uc") in symbols
+    assert ("spaced_chain.py", "incompatible-with-uc") in symbols
+    assert ("normalized_identifier.py", "spark-outside-function") in symbols
+    assert ("encoding.py", "legacy-cli") in symbols
+
+
+def test_files_without_triggers_skip_all_checkers(tmp_path):
+    plain = tmp_path / "plain.py"
+    plain.write_text(TRICKY["plain.py"])
+
+    messages, triage = lint(True, plain)
+
+    assert not messages
+    assert triage.files == 1
+    assert set(triage.skipped) == {spec["name"] for spec in CHECKERS}
+
+
+def test_notebook_header_triggers_only_at_the_start(tmp_path):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text("# Databricks notebook source\nx = 1\n")
+    not_notebook = tmp_path / "not_notebook.py"
+    not_notebook.write_text("x = 1\n# Databricks notebook source\n")
+
+    _, triage = lint(True, notebook, not_notebook)
+
+    assert triage.skipped["databricks-notebooks"] == 1
+    assert triage.skipped["eradicate"] == 0
+
+
+def test_trigger_words_of_attribute_chains():
+    assert trigger_words(["_jvm", "spark._jvm", "spark.catalog.", ".apiToken"]) == {"_jvm", "catalog", "apiToken"}
+
+
+def test_trigger_words_are_ascii():
+    assert trigger_words(["café", "spark.café."]) == {"caf"}